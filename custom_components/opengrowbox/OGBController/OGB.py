@@ -18,6 +18,13 @@ from .RegistryListener import OGBRegistryEvenListener
 
 _LOGGER = logging.getLogger(__name__)
 
+# Plant stage VPD ranges (kPa) for the coarse germ/veg/gen stages
+_STAGE_VPD_RANGES = {
+    "germ": (0.8, 1.0),
+    "veg": (1.0, 1.2),
+    "gen": (1.2, 1.4),  # generative/flowering
+}
+
 
 class OpenGrowBox:
     """
@@ -333,15 +340,8 @@ class OpenGrowBox:
         from .utils.calcs import calculate_perfect_vpd
         from .utils.sensorUpdater import _update_specific_sensor
 
-        # Plant stage VPD ranges (kPa)
-        stage_ranges = {
-            "germ": [0.8, 1.0],
-            "veg": [1.0, 1.2],
-            "gen": [1.2, 1.4],  # generative/flowering
-        }
-
         # Get range for current stage
-        vpd_range = stage_ranges.get(plantStage.lower(), [1.0, 1.2])  # Default to veg
+        vpd_range = _STAGE_VPD_RANGES.get(plantStage.lower(), _STAGE_VPD_RANGES["veg"])  # Default to veg
 
         # Calculate perfect VPD values
         perfections = calculate_perfect_vpd(vpd_range, tolerance)
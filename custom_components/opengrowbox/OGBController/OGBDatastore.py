@@ -1,8 +1,24 @@
 import dataclasses
 import logging
+from functools import lru_cache
+from types import MappingProxyType
 
 _LOGGER = logging.getLogger(__name__)
 
+_MISSING = object()
+
+# Serialisierte Form der eingefrorenen OGBData-Tabellen (MappingProxyType).
+# Die Tabellen sind bis in die Blätter unveränderlich und leben so lange wie das
+# Modul, also reicht es, sie einmal pro Prozess zu konvertieren.
+# id -> (proxy, result); die Referenz auf den Proxy hält die id gültig.
+_FROZEN_SERIALIZED = {}
+
+
+@lru_cache(maxsize=1024)
+def _split_path(path):
+    """Zerlegt einen getDeep/setDeep-Pfad einmalig - die Pfade sind fast immer Literale."""
+    return tuple(path.split("."))
+
 
 class SimpleEventEmitter:
     def __init__(self):
@@ -111,47 +127,117 @@ class DataStore(SimpleEventEmitter):
             setattr(self.state, key, value)
             self.emit(key, value)
 
+    def bulk_set(self, mapping):
+        """Setzt mehrere Top-Level-Keys auf einmal (z.B. beim Laden des States).
+
+        Inhaltsgleiche Werte bleiben unangetastet, damit geteilte read-only Tabellen aus OGBConf
+        nicht durch gleichwertige Kopien ersetzt werden. Statt eines Events pro Key wird
+        einmal "stateLoaded" mit der Liste der geänderten Keys ausgelöst.
+        """
+        state = self.state
+        changed = []
+        for key, value in mapping.items():
+            current = getattr(state, key, None)
+            merged = self._reuse_equal(current, value)
+            if merged is not current:
+                setattr(state, key, merged)
+                changed.append(key)
+        if changed:
+            self.emit("stateLoaded", changed)
+
+    def _reuse_equal(self, current, loaded):
+        """Geladenen Wert übernehmen, inhaltsgleiche Teile aber aus current behalten.
+
+        Gespeichert wird die serialisierte Form (Tuples als Listen, read-only Tabellen als dict),
+        daher wird auch gegen _make_serializable(current) verglichen. Gibt current zurück,
+        wenn sich nichts geändert hat.
+        """
+        if current is None:
+            return loaded
+        if current == loaded or self._make_serializable(current) == loaded:
+            return current
+        if isinstance(current, (dict, MappingProxyType)) and isinstance(loaded, dict):
+            # Nur die geänderten Teilbäume ersetzen - z.B. Light bleibt neu, Light.plans geteilt
+            return {key: self._reuse_equal(current.get(key), value) for key, value in loaded.items()}
+        return loaded
+
     def getDeep(self, path, default=None):
         """Ruft verschachtelte Daten anhand eines Pfads ab (für Attribute oder Schlüssel in Dictionaries)."""
-        keys = path.split(".")
         data = self.state
-        for key in keys:
-            if isinstance(data, dict):  # Falls `data` ein Dictionary ist
+        for key in _split_path(path):
+            if isinstance(data, (dict, MappingProxyType)):  # Dictionary oder read-only Tabelle aus OGBConf
                 data = data.get(key, None)
-            elif hasattr(data, key):  # Falls `data` ein Objekt ist
-                data = getattr(data, key)
             else:
-                return default  # Schlüssel oder Attribut existiert nicht
+                # Falls `data` ein Objekt ist - ein getattr statt hasattr + getattr
+                data = getattr(data, key, _MISSING)
+                if data is _MISSING:
+                    return default  # Schlüssel oder Attribut existiert nicht
         return data if data is not None else default
 
     def setDeep(self, path, value):
         """Setzt einen Wert in verschachtelten Daten und löst Events aus."""
-        keys = path.split(".")
+        if self._assignDeep(path, value):
+            self.emit(path, value)
+
+    def setDeepBatch(self, mapping):
+        """Setzt mehrere verschachtelte Pfade auf einmal und löst nur ein "deepBatch" Event aus."""
+        changed = [path for path, value in mapping.items() if self._assignDeep(path, value)]
+        if changed:
+            self.emit("deepBatch", changed)
+
+    def _assignDeep(self, path, value):
+        """Schreibt einen verschachtelten Wert ohne Event; True wenn ein Event fällig ist."""
+        keys = _split_path(path)
         data = self.state
         for key in keys[:-1]:
             if isinstance(data, dict):
-                if key not in data:
-                    data[key] = (
-                        {}
-                    )  # Initialisiere verschachteltes Dictionary, falls es nicht existiert
-                data = data[key]
-            elif hasattr(data, key):
-                data = getattr(data, key)
+                child = data.get(key, _MISSING)
+                if child is _MISSING:
+                    # Initialisiere verschachteltes Dictionary, falls es nicht existiert
+                    child = data[key] = {}
+                data = child
             else:
-                raise AttributeError(
-                    f"Cannot access '{key}' on '{type(data).__name__}'"
-                )
+                child = getattr(data, key, _MISSING)
+                if child is _MISSING:
+                    raise AttributeError(
+                        f"Cannot access '{key}' on '{type(data).__name__}'"
+                    )
+                data = child
 
         last_key = keys[-1]
         if isinstance(data, dict):
             data[last_key] = value
-            self.emit(path, value)
-        elif hasattr(data, last_key):
-            if getattr(data, last_key) != value:
-                setattr(data, last_key, value)
-                self.emit(path, value)
-        else:
+            return True
+        current = getattr(data, last_key, _MISSING)
+        if current is _MISSING:
             raise AttributeError(f"Cannot set '{last_key}' on '{type(data).__name__}'")
+        if current != value:
+            setattr(data, last_key, value)
+            return True
+        return False
+
+    def appendDeep(self, path, item):
+        """Hängt ein Element in-place an eine Liste an (ohne Vergleich/Neu-Setzen der ganzen Liste)."""
+        items = self.getDeep(path)
+        if items is None:
+            # Ohne Event anlegen - Listener sehen nur die gefüllte Liste
+            items = []
+            self._assignDeep(path, items)
+        items.append(item)
+        self.emit(path, items)
+        return items
+
+    def removeDeep(self, path, item):
+        """Entfernt ein Element in-place aus einer Liste. Gibt False zurück, wenn es nicht enthalten war."""
+        items = self.getDeep(path)
+        if not items:
+            return False
+        try:
+            items.remove(item)
+        except ValueError:
+            return False
+        self.emit(path, items)
+        return True
 
     def _should_exclude_key(self, key: str) -> bool:
         """Check if a key should be excluded from serialization."""
@@ -238,6 +324,17 @@ class DataStore(SimpleEventEmitter):
             except:
                 visited.discard(obj_id)
                 return [str(item) for item in obj]
+        elif isinstance(obj, MappingProxyType):
+            cached = _FROZEN_SERIALIZED.get(obj_id)
+            if cached is not None and cached[0] is obj:
+                return cached[1]
+            result = {
+                key: self._make_serializable(value, visited)
+                for key, value in obj.items()
+                if not self._should_exclude_key(key)
+            }
+            _FROZEN_SERIALIZED[obj_id] = (obj, result)
+            return result
         elif isinstance(obj, dict):
             visited.add(obj_id)
             try:
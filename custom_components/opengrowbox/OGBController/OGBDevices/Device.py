@@ -3,6 +3,15 @@ import asyncio
 
 _LOGGER = logging.getLogger(__name__)
 
+# Wörter, die float() als Zahl akzeptiert - alle anderen Zustände mit Buchstaben am Anfang bleiben Strings
+_FLOAT_WORDS = frozenset({"nan", "inf", "infinity"})
+# Anfangszeichen, bei denen der Zustand praktisch immer eine Zahl ist
+_NUMERIC_START = frozenset("0123456789+-. ")
+
+# Special light types that should NOT respond to WorkMode automatic activation
+# These lights have their own dedicated scheduling logic
+SPECIAL_LIGHT_TYPES = frozenset({"LightFarRed", "LightUV", "LightBlue", "LightRed", "LightSpectrum"})
+
 class Device:
     # Optional class attributes - may be set by subclasses
     PlantStageMinMax = None  # type: ignore - Set by Light.py subclass
@@ -36,10 +45,18 @@ class Device:
         self.dutyCycle = None  # Don't set default, let subclass/setMinMax determine it
         self.minVoltage = None
         self.maxVoltage = None
+        self._minDuty = None
+        self._maxDuty = None
+        self._steps = None
         self.minDuty = None
         self.maxDuty = None
         self.is_minmax_active = False  # Track if MinMax control is active for this device
         self.voltageFromNumber = False
+        self.sunPhaseActive = False  # Only driven by Light sun phases
+        self.pendingWorkMode = None
+        self._in_active_control = False
+        self._last_turn_on_time = 0
+        self._plant_stage = self.dataStore.get("plantStage") or "LateFlower"
         
         # EVENTS
         self.eventManager.on("DeviceStateUpdate", self.deviceUpdate)        
@@ -47,10 +64,61 @@ class Device:
         self.eventManager.on("SetMinMax", self.userSetMinMax)
         self.eventManager.on("MinMaxControlDisabled", self.on_minmax_control_disabled)
         self.eventManager.on("MinMaxControlEnabled", self.on_minmax_control_enabled)
+        self.eventManager.on("PlantStageChange", self._on_plant_stage)
 
     
         self.deviceInit(deviceData)
 
+    @property
+    def minDuty(self):
+        return self._minDuty
+
+    @minDuty.setter
+    def minDuty(self, value):
+        self._minDuty = value
+        self._min_duty_i = self._to_duty_int(value)
+        self._refresh_midpoint()
+
+    @property
+    def maxDuty(self):
+        return self._maxDuty
+
+    @maxDuty.setter
+    def maxDuty(self, value):
+        self._maxDuty = value
+        self._max_duty_i = self._to_duty_int(value)
+        self._refresh_midpoint()
+
+    @property
+    def steps(self):
+        return self._steps
+
+    @steps.setter
+    def steps(self, value):
+        self._steps = value
+        self._refresh_midpoint()
+
+    def _refresh_midpoint(self):
+        """Berechnet die an steps ausgerichtete Mitte von minDuty/maxDuty vor (steps <= 0 wird als 1 behandelt)."""
+        if self._minDuty is None or self._maxDuty is None:
+            self._midpoint_cached = None
+            return
+        step = max(int(self._steps or 1), 1)
+        try:
+            self._midpoint_cached = self._minDuty + ((self._maxDuty - self._minDuty) // 2 // step) * step
+        except TypeError:
+            self._midpoint_cached = None
+
+    @staticmethod
+    def _to_duty_int(value):
+        """Einmalige int-Konvertierung der Duty-Grenzen (None bleibt None)."""
+        if value is None:
+            return None
+        try:
+            return int(float(value))
+        except (ValueError, TypeError):
+            return None
+
     @property
     def option_count(self) -> int:
         """Gibt die Anzahl aller Optionen zurück."""
@@ -327,9 +395,7 @@ class Device:
                 if entity.get("entity_id") == entity_id:
                     old_value = entity.get("value")
                     entity["value"] = new_value
-                    _LOGGER.debug(
-                        f"{self.deviceName} Updated {entity_id}: {old_value} → {new_value}"
-                    )
+                    _LOGGER.debug("%s Updated %s: %s → %s", self.deviceName, entity_id, old_value, new_value)
                     return True
             return False
 
@@ -339,23 +405,23 @@ class Device:
         if "sensor." in entity_id:
             updated = await update_entity_value(self.sensors, entity_id, new_value)
             if updated:
-                _LOGGER.debug(f"{self.deviceName} Sensor updated: {entity_id}")
+                _LOGGER.debug("%s Sensor updated: %s", self.deviceName, entity_id)
         
         elif any(prefix in entity_id for prefix in ["fan.", "light.", "switch.", "humidifier."]):
             updated = await update_entity_value(self.switches, entity_id, new_value)
             if updated:
                 self.identifyIfRunningState()
-                _LOGGER.debug(f"{self.deviceName} Switch updated: {entity_id}")
+                _LOGGER.debug("%s Switch updated: %s", self.deviceName, entity_id)
         
         elif any(prefix in entity_id for prefix in ["number.", "text.", "time.", "select.", "date."]):
             updated = await update_entity_value(self.options, entity_id, new_value)
             if updated:
-                _LOGGER.debug(f"{self.deviceName} Option updated: {entity_id}")
+                _LOGGER.debug("%s Option updated: %s", self.deviceName, entity_id)
         
         elif "ogb_" in entity_id:
             updated = await update_entity_value(self.sensors, entity_id, new_value)
             if updated:
-                _LOGGER.debug(f"{self.deviceName} OGB sensor updated: {entity_id}")
+                _LOGGER.debug("%s OGB sensor updated: %s", self.deviceName, entity_id)
             
     def checkMinMax(self,data):
         minMaxSets = self.dataStore.getDeep(f"DeviceMinMax.{self.deviceType}")
@@ -385,14 +451,14 @@ class Device:
 
         # Clamp voltage to min/max range
         if "minVoltage" in minMaxSets and "maxVoltage" in minMaxSets:
-            if hasattr(self, 'voltage') and self.voltage is not None:
+            if self.voltage is not None:
                 old_voltage = self.voltage
                 self.voltage = self.clamp_voltage(self.voltage)
                 _LOGGER.info(f"{self.deviceName}: Voltage clamped from {old_voltage}% to {self.voltage}%")
 
         # Clamp dutyCycle to min/max range
         if "minDuty" in minMaxSets and "maxDuty" in minMaxSets:
-            if hasattr(self, 'dutyCycle') and self.dutyCycle is not None:
+            if self.dutyCycle is not None:
                 old_duty = self.dutyCycle
                 self.dutyCycle = max(self.minDuty, min(self.maxDuty, self.dutyCycle))
                 _LOGGER.info(
@@ -608,7 +674,7 @@ class Device:
     def checkForControlValue(self):
         """Findet und aktualisiert den Duty Cycle oder den Voltage-Wert basierend to Gerätetyp und Daten."""
         # Skip if we're actively controlling the device (e.g., turn_on just ran)
-        if getattr(self, '_in_active_control', False):
+        if self._in_active_control:
             _LOGGER.debug(f"{self.deviceName}: Skipping checkForControlValue - device is under active control")
             return
         
@@ -661,7 +727,7 @@ class Device:
                     self.voltage = converted_value
                     _LOGGER.debug(f"{self.deviceName}: Voltage from Sensor updated to {self.voltage}%.")
                     # Always clamp voltage if minVoltage or maxVoltage are set
-                    if hasattr(self, 'minVoltage') and hasattr(self, 'maxVoltage') and self.minVoltage is not None and self.maxVoltage is not None:
+                    if self.minVoltage is not None and self.maxVoltage is not None:
                         if self.minVoltage > 0 or self.maxVoltage < 100:
                             old_voltage = self.voltage
                             self.voltage = self.clamp_voltage(self.voltage)
@@ -670,7 +736,7 @@ class Device:
                     self.dutyCycle = converted_value
                     _LOGGER.debug(f"{self.deviceName}: Duty Cycle from Sensor updated to {self.dutyCycle}%.")
                     # Always clamp dutyCycle if minDuty and maxDuty are set
-                    if hasattr(self, 'minDuty') and hasattr(self, 'maxDuty') and self.minDuty is not None and self.maxDuty is not None:
+                    if self.minDuty is not None and self.maxDuty is not None:
                         if self.minDuty > 0 or self.maxDuty < 100:
                             old_duty = self.dutyCycle
                             self.dutyCycle = max(self.minDuty, min(self.maxDuty, self.dutyCycle))
@@ -693,7 +759,7 @@ class Device:
                     if converted_value is not None:
                         self.voltage = converted_value
                         _LOGGER.debug(f"{self.deviceName}: Voltage set from Options to {self.voltage}%.")
-                        if self.is_minmax_active and hasattr(self, 'minVoltage') and hasattr(self, 'maxVoltage') and self.minVoltage is not None and self.maxVoltage is not None:
+                        if self.is_minmax_active and self.minVoltage is not None and self.maxVoltage is not None:
                             self.voltage = self.clamp_voltage(self.voltage)
                             _LOGGER.debug(f"{self.deviceName}: Voltage clamped to {self.voltage}%.")
                         return
@@ -704,7 +770,7 @@ class Device:
                     if converted_value is not None:
                         self.dutyCycle = converted_value
                         _LOGGER.debug(f"{self.deviceName}: Duty Cycle set from Options to {self.dutyCycle}%.")
-                        if self.is_minmax_active and hasattr(self, 'minDuty') and hasattr(self, 'maxDuty') and self.minDuty is not None and self.maxDuty is not None:
+                        if self.is_minmax_active and self.minDuty is not None and self.maxDuty is not None:
                             self.dutyCycle = max(self.minDuty, min(self.maxDuty, self.dutyCycle))
                             _LOGGER.debug(f"{self.deviceName}: Duty Cycle clamped to {self.dutyCycle}%.")
                         return
@@ -748,7 +814,7 @@ class Device:
             # Rate limiting for all devices to prevent rapid successive calls
             # Prevents device timeout and improves system stability
             now = time.time()
-            last_call = getattr(self, '_last_turn_on_time', 0)
+            last_call = self._last_turn_on_time
             
             # 3 second cooldown for all turn_on calls
             if now - last_call < 3.0:
@@ -772,14 +838,14 @@ class Device:
                     brightness_pct = max(0, min(100, brightness_pct))
                 except (ValueError, TypeError):
                     _LOGGER.error(f"{self.deviceName}: Invalid brightness_pct value: {brightness_pct}, using device voltage")
-                    brightness_pct = getattr(self, 'voltage', 100)
+                    brightness_pct = self.voltage if self.voltage is not None else 100
             else:
                 # Default: For lights, use current voltage instead of 100%
-                if self.deviceType in ["Light", "LightFarRed", "LightUV", "LightBlue", "LightRed"] and hasattr(self, 'voltage') and self.voltage is not None:
+                if self.deviceType in ["Light", "LightFarRed", "LightUV", "LightBlue", "LightRed"] and self.voltage is not None:
                     brightness_pct = self.voltage
                     _LOGGER.debug(f"{self.deviceName}: Using current voltage {brightness_pct}% for turn_on")
                 # For special exhausts (light type entities), use current dutyCycle
-                elif self.isSpecialDevice and hasattr(self, 'dutyCycle') and self.dutyCycle is not None:
+                elif self.isSpecialDevice and self.dutyCycle is not None:
                     brightness_pct = self.dutyCycle
                     _LOGGER.debug(f"{self.deviceName}: Using current dutyCycle {brightness_pct}% for turn_on")
                 else:
@@ -792,10 +858,10 @@ class Device:
                     percentage = float(percentage)
                 except (ValueError, TypeError):
                     _LOGGER.error(f"{self.deviceName}: Invalid percentage value: {percentage}, using device dutyCycle")
-                    percentage = getattr(self, 'dutyCycle', 50)
+                    percentage = self.dutyCycle if self.dutyCycle is not None else 50
             else:
                 # Default: For exhaust/intake/ventilation, use current dutyCycle instead of 100%
-                if self.deviceType in {"Exhaust", "Intake", "Ventilation"} and hasattr(self, 'dutyCycle') and self.dutyCycle is not None:
+                if self.deviceType in {"Exhaust", "Intake", "Ventilation"} and self.dutyCycle is not None:
                     percentage = self.dutyCycle
                     _LOGGER.debug(f"{self.deviceName}: Using current dutyCycle {percentage}% for turn_on")
                 else:
@@ -1131,7 +1197,7 @@ class Device:
                         ]
 
                 for entity_id in entity_ids:
-                    _LOGGER.debug(f"{self.deviceName} OFF ACTION with ID {entity_id}")
+                    _LOGGER.debug("%s OFF ACTION with ID %s", self.deviceName, entity_id)
                     await self.hass.services.async_call(
                         domain="select",
                         service="select_option",
@@ -1152,18 +1218,18 @@ class Device:
                             },
                         )
                         self.isRunning = False
-                    _LOGGER.debug(f"{self.deviceName}: AcInfinity über select OFF.")
+                    _LOGGER.debug("%s: AcInfinity über select OFF.", self.deviceName)
                 return
 
             # === Standardgeräte ===
             if not self.switches:
-                _LOGGER.debug(f"{self.deviceName} has NO Switches to Turn OFF")
+                _LOGGER.debug("%s has NO Switches to Turn OFF", self.deviceName)
                 return
 
             entity_ids = [switch["entity_id"] for switch in self.switches]
 
             for entity_id in entity_ids:
-                _LOGGER.debug(f"{self.deviceName}: Service-Call for Entity: {entity_id}")
+                _LOGGER.debug("%s: Service-Call for Entity: %s", self.deviceName, entity_id)
 
                 # Climate ausschalten
                 if self.deviceType == "Climate":
@@ -1176,7 +1242,7 @@ class Device:
                         },
                     )
                     self.isRunning = False
-                    _LOGGER.debug(f"{self.deviceName}: HVAC-Mode OFF.")
+                    _LOGGER.debug("%s: HVAC-Mode OFF.", self.deviceName)
                     return
 
                 # Humidifier ausschalten
@@ -1187,7 +1253,7 @@ class Device:
                         service_data={"entity_id": entity_id},
                     )
                     self.isRunning = False
-                    _LOGGER.debug(f"{self.deviceName}: Humidifier OFF.")
+                    _LOGGER.debug("%s: Humidifier OFF.", self.deviceName)
                     return
 
                 # Light ausschalten
@@ -1202,7 +1268,7 @@ class Device:
                         self.isRunning = False
                         # Reset voltage to 0 for dimmable lights
                         self.voltage = 0
-                        _LOGGER.debug(f"{self.deviceName}: Light OFF (dimmable).")
+                        _LOGGER.debug("%s: Light OFF (dimmable).", self.deviceName)
                         return
                     else:
                         await self.hass.services.async_call(
@@ -1211,7 +1277,7 @@ class Device:
                             service_data={"entity_id": entity_id},
                         )
                         self.isRunning = False
-                        _LOGGER.debug(f"{self.deviceName}: Light OFF (Default-Switch).")
+                        _LOGGER.debug("%s: Light OFF (Default-Switch).", self.deviceName)
                         return
 
                 # Exhaust ausschalten
@@ -1225,7 +1291,7 @@ class Device:
                             service_data={"entity_id": entity_id},
                         )
                         self.isRunning = False
-                        _LOGGER.debug(f"{self.deviceName}: Exhaust OFF.")
+                        _LOGGER.debug("%s: Exhaust OFF.", self.deviceName)
                         return
 
                 # Intake ausschalten
@@ -1239,7 +1305,7 @@ class Device:
                             service_data={"entity_id": entity_id},
                         )
                         self.isRunning = False
-                        _LOGGER.debug(f"{self.deviceName}: Intake OFF.")
+                        _LOGGER.debug("%s: Intake OFF.", self.deviceName)
                         return
 
                 # Ventilation ausschalten
@@ -1265,7 +1331,7 @@ class Device:
 
                     # Set state and log once after ALL ventilation entities are processed
                     self.isRunning = False
-                    _LOGGER.debug(f"{self.deviceName}: Ventilation OFF - {len(self.switches)} entities deactivated.")
+                    _LOGGER.debug("%s: Ventilation OFF - %s entities deactivated.", self.deviceName, len(self.switches))
                         
                 # CO2 ausschalten
                 elif self.deviceType == "CO2":
@@ -1289,7 +1355,7 @@ class Device:
                         service_data={"entity_id": entity_id},
                     )
                     self.isRunning = False
-                    _LOGGER.debug(f"{self.deviceName}: Default-Switch OFF.")
+                    _LOGGER.debug("%s: Default-Switch OFF.", self.deviceName)
                     return
 
         except Exception as e:
@@ -1299,7 +1365,7 @@ class Device:
     async def set_value(self, value):
         """Setzt einen numerischen Wert, falls unterstützt und relevant (duty oder voltage)."""
         if not self.options:
-            _LOGGER.debug(f"{self.deviceName} unterstützt keine numerischen Werte.")
+            _LOGGER.debug("%s unterstützt keine numerischen Werte.", self.deviceName)
             return
 
         # Suche erste passende Option mit 'duty' oder 'voltage' in der entity_id
@@ -1308,12 +1374,13 @@ class Device:
             if "duty" in entity_id or "intensity" in entity_id:
                 try:
                     if self.isAcInfinDev:
+                        v = float(int(value))
                         await self.hass.services.async_call(
                             domain="number",
                             service="set_value",
-                            service_data={"entity_id": entity_id, "value": float(int(value))},
+                            service_data={"entity_id": entity_id, "value": v},
                         )
-                        _LOGGER.warning(f"Wert für {self.deviceName} wurde für {entity_id} to {float(int(value))} set.")
+                        _LOGGER.warning(f"Wert für {self.deviceName} wurde für {entity_id} to {v} set.")
                         return                       
                     else:
                         await self.hass.services.async_call(
@@ -1321,7 +1388,7 @@ class Device:
                             service="set_value",
                             service_data={"entity_id": entity_id, "value": value},
                         )
-                        _LOGGER.debug(f"Wert für {self.deviceName} wurde für {entity_id} to {value} set.")
+                        _LOGGER.debug("Wert für %s wurde für %s to %s set.", self.deviceName, entity_id, value)
                         return
                 except Exception as e:
                     _LOGGER.error(f"Fehler beim Setzen des Wertes für {self.deviceName}: {e}")
@@ -1329,6 +1396,12 @@ class Device:
 
         _LOGGER.warning(f"{self.deviceName} hat keine passende Option mit 'duty' oder 'voltage' in der entity_id.")
 
+    def _schedule_call(self, coro):
+        """Startet einen Service-Call ohne darauf zu warten (fire-and-forget)."""
+        if self.hass is not None:
+            return self.hass.async_create_task(coro)
+        return asyncio.create_task(coro)
+
     async def set_mode(self, mode):
         """Setzt den Mode des Geräts, falls unterstützt."""
         if not self.options:
@@ -1346,85 +1419,74 @@ class Device:
 
     # Modes for all Devices
     async def WorkMode(self, workmode):
-        # Special light types that should NOT respond to WorkMode automatic activation
-        # These lights have their own dedicated scheduling logic
-        special_light_types = {
-            "LightFarRed", "LightUV", "LightBlue", "LightRed", "LightSpectrum"
-        }
-
         # For lights, don't activate workmode if light is off
         if hasattr(self, 'islightON') and not self.islightON:
             # Special lights should not save pending workmode - they control themselves
-            if self.deviceType in special_light_types:
+            if self.deviceType in SPECIAL_LIGHT_TYPES:
                 _LOGGER.debug(f"{self.deviceName}: ({self.deviceType}) ignoring WorkMode, using dedicated scheduling")
                 return
             self.pendingWorkMode = workmode
             _LOGGER.info(f"{self.deviceName}: WorkMode {workmode} saved, will activate when light turns on")
             return
         self.inWorkMode = workmode
-        if self.inWorkMode:
-            if self.isDimmable:
-                if self.deviceType == "Light":
-                    if hasattr(self, 'sunPhaseActive') and self.sunPhaseActive:
-                        await self.eventManager.emit("pauseSunPhase", False)
-                        return
-                    # Use minVoltage if min/max is active, otherwise initVoltage
-                    if hasattr(self, 'minVoltage') and hasattr(self, 'maxVoltage') and self.minVoltage is not None and self.maxVoltage is not None:
-                        self.voltage = self.minVoltage
-                    else:
-                        self.voltage = self.initVoltage
-                    await self.turn_on(brightness_pct=self.voltage)
-                # Special lights should not respond to WorkMode - they use their own scheduling
-                elif self.deviceType in special_light_types:
-                    _LOGGER.debug(f"{self.deviceName}: ({self.deviceType}) ignoring WorkMode, using dedicated scheduling")
-                    return
-                else:
-                    self.dutyCycle = self.minDuty
-                    if self.isSpecialDevice:
-                        await self.turn_on(brightness_pct=int(float(self.minDuty)))
-                    await self.turn_on(percentage=int(float(self.minDuty)))
-            else:
-                if self.deviceType == "Light":
-                    return
-                if self.deviceType == "Pump":
-                    return
-                if self.deviceType == "Sensor":
-                    return    
-                else:
-                    await self.turn_off()
+
+        # Dispatch über (deviceType, isDimmable) - None als Typ ist der generische Fallback
+        table = _WORKMODE_ON if workmode else _WORKMODE_OFF
+        handler = table.get((self.deviceType, self.isDimmable)) or table[(None, self.isDimmable)]
+        await handler(self)
+
+    async def _workmode_noop(self):
+        """Gerät reagiert nicht auf WorkMode (Pump, Sensor, Special Lights, ...)."""
+        return
+
+    async def _workmode_light_on(self):
+        if self.sunPhaseActive:
+            await self.eventManager.emit("pauseSunPhase", False)
+            return
+        # Use minVoltage if min/max is active, otherwise initVoltage
+        if self.minVoltage is not None and self.maxVoltage is not None:
+            self.voltage = self.minVoltage
         else:
-            if self.isDimmable:
-                if self.deviceType == "Light":
-                    if hasattr(self, 'sunPhaseActive') and self.sunPhaseActive:
-                        await self.eventManager.emit("resumeSunPhase", False)
-                        return
-                    self.voltage = self.maxVoltage
-                    # Return to normal operation: turn on if device was running
-                    if self.isRunning:
-                        await self.turn_on(brightness_pct=self.maxVoltage)
-                else:
-                    self.dutyCycle = self.maxDuty
-                    # Return to normal operation: turn on if device was running
-                    if self.isRunning:
-                        if self.isSpecialDevice:
-                            await self.turn_on(brightness_pct=int(float(self.maxDuty)))
-                        await self.turn_on(percentage=int(float(self.maxDuty)))
+            self.voltage = self.initVoltage
+        await self.turn_on(brightness_pct=self.voltage)
+
+    async def _workmode_light_off(self):
+        if self.sunPhaseActive:
+            await self.eventManager.emit("resumeSunPhase", False)
+            return
+        self.voltage = self.maxVoltage
+        # Return to normal operation: turn on if device was running
+        if self.isRunning:
+            await self.turn_on(brightness_pct=self.maxVoltage)
+
+    async def _workmode_duty_on(self):
+        self.dutyCycle = self.minDuty
+        if self.isSpecialDevice:
+            await self.turn_on(brightness_pct=self._min_duty_i)
+        else:
+            await self.turn_on(percentage=self._min_duty_i)
+
+    async def _workmode_duty_off(self):
+        self.dutyCycle = self.maxDuty
+        # Return to normal operation: turn on if device was running
+        if self.isRunning:
+            if self.isSpecialDevice:
+                await self.turn_on(brightness_pct=self._max_duty_i)
             else:
-                if self.deviceType == "Light":
-                    return
-                if self.deviceType == "Pump":
-                    return
-                if self.deviceType == "Sensor":
-                    return
-                else:
-                    # Return to normal operation: turn on if device was running
-                    if self.isRunning:
-                        await self.turn_on()
-                             
+                await self.turn_on(percentage=self._max_duty_i)
+
+    async def _workmode_switch_on(self):
+        await self.turn_off()
+
+    async def _workmode_switch_off(self):
+        # Return to normal operation: turn on if device was running
+        if self.isRunning:
+            await self.turn_on()
+
     # Update Listener
     def deviceUpdater(self):
         deviceEntitiys = self.getEntitys()
-        _LOGGER.debug(f"UpdateListener für {self.deviceName} registriert for {deviceEntitiys}.")
+        _LOGGER.debug("UpdateListener für %s registriert for %s.", self.deviceName, deviceEntitiys)
         
         async def deviceUpdateListner(event):
             
@@ -1434,54 +1496,67 @@ class Device:
                 old_state = event.data.get("old_state")
                 new_state = event.data.get("new_state")
                             
-                def parse_state(state):
-                    """Konvertiere den Zustand zu float oder lasse ihn als String."""
-                    if state and state.state:
-                        # Versuche, den Wert in einen Float umzuwandeln
-                        try:
-                            return float(state.state)
-                        except ValueError:
-                            # Wenn nicht möglich, behalte den ursprünglichen String
-                            return state.state
-                    return None
-                
-                old_state_value = parse_state(old_state)
-                new_state_value = parse_state(new_state)
-                
-                updateData = {"entity_id":entity_id,"newValue":new_state_value,"oldValue":old_state_value}                               
-                
-                _LOGGER.debug(
-                    f"Device State-Change für {self.deviceName} an {entity_id} in {self.inRoom}: "
-                    f"Alt: {old_state_value}, Neu: {new_state_value}"
-                )
-                
-                # Check if this is a switch/control entity that affects running state
-                if any(prefix in entity_id for prefix in ["fan.", "light.", "switch.", "humidifier.", "select."]):
-                    # Update the entity value first
-                    for entity_list in [self.switches, self.options]:
-                        for entity in entity_list:
-                            if entity.get("entity_id") == entity_id:
-                                entity["value"] = new_state_value
-                                break
-                    
-                    # Now update the running state
-                    try:
-                        self.identifyIfRunningState()
-                        _LOGGER.debug(f"{self.deviceName}: Running state updated to {self.isRunning} after {entity_id} changed to {new_state_value}")
-                    except Exception as e:
-                        _LOGGER.error(f"{self.deviceName}: Error updating running state: {e}")
-                
-                self.checkForControlValue()
+                old_state_value = _parse_state(old_state)
+                new_state_value = _parse_state(new_state)
+
+                # Attribut-Only Changes (gleicher State) überspringen - nur der State wird hier verarbeitet
+                if old_state_value == new_state_value and (old_state is None) == (new_state is None):
+                    return
+
+                updateData = {"entity_id":entity_id,"newValue":new_state_value,"oldValue":old_state_value}
+
+                # Entity-Werte nur im HA Event-Loop mutieren
+                if self._on_hass_loop():
+                    await self._apply_update(updateData)
+                else:
+                    self.hass.loop.call_soon_threadsafe(
+                        lambda: self.hass.async_create_task(self._apply_update(updateData))
+                    )
 
-                # Gib das Update-Publication-Objekt weiter
-                await self.eventManager.emit("DeviceStateUpdate",updateData)
-                
         # Registriere den Listener
         self.hass.bus.async_listen("state_changed", deviceUpdateListner)
-        _LOGGER.debug(f"Device-State-Change Listener für {self.deviceName} registriert.")  
+        _LOGGER.debug("Device-State-Change Listener für %s registriert.", self.deviceName)
+
+    def _on_hass_loop(self) -> bool:
+        """True wenn der Aufruf im HA Event-Loop läuft."""
+        try:
+            return asyncio.get_running_loop() is self.hass.loop
+        except RuntimeError:
+            return False
+
+    async def _apply_update(self, updateData):
+        """Übernimmt einen State-Change in die Entity-Listen (muss im HA Event-Loop laufen)."""
+        entity_id = updateData["entity_id"]
+        new_state_value = updateData["newValue"]
+
+        _LOGGER.debug(
+            "Device State-Change für %s an %s in %s: Alt: %s, Neu: %s",
+            self.deviceName, entity_id, self.inRoom, updateData["oldValue"], new_state_value,
+        )
+
+        # Check if this is a switch/control entity that affects running state
+        if any(prefix in entity_id for prefix in ["fan.", "light.", "switch.", "humidifier.", "select."]):
+            # Update the entity value first
+            for entity_list in [self.switches, self.options]:
+                for entity in entity_list:
+                    if entity.get("entity_id") == entity_id:
+                        entity["value"] = new_state_value
+                        break
+
+            # Now update the running state
+            try:
+                self.identifyIfRunningState()
+                _LOGGER.debug("%s: Running state updated to %s after %s changed to %s", self.deviceName, self.isRunning, entity_id, new_state_value)
+            except Exception as e:
+                _LOGGER.error(f"{self.deviceName}: Error updating running state: {e}")
+
+        self.checkForControlValue()
+
+        # Gib das Update-Publication-Objekt weiter
+        await self.eventManager.emit("DeviceStateUpdate",updateData)
 
     async def userSetMinMax(self,data):
-        if hasattr(self, 'sunPhaseActive') and self.sunPhaseActive:
+        if self.sunPhaseActive:
             _LOGGER.info(f"{self.deviceName}: Cannot change min/max during active sunphase")
             return
 
@@ -1503,20 +1578,12 @@ class Device:
             self.maxDuty = float(minMaxSets.get("maxDuty"))
             await self.changeMinMaxValues(self.clamp_duty_cycle(self.dutyCycle))
         
-    async def changeMinMaxValues(self, newValue):
-        if self.isDimmable:
-            _LOGGER.debug(f"{self.deviceName}: as Type:{self.deviceType} NewValue: {newValue}")
-    
-            if self.deviceType == "Light":
-                if self.isDimmable:
-                    self.voltage = newValue
-                    await self.turn_on(brightness_pct=newValue)
-            else:
-                self.dutyCycle = newValue
-                if self.isSpecialDevice:
-                    await self.turn_on(brightness_pct=float(newValue))
-                else:
-                    await self.turn_on(percentage=newValue)
+    def _on_plant_stage(self, data):
+        """Cached die aktuelle Plant Stage (Payload ist String oder {"new_stage": ...})."""
+        stage = data.get("new_stage") if isinstance(data, dict) else data
+        if not isinstance(stage, str) or not stage:
+            stage = self.dataStore.get("plantStage")
+        self._plant_stage = stage or "LateFlower"
 
     async def on_minmax_control_disabled(self, data):
         """Reset min/max to defaults when global minMaxControl is disabled.
@@ -1539,10 +1606,10 @@ class Device:
         
         if self.deviceType == "Light":
             # For Light devices, use plant stage-based min/max from PlantStageMinMax
-            plant_stage = self.data_store.get("plantStage") or "LateFlower"
+            plant_stage = self._plant_stage
             
             # Import PlantStageMinMax from Light class if available
-            if hasattr(self, 'PlantStageMinMax') and plant_stage in self.PlantStageMinMax:
+            if self.PlantStageMinMax is not None and plant_stage in self.PlantStageMinMax:
                 stage_minmax = self.PlantStageMinMax[plant_stage]
                 old_min = self.minVoltage
                 old_max = self.maxVoltage
@@ -1562,14 +1629,14 @@ class Device:
                 )
             
             # Only update running devices - don't turn on devices that are off
-            if self.isRunning and hasattr(self, 'voltage') and self.voltage is not None:
+            if self.isRunning and self.voltage is not None:
                 old_voltage = self.voltage
                 # Un-clamp: reset to initVoltage
                 self.voltage = self.initVoltage
                 _LOGGER.info(f"{self.deviceName}: Running - voltage reset from {old_voltage}% to {self.voltage}%")
-                await self.turn_on(brightness_pct=self.voltage)
+                self._schedule_call(self.turn_on(brightness_pct=self.voltage))
             else:
-                _LOGGER.info(f"{self.deviceName}: Not running - min/max reset, voltage unchanged at {getattr(self, 'voltage', 'N/A')}%")
+                _LOGGER.info(f"{self.deviceName}: Not running - min/max reset, voltage unchanged at {self.voltage if self.voltage is not None else 'N/A'}%")
         
         elif self.deviceType in {"Exhaust", "Intake", "Ventilation"}:
             old_min = self.minDuty
@@ -1587,26 +1654,27 @@ class Device:
                 )
             else:
                 # No device-specific values - use class defaults
-                self.minDuty = getattr(self, 'minDuty', 0)
-                self.maxDuty = getattr(self, 'maxDuty', 100)
+                if self.minDuty is None:
+                    self.minDuty = 0
+                if self.maxDuty is None:
+                    self.maxDuty = 100
                 _LOGGER.info(
                     f"{self.deviceName}: Resetting min/max to defaults: "
                     f"min={old_min}→{self.minDuty}, max={old_max}→{self.maxDuty}"
                 )
             
             # Only update running devices - don't turn on devices that are off
-            if self.isRunning and hasattr(self, 'dutyCycle') and self.dutyCycle is not None:
+            if self.isRunning and self.dutyCycle is not None:
                 old_duty = self.dutyCycle
-                # Calculate midpoint of new range
-                midpoint = self.minDuty + ((self.maxDuty - self.minDuty) // 2 // self.steps) * self.steps
-                self.dutyCycle = midpoint
+                # Midpoint of new range (precomputed whenever min/max/steps change)
+                self.dutyCycle = self._midpoint_cached
                 _LOGGER.info(f"{self.deviceName}: Running - dutyCycle reset from {old_duty}% to {self.dutyCycle}%")
                 if self.isSpecialDevice:
-                    await self.turn_on(brightness_pct=float(self.dutyCycle))
+                    self._schedule_call(self.turn_on(brightness_pct=float(self.dutyCycle)))
                 else:
-                    await self.turn_on(percentage=self.dutyCycle)
+                    self._schedule_call(self.turn_on(percentage=self.dutyCycle))
             else:
-                _LOGGER.info(f"{self.deviceName}: Not running - min/max reset, dutyCycle unchanged at {getattr(self, 'dutyCycle', 'N/A')}%")
+                _LOGGER.info(f"{self.deviceName}: Not running - min/max reset, dutyCycle unchanged at {self.dutyCycle if self.dutyCycle is not None else 'N/A'}%")
 
     async def on_minmax_control_enabled(self, data):
         """Restore user-defined min/max values when global minMaxControl is enabled.
@@ -1641,11 +1709,11 @@ class Device:
                         f"min={old_min}→{self.minVoltage}%, max={old_max}→{self.maxVoltage}%"
                     )
                     
-                    if self.isRunning and hasattr(self, 'voltage') and self.voltage is not None:
+                    if self.isRunning and self.voltage is not None:
                         old_voltage = self.voltage
                         self.voltage = self.clamp_voltage(self.voltage)
                         _LOGGER.info(f"{self.deviceName}: Voltage clamped from {old_voltage}% to {self.voltage}%")
-                        await self.turn_on(brightness_pct=self.voltage)
+                        self._schedule_call(self.turn_on(brightness_pct=self.voltage))
                 else:
                     _LOGGER.warning(f"{self.deviceName}: No min/max values found in dataStore")
             else:
@@ -1663,14 +1731,14 @@ class Device:
                         f"min={old_min}→{self.minDuty}, max={old_max}→{self.maxDuty}"
                     )
                     
-                    if self.isRunning and hasattr(self, 'dutyCycle') and self.dutyCycle is not None:
+                    if self.isRunning and self.dutyCycle is not None:
                         old_duty = self.dutyCycle
                         self.dutyCycle = max(self.minDuty, min(self.maxDuty, self.dutyCycle))
                         _LOGGER.info(f"{self.deviceName}: DutyCycle clamped from {old_duty}% to {self.dutyCycle}%")
                         if self.isSpecialDevice:
-                            await self.turn_on(brightness_pct=float(self.dutyCycle))
+                            self._schedule_call(self.turn_on(brightness_pct=float(self.dutyCycle)))
                         else:
-                            await self.turn_on(percentage=self.dutyCycle)
+                            self._schedule_call(self.turn_on(percentage=self.dutyCycle))
                 else:
                     _LOGGER.warning(f"{self.deviceName}: No min/max values found in dataStore")
             else:
@@ -1696,7 +1764,7 @@ class Device:
     async def changeMinMaxValues(self,newValue):
         if self.isDimmable:
             
-            _LOGGER.debug(f"{self.deviceName}:as Type:{self.deviceType} NewValue: {newValue}")
+            _LOGGER.debug("%s:as Type:%s NewValue: %s", self.deviceName, self.deviceType, newValue)
     
             if self.deviceType == "Light":
                 if self.isDimmable:
@@ -1704,13 +1772,63 @@ class Device:
                     clamped_value = self.clamp_voltage(newValue)
                     self.voltage = clamped_value
                     _LOGGER.info(f"{self.deviceName}: Voltage set to {clamped_value}% (was {newValue}%)")
-                    await self.turn_on(brightness_pct=clamped_value)
+                    self._schedule_call(self.turn_on(brightness_pct=clamped_value))
             else:
                 # Clamp to min/max range for duty cycle devices
                 clamped_value = max(self.minDuty, min(self.maxDuty, newValue))
                 self.dutyCycle = clamped_value
                 _LOGGER.info(f"{self.deviceName}: DutyCycle set to {clamped_value}% (was {newValue}%)")
                 if self.isSpecialDevice:
-                    await self.turn_on(brightness_pct=float(clamped_value))
+                    self._schedule_call(self.turn_on(brightness_pct=clamped_value))
                 else:
-                    await self.turn_on(percentage=clamped_value)
\ No newline at end of file
+                    self._schedule_call(self.turn_on(percentage=clamped_value))
+
+
+def _parse_state(state):
+    """Konvertiere den Zustand zu float oder lasse ihn als String (z.B. "on"/"unavailable")."""
+    if state is None:
+        return None
+    value = state.state
+    if not value:
+        return None
+    first = value[0]
+    # Ziffer, Vorzeichen, "." oder Leerzeichen am Anfang: float() direkt (auch " 12.5", "1_000")
+    if first in _NUMERIC_START:
+        try:
+            return float(value)
+        except ValueError:
+            return value
+    # "on"/"off"/"unavailable" & Co. ohne float()-Exception aussortieren
+    if first.isalpha() and value.lower() not in _FLOAT_WORDS:
+        return value
+    # Seltene Reste (nan/inf, andere Whitespace-Zeichen, Unicode-Ziffern)
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def _build_workmode_table(light, duty, switch, special_dimmable):
+    """Baut die WorkMode-Dispatch-Tabelle keyed by (deviceType, isDimmable)."""
+    table = {
+        ("Light", True): light,
+        ("Light", False): Device._workmode_noop,
+        ("Pump", False): Device._workmode_noop,
+        ("Sensor", False): Device._workmode_noop,
+        (None, True): duty,
+        (None, False): switch,
+    }
+    # Dimmbare Special Lights ignorieren nur WorkMode an (eigenes Scheduling); sonst generischer Fallback wie bisher
+    for light_type in SPECIAL_LIGHT_TYPES:
+        table[(light_type, True)] = special_dimmable
+    return table
+
+
+_WORKMODE_ON = _build_workmode_table(
+    Device._workmode_light_on, Device._workmode_duty_on, Device._workmode_switch_on,
+    special_dimmable=Device._workmode_noop,
+)
+_WORKMODE_OFF = _build_workmode_table(
+    Device._workmode_light_off, Device._workmode_duty_off, Device._workmode_switch_off,
+    special_dimmable=Device._workmode_duty_off,
+)
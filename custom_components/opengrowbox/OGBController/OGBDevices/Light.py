@@ -619,6 +619,9 @@ class Light(Device):
             self.sunPhaseActive = True
             _LOGGER.debug(f"{self.deviceName}: Start SunRise von {start_voltage}% bis {target_voltage}% ({voltage_source})")
 
+            # Feste Zielzeiten statt sleep-Akkumulation: turn_on-Latenz verschiebt die Rampe nicht
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + step_duration
             for i in range(1, 11):
                 if not self.islightON:
                     _LOGGER.debug(f"{self.deviceName}: SunRise abgebrochen - Licht aus")
@@ -626,8 +629,12 @@ class Light(Device):
                 
                 if self.sun_phase_paused:
                     await self._wait_if_paused()
+                    deadline = loop.time() + step_duration
                 else:
-                    await asyncio.sleep(step_duration)
+                    remaining = deadline - loop.time()
+                    if remaining > 0:
+                        await asyncio.sleep(remaining)
+                    deadline += step_duration
                     next_voltage = min(start_voltage + (voltage_step * i), target_voltage)
                     self.voltage = round(next_voltage, 1)
 
@@ -681,6 +688,8 @@ class Light(Device):
 
             _LOGGER.debug(f"{self.deviceName}: Start SunSet {start_voltage}% bis {target_voltage}%")
 
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + step_duration
             for i in range(1, 11):
                 # Check if we should continue with sunset
                 if not self.islightON:
@@ -690,8 +699,12 @@ class Light(Device):
                 # Warten falls pausiert
                 if self.sun_phase_paused:
                     await self._wait_if_paused()
+                    deadline = loop.time() + step_duration
                 else:
-                    await asyncio.sleep(step_duration)
+                    remaining = deadline - loop.time()
+                    if remaining > 0:
+                        await asyncio.sleep(remaining)
+                    deadline += step_duration
                     next_voltage = max(start_voltage - (voltage_step * i), target_voltage)
                     self.voltage = round(next_voltage,1)
                     message = f"{self.deviceName}: SunSet Step {i}: {self.voltage}%"
@@ -756,7 +769,7 @@ class Light(Device):
                     )
                     await self.turn_on()
                     # Activate pending workmode if light is now on
-                    if hasattr(self, 'pendingWorkMode') and self.pendingWorkMode is not None:
+                    if self.pendingWorkMode is not None:
                         self.inWorkMode = self.pendingWorkMode
                         self.pendingWorkMode = None
                         _LOGGER.info(f"{self.deviceName}: Activated pending WorkMode {self.inWorkMode}")
@@ -770,7 +783,7 @@ class Light(Device):
                             self.voltage = self.initVoltage
                     message = "Turn On"
                     # Activate pending workmode
-                    if hasattr(self, 'pendingWorkMode') and self.pendingWorkMode is not None:
+                    if self.pendingWorkMode is not None:
                         self.inWorkMode = self.pendingWorkMode
                         self.pendingWorkMode = None
                         _LOGGER.info(f"{self.deviceName}: Activated pending WorkMode {self.inWorkMode}")
@@ -975,12 +988,15 @@ class Light(Device):
             )
             return
 
-        # search dictionarray for curve object where week property is week
+        # Curves are stored week 1..n in order - index directly, scan only for custom curves
         dli_target_week = None
-        for curve in light_plan:
-            if curve["week"] == week:
-                dli_target_week = curve["DLITarget"]
-                break
+        if 0 < week <= len(light_plan) and light_plan[week - 1]["week"] == week:
+            dli_target_week = light_plan[week - 1]["DLITarget"]
+        else:
+            for curve in light_plan:
+                if curve["week"] == week:
+                    dli_target_week = curve["DLITarget"]
+                    break
 
         if not dli_target_week:
             _LOGGER.debug(
@@ -694,8 +694,7 @@ class LightFarRed(Light):
                 _LOGGER.error(f"{self.deviceName}: turn_off() also failed: {e}")
         
         # Ensure voltage is reset
-        if hasattr(self, 'voltage'):
-            self.voltage = 0
+        self.voltage = 0
 
     async def _delayed_deactivate(self, delay_seconds: float, reason: str):
         """Schedule FarRed deactivation after a delay - ensures 100% is applied before turning off."""
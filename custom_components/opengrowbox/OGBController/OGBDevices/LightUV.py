@@ -24,21 +24,55 @@ Default: Active for middle 4-6 hours of a 12-hour light cycle
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, time as dt_time, timedelta, timezone
+from enum import IntEnum
 from typing import Optional
 
+from homeassistant.helpers.event import async_track_point_in_utc_time
+
 from .Light import Light
 from ..data.OGBDataClasses.OGBPublications import OGBLightAction
 
 _LOGGER = logging.getLogger(__name__)
 
+ONE_DAY = timedelta(days=1)
+
 
 # Valid modes for UV light control
-class UVMode:
-    SCHEDULE = "Schedule"      # Mid-day timing window
-    ALWAYS_ON = "Always On"    # ON when main lights are ON
-    ALWAYS_OFF = "Always Off"  # Never on automatically
-    MANUAL = "Manual"          # Only manual control
+class UVMode(IntEnum):
+    SCHEDULE = 1      # Mid-day timing window
+    ALWAYS_ON = 2     # ON when main lights are ON
+    ALWAYS_OFF = 3    # Never on automatically
+    MANUAL = 4        # Only manual control
+
+    @property
+    def label(self) -> str:
+        """UI/datastore label, e.g. 'Always On'."""
+        return _UV_MODE_LABELS[self]
+
+    @classmethod
+    def from_label(cls, value, default: "UVMode") -> "UVMode":
+        """Map a datastore/UI label (or an UVMode) to an UVMode, falling back to default."""
+        if isinstance(value, UVMode):
+            return value
+        return _UV_MODE_BY_LABEL.get(value, default)
+
+
+_UV_MODE_LABELS = {
+    UVMode.SCHEDULE: "Schedule",
+    UVMode.ALWAYS_ON: "Always On",
+    UVMode.ALWAYS_OFF: "Always Off",
+    UVMode.MANUAL: "Manual",
+}
+_UV_MODE_BY_LABEL = {label: mode for mode, label in _UV_MODE_LABELS.items()}
+
+
+# Why the UV light is currently on
+class UVPhase(IntEnum):
+    NONE = 0
+    SCHEDULE = 1
+    ALWAYS_ON = 2
 
 
 class LightUV(Light):
@@ -69,6 +103,7 @@ class LightUV(Light):
         )
 
         # Mode setting
+        self.enabled = True
         self.mode = UVMode.SCHEDULE  # Default to schedule-based operation
         
         # UV specific settings (for Schedule mode)
@@ -76,15 +111,14 @@ class LightUV(Light):
         self.stop_before_end_minutes = 120    # Stop 2 hours before lights off
         self.max_duration_hours = 6           # Maximum UV exposure per day
         self.intensity_percent = 100          # UV intensity (if dimmable)
+        self.transition_seconds = 60          # Ramp-up duration
+        self._refresh_timing_deltas()
 
-        # New midday scheduling features
-        self.midday_start_time = "12:00"      # Start midday period (preset options)
-        self.midday_end_time = "14:00"        # End midday period (preset options)
-        
         # State tracking
         self.is_uv_active = False
-        self.current_phase: Optional[str] = None  # 'schedule', 'always_on', or None
-        self.daily_exposure_minutes = 0
+        self.current_phase = UVPhase.NONE
+        self.daily_exposure_minutes = 0  # Exposure of already finished UV sessions today
+        self._uv_activation_time: Optional[datetime] = None  # Start of the running session
         self.last_exposure_date = None
         
         # Light schedule reference
@@ -92,20 +126,29 @@ class LightUV(Light):
         self.lightOffTime = None
         self.islightON = None
         
-        # Task tracking
-        self._schedule_task = None
+        # Scheduler tracking
+        self._boundary_unsub = None  # HA timer for the next uv_start/uv_end/midnight
+        self._state_lock = asyncio.Lock()  # Serialisiert _activate_uv/_deactivate_uv - weitere Trigger warten
+        self._next_boundary: Optional[datetime] = None  # Next uv_start/uv_end transition
+        self._cached_window = None  # (uv_start, uv_end) for _cached_window_key
+        self._cached_window_key = None
+        self._uv_window_ts = (0.0, 0.0)  # POSIX timestamps of _cached_window
+        self._main_light_off_reason: Optional[str] = "Main lights off"  # None = main lights allow UV
         
         # Initialize parent class first (important for Device inheritance)
         self.init()
 
         # Initialize UV specific settings
+        self._status_cache = {}
         self._load_settings()
 
         # Register event handlers FIRST (before scheduler starts)
         # This ensures we don't miss any events emitted during startup
-        self.event_manager.on("LightTimeChanges", self._on_light_time_change)
-        self.event_manager.on("toggleLight", self._on_main_light_toggle)
-        self.event_manager.on("UVSettingsUpdate", self._on_settings_update)
+        self.event_manager.on_many({
+            "LightTimeChanges": self._on_light_time_change,
+            "toggleLight": self._on_main_light_toggle,
+            "UVSettingsUpdate": self._on_settings_update,
+        })
 
         # Validate entity availability
         self._validate_entity_availability()
@@ -126,17 +169,23 @@ class LightUV(Light):
                 f"(light_uv, uv, ultraviolet)."
             )
             if self.hass:
-                possible_entity_ids = [
-                    f"light.{self.deviceName}",
-                    f"light.{self.deviceName.lower()}",
-                    f"light.{self.deviceName.replace(' ', '_').lower()}",
-                    f"switch.{self.deviceName}",
-                    f"switch.{self.deviceName.lower()}",
-                ]
+                lowered = self.deviceName.lower()
+                snaked = lowered.replace(' ', '_')
+                # dict.fromkeys keeps the lookup order and drops identical name variants
+                possible_entity_ids = list(dict.fromkeys(
+                    f"{domain}.{name}"
+                    for domain, names in (
+                        ("light", (self.deviceName, lowered, snaked)),
+                        ("switch", (self.deviceName, lowered)),
+                    )
+                    for name in names
+                ))
                 
                 for entity_id in possible_entity_ids:
                     state = self.hass.states.get(entity_id)
-                    if state and state.state not in ("unavailable", "unknown", None):
+                    if state is None:
+                        continue
+                    if state.state not in ("unavailable", "unknown", None):
                         _LOGGER.info(
                             f"{self.deviceName}: Found entity '{entity_id}' in HA. "
                             f"Adding to switches list."
@@ -168,7 +217,7 @@ class LightUV(Light):
     def __repr__(self):
         return (
             f"LightUV('{self.deviceName}' in {self.inRoom}) "
-            f"Mode:{self.mode} "
+            f"Mode:{self.mode.label} "
             f"DelayStart:{self.delay_after_start_minutes}min StopBefore:{self.stop_before_end_minutes}min "
             f"MaxDuration:{self.max_duration_hours}h Active:{self.is_uv_active} Running:{self.isRunning}"
         )
@@ -181,11 +230,13 @@ class LightUV(Light):
             light_off_str = self.data_store.getDeep("isPlantDay.lightOffTime")
             
             if light_on_str:
-                self.lightOnTime = datetime.strptime(light_on_str, "%H:%M:%S").time()
+                self.lightOnTime = dt_time.fromisoformat(light_on_str)
             if light_off_str:
-                self.lightOffTime = datetime.strptime(light_off_str, "%H:%M:%S").time()
+                self.lightOffTime = dt_time.fromisoformat(light_off_str)
                 
             self.islightON = self.data_store.getDeep("isPlantDay.islightON")
+            self._refresh_main_light_snapshot()
+            self._cached_window = None
             
             # Get UV specific settings (with defaults)
             uv_settings = self.data_store.getDeep("specialLights.uv") or {}
@@ -194,44 +245,45 @@ class LightUV(Light):
             self.enabled = uv_settings.get("enabled", True)  # Default to enabled for backward compatibility
             
             # Get mode setting - this determines behavior
-            self.mode = uv_settings.get("mode", UVMode.SCHEDULE)
+            self.mode = UVMode.from_label(uv_settings.get("mode"), UVMode.SCHEDULE)
             self.delay_after_start_minutes = uv_settings.get("delayAfterStartMinutes", 120)
             self.stop_before_end_minutes = uv_settings.get("stopBeforeEndMinutes", 120)
             self.max_duration_hours = uv_settings.get("maxDurationHours", 6)
             self.intensity_percent = uv_settings.get("intensity", 100)
-
-            # New midday scheduling features (with defaults)
-            self.midday_start_time = uv_settings.get("middayStartTime", "12:00")
-            self.midday_end_time = uv_settings.get("middayEndTime", "14:00")
+            self._refresh_timing_deltas()
             
             _LOGGER.info(
                 f"{self.deviceName}: UV settings loaded - "
-                f"Enabled: {self.enabled}, Mode: {self.mode}, "
+                f"Enabled: {self.enabled}, Mode: {self.mode.label}, "
                 f"Delay: {self.delay_after_start_minutes}min, StopBefore: {self.stop_before_end_minutes}min, "
                 f"MaxDuration: {self.max_duration_hours}h, Intensity: {self.intensity_percent}%, "
-                f"Midday: {self.midday_start_time}-{self.midday_end_time}, "
                 f"LightOn: {self.lightOnTime}, LightOff: {self.lightOffTime}"
             )
             
+            self._rebuild_status_cache()
+
             # CRITICAL: Stop any existing scheduler before deciding to start a new one
-            if self._schedule_task and not self._schedule_task.done():
+            if self._boundary_unsub is not None:
                 _LOGGER.info(f"{self.deviceName}: Stopping existing scheduler before reload")
-                self._schedule_task.cancel()
-                self._schedule_task = None
+                self._stop_scheduler()
             
             # Only start scheduler if enabled AND mode is Schedule - use immediate check
             if self.enabled and self.mode == UVMode.SCHEDULE:
-                _LOGGER.info(f"{self.deviceName}: UV enabled={self.enabled}, mode={self.mode} - Starting scheduler with immediate check")
+                _LOGGER.info(f"{self.deviceName}: UV enabled={self.enabled}, mode={self.mode.label} - Starting scheduler with immediate check")
                 asyncio.create_task(self._start_scheduler_with_immediate_check())
             else:
                 _LOGGER.info(
                     f"{self.deviceName}: UV NOT starting scheduler - "
                     f"enabled={self.enabled} (type: {type(self.enabled).__name__}), "
-                    f"mode={self.mode}"
+                    f"mode={self.mode.label}"
                 )
                 # Ensure light is off if not enabled or not in schedule mode
                 if not self.enabled or self.mode == UVMode.ALWAYS_OFF:
                     _LOGGER.info(f"{self.deviceName}: UV disabled or Always Off - ensuring light is off")
+                if self.enabled:
+                    # Kein UV-Fenster, aber Exposure wird trotzdem gezählt - Mitternachts-Reset scharf schalten
+                    self._check_daily_reset()
+                    self._start_scheduler()
             
         except Exception as e:
             _LOGGER.error(f"{self.deviceName}: Error loading settings: {e}")
@@ -242,18 +294,35 @@ class LightUV(Light):
         # Do NOT call super().WorkMode() - we handle our own scheduling
 
     def _start_scheduler(self):
-        """Start the periodic scheduler for UV timing."""
-        if self._schedule_task and not self._schedule_task.done():
+        """Arm a Home Assistant timer for the next UV transition (uv_start, uv_end or midnight)."""
+        if self._boundary_unsub is not None:
+            self._boundary_unsub()
+            self._boundary_unsub = None
+        if not self.hass:
             return
-            
-        self._schedule_task = asyncio.create_task(self._schedule_loop())
-        _LOGGER.info(f"{self.deviceName}: UV scheduler started")
+
+        now = datetime.now()
+        next_boundary = datetime.combine(now.date() + ONE_DAY, dt_time.min)
+        if self._next_boundary is not None and now < self._next_boundary < next_boundary:
+            next_boundary = self._next_boundary
+
+        # Local naive datetimes -> UTC, independent of the HA configured time zone
+        fire_at = datetime.fromtimestamp(next_boundary.timestamp(), timezone.utc)
+        self._boundary_unsub = async_track_point_in_utc_time(self.hass, self._on_schedule_boundary, fire_at)
+        _LOGGER.debug(f"{self.deviceName}: UV scheduler armed for {next_boundary.strftime('%Y-%m-%d %H:%M:%S')}")
+
+    def _stop_scheduler(self):
+        """Cancel the pending UV transition timer."""
+        if self._boundary_unsub is not None:
+            self._boundary_unsub()
+            self._boundary_unsub = None
+        self._next_boundary = None
 
     async def _start_scheduler_with_immediate_check(self):
-        """Start the scheduler and run an immediate check without waiting.
+        """Run an immediate check and arm the timer for the next transition.
         
         This ensures UV can activate immediately if we're already in a window,
-        without waiting for the first sleep cycle to complete.
+        without waiting for the next boundary.
         """
         _LOGGER.info(f"{self.deviceName}: Starting scheduler with immediate check")
         
@@ -264,11 +333,9 @@ class LightUV(Light):
             self._check_daily_reset()
             _LOGGER.info(f"{self.deviceName}: Immediate check completed")
         except Exception as e:
-            _LOGGER.error(f"{self.deviceName}: Immediate check error: {e}")
-            import traceback
-            _LOGGER.error(traceback.format_exc())
+            _LOGGER.exception(f"{self.deviceName}: Immediate check error: {e}")
         
-        # Then start the periodic scheduler
+        # Then arm the timer for the next boundary
         self._start_scheduler()
 
     async def _on_sunrise_window_status(self, data):
@@ -279,29 +346,52 @@ class LightUV(Light):
         """UV has its own scheduling - ignore sunset window events from main light."""
         pass
 
-    async def _schedule_loop(self):
-        """Main scheduling loop - checks every minute for activation conditions."""
-        _LOGGER.info(f"{self.deviceName}: UV scheduler loop started")
-        while True:
-            try:
-                _LOGGER.debug(f"{self.deviceName}: UV scheduler tick - running check")
-                await self._check_activation_conditions()
-                self._check_daily_reset()
-            except Exception as e:
-                _LOGGER.error(f"{self.deviceName}: Schedule loop error: {e}")
-                import traceback
-                _LOGGER.error(traceback.format_exc())
-            
-            await asyncio.sleep(60)  # Check every minute
+    async def _restart_scheduler(self):
+        """Drop the pending timer and re-evaluate immediately."""
+        self._stop_scheduler()
+        await self._start_scheduler_with_immediate_check()
+
+    async def _on_schedule_boundary(self, _fired_at):
+        """HA timer callback - a UV window boundary or midnight was reached."""
+        self._boundary_unsub = None
+        try:
+            _LOGGER.debug(f"{self.deviceName}: UV boundary reached - running check")
+            await self._check_activation_conditions()
+            self._check_daily_reset()
+        except Exception as e:
+            _LOGGER.exception(f"{self.deviceName}: Schedule boundary error: {e}")
+
+        self._start_scheduler()
 
     def _check_daily_reset(self):
         """Reset daily exposure counter at midnight."""
         today = datetime.now().date()
         if self.last_exposure_date != today:
             self.daily_exposure_minutes = 0
+            # A session running across midnight counts towards the new day from now on
+            self._uv_activation_time = datetime.now() if self.is_uv_active else None
             self.last_exposure_date = today
             _LOGGER.debug(f"{self.deviceName}: Daily UV exposure counter reset")
 
+    def _refresh_main_light_snapshot(self):
+        """Snapshot the main light state from the data store (called on light events, not per tick).
+
+        Reduces main light on/off and sun phase to one OFF reason, None if UV may run.
+        """
+        if not self.data_store.getDeep("isPlantDay.islightON"):
+            self._main_light_off_reason = "Main lights off"
+        elif self.data_store.getDeep("isPlantDay.sunPhaseActive"):
+            self._main_light_off_reason = "Sun phase active"
+        else:
+            self._main_light_off_reason = None
+
+    def _current_exposure_minutes(self) -> float:
+        """Today's UV exposure in minutes, derived from the running session's start time."""
+        if self._uv_activation_time is None:
+            return self.daily_exposure_minutes
+        running = (datetime.now() - self._uv_activation_time).total_seconds() / 60
+        return self.daily_exposure_minutes + running
+
     async def _check_activation_conditions(self):
         """Check if UV should be ON or OFF based on current mode."""
         
@@ -318,10 +408,10 @@ class LightUV(Light):
         # Mode: Always On - ON whenever main lights are ON (but NOT during sunrise/sunset)
         if self.mode == UVMode.ALWAYS_ON:
             # Check if main light is in sunrise or sunset phase - UV must be OFF during transitions
-            sun_phase_active = getattr(self, 'sunPhaseActive', False)
+            sun_phase_active = self.sunPhaseActive
             if self.islightON and not sun_phase_active:
                 if not self.is_uv_active:
-                    await self._activate_uv('always_on')
+                    await self._activate_uv(UVPhase.ALWAYS_ON)
             else:
                 if self.is_uv_active:
                     reason = "Main lights off" if not self.islightON else "Sun phase active"
@@ -346,8 +436,10 @@ class LightUV(Light):
           - UV ends at: 22:00 - 120min = 20:00
           - UV window: 09:00-20:00 (11 hours total)
         """
+        self._next_boundary = None
+
         # CRITICAL: Check if enabled first
-        if not getattr(self, 'enabled', True):
+        if not self.enabled:
             _LOGGER.debug(f"{self.deviceName}: Schedule check skipped (disabled)")
             # Ensure we're off if disabled
             if self.is_uv_active:
@@ -357,120 +449,137 @@ class LightUV(Light):
         if not self.lightOnTime or not self.lightOffTime:
             return
             
-        # Check if main light is in sunrise or sunset phase - UV must be OFF during transitions
-        # Use both methods for maximum reliability
-        sun_phase_active = getattr(self, 'sunPhaseActive', False)
-        
-        # Additional check: Look for main light states in data store
-        main_light_sun_phase = self.data_store.getDeep("isPlantDay.sunPhaseActive") or False
-        main_light_state = self.data_store.getDeep("isPlantDay.islightON") or False
-        
-        # UV must be off if ANY of these conditions are met
-        if not main_light_state or sun_phase_active or main_light_sun_phase:
+        # UV must be OFF while main lights are off or in sunrise/sunset (own flag or data store snapshot)
+        off_reason = self._main_light_off_reason
+        if off_reason is None and self.sunPhaseActive:
+            off_reason = "Sun phase active"
+        if off_reason is not None:
             if self.is_uv_active:
-                reason = "Main lights off"
-                if not main_light_state:
-                    reason = "Main lights off"
-                elif sun_phase_active:
-                    reason = "Sun phase active"
-                elif main_light_sun_phase:
-                    reason = "Sun phase active"
-                await self._deactivate_uv(reason)
+                await self._deactivate_uv(off_reason)
             return
             
         now = datetime.now()
-        current_time = now.time()
+        max_duration_hours = self.max_duration_hours
+
+        uv_start, uv_end = self._get_uv_window(now)
+        start_ts, end_ts = self._uv_window_ts
+
+        in_uv_window = start_ts <= time.time() <= end_ts
+
+        # Remember the next transition so the scheduler can sleep until then
+        if now < uv_start:
+            self._next_boundary = uv_start
+        elif now < uv_end:
+            self._next_boundary = uv_end
+        
+        # Check if we've hit daily exposure limit
+        max_daily_minutes = max_duration_hours * 60
+        daily_exposure = self._current_exposure_minutes()
+        exposure_limit_reached = daily_exposure >= max_daily_minutes
+
+        # A running session also ends when the remaining allowance is used up
+        if self.is_uv_active and not exposure_limit_reached:
+            limit_at = now + timedelta(minutes=max_daily_minutes - daily_exposure)
+            if self._next_boundary is None or limit_at < self._next_boundary:
+                self._next_boundary = limit_at
+        
+        # Activation/deactivation already log at INFO - the per-check summary is debug only
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                f"{self.deviceName}: UV check - Now: {now.strftime('%H:%M')}, "
+                f"Light: {self.lightOnTime}-{self.lightOffTime}, "
+                f"Delay: {self.delay_after_start_minutes}min, StopBefore: {self.stop_before_end_minutes}min, "
+                f"Window: {uv_start.strftime('%H:%M')}-{uv_end.strftime('%H:%M')}, "
+                f"InWindow: {in_uv_window}, DailyExposure: {daily_exposure:.0f}min/{max_daily_minutes}min"
+            )
         
+        # Determine if we should be ON or OFF
+        if in_uv_window and not exposure_limit_reached:
+            if not self.is_uv_active:
+                await self._activate_uv(UVPhase.SCHEDULE)
+        else:
+            if self.is_uv_active:
+                reason = "Exposure limit reached" if exposure_limit_reached else "Outside UV window"
+                await self._deactivate_uv(reason)
+
+    def _refresh_timing_deltas(self):
+        """Cache the timing settings as timedeltas - called whenever they change."""
+        self._delay_td = timedelta(minutes=self.delay_after_start_minutes)
+        self._stop_td = timedelta(minutes=self.stop_before_end_minutes)
+        self._max_td = timedelta(hours=self.max_duration_hours)
+
+    def _get_uv_window(self, now: datetime):
+        """Return today's (uv_start, uv_end), recomputed only when the date or settings change."""
+        # Overnight schedules have two windows per calendar day (before/after lightOff)
+        before_off = self.lightOffTime < self.lightOnTime and now.time() < self.lightOffTime
+        key = (now.date(), before_off)
+        if self._cached_window is None or self._cached_window_key != key:
+            self._cached_window = self._compute_uv_window(now.date(), before_off)
+            self._cached_window_key = key
+            self._uv_window_ts = (self._cached_window[0].timestamp(), self._cached_window[1].timestamp())
+        return self._cached_window
+
+    def _compute_uv_window(self, day, before_off: bool):
+        """Calculate the UV window for the light period that covers `day`."""
         # Calculate light period
-        light_on_dt = datetime.combine(now.date(), self.lightOnTime)
-        light_off_dt = datetime.combine(now.date(), self.lightOffTime)
+        light_on_dt = datetime.combine(day, self.lightOnTime)
+        light_off_dt = datetime.combine(day, self.lightOffTime)
         
         # Handle overnight schedules
         if self.lightOffTime < self.lightOnTime:
-            if current_time < self.lightOffTime:
-                light_on_dt -= timedelta(days=1)
+            if before_off:
+                light_on_dt -= ONE_DAY
             else:
-                light_off_dt += timedelta(days=1)
+                light_off_dt += ONE_DAY
         
         # Calculate UV window based on delay/stop relative to light times
         # Default: 120 min (2 hours) after light on, 120 min before light off
-        delay_minutes = getattr(self, 'delay_after_start_minutes', 120)
-        stop_minutes = getattr(self, 'stop_before_end_minutes', 120)
-        
-        uv_start = light_on_dt + timedelta(minutes=delay_minutes)
-        uv_end = light_off_dt - timedelta(minutes=stop_minutes)
+        uv_start = light_on_dt + self._delay_td
+        uv_end = light_off_dt - self._stop_td
         
         # Check max duration limit
-        max_duration_hours = getattr(self, 'max_duration_hours', 6)
-        max_duration_dt = timedelta(hours=max_duration_hours)
-        light_duration = (light_off_dt - light_on_dt).total_seconds() / 60  # in minutes
-        
-        if (uv_end - uv_start).total_seconds() > max_duration_dt.total_seconds():
-            # Calculate center of the allowed UV window within light period
-            # UV window should be: delay_minutes after start to stop_minutes before end
-            available_start = light_on_dt + timedelta(minutes=delay_minutes)
-            available_end = light_off_dt - timedelta(minutes=stop_minutes)
-            available_duration = (available_end - available_start).total_seconds() / 2  # Split remaining time
-            
-            center = available_start + timedelta(seconds=available_duration)
+        max_duration_dt = self._max_td
+        
+        if uv_end - uv_start > max_duration_dt:
+            # Center the max-duration window inside the delay/stop window
+            center = uv_start + (uv_end - uv_start) / 2
             uv_start = center - (max_duration_dt / 2)
             uv_end = center + (max_duration_dt / 2)
-        
-        in_uv_window = uv_start <= now <= uv_end
-        
-        # Check if we've hit daily exposure limit
-        max_daily_minutes = max_duration_hours * 60
-        daily_exposure = getattr(self, 'daily_exposure_minutes', 0)
-        exposure_limit_reached = daily_exposure >= max_daily_minutes
-        
-        _LOGGER.info(
-            f"{self.deviceName}: UV check - Now: {now.strftime('%H:%M')}, "
-            f"Light: {self.lightOnTime}-{self.lightOffTime}, "
-            f"Delay: {delay_minutes}min, StopBefore: {stop_minutes}min, "
-            f"Window: {uv_start.strftime('%H:%M')}-{uv_end.strftime('%H:%M')}, "
-            f"InWindow: {in_uv_window}, DailyExposure: {daily_exposure}min/{max_daily_minutes}min"
-        )
-        
-        # Determine if we should be ON or OFF
-        if in_uv_window and not exposure_limit_reached:
-            if not self.is_uv_active:
-                await self._activate_uv('schedule')
-            else:
-                # Track exposure time
-                self.daily_exposure_minutes = daily_exposure + 1
-        else:
-            if self.is_uv_active:
-                reason = "Exposure limit reached" if exposure_limit_reached else "Outside UV window"
-                await self._deactivate_uv(reason)
 
-    async def _activate_uv(self, phase: str):
+        return uv_start, uv_end
+
+    async def _activate_uv(self, phase: UVPhase):
         """Activate UV light with ramp-up."""
-        if self.is_uv_active and self.current_phase == phase:
-            return
+        async with self._state_lock:
+            if self.is_uv_active and self.current_phase == phase:
+                return
         
-        self.is_uv_active = True
-        self.current_phase = phase
-        
-        # Create descriptive message based on phase
-        if phase == 'always_on':
-            message = f"UV light activated (Always On mode, intensity: {self.intensity_percent}%)"
-        else:
-            message = f"UV light activated (intensity: {self.intensity_percent}%)"
+            if not self.is_uv_active:
+                self._uv_activation_time = datetime.now()
+            self.is_uv_active = True
+            self.current_phase = phase
+            self._rebuild_status_cache()
+        
+            # Create descriptive message based on phase
+            if phase == UVPhase.ALWAYS_ON:
+                message = f"UV light activated (Always On mode, intensity: {self.intensity_percent}%)"
+            else:
+                message = f"UV light activated (intensity: {self.intensity_percent}%)"
         
-        _LOGGER.info(f"{self.deviceName}: {message}")
+            _LOGGER.info(f"{self.deviceName}: {message}")
         
-        # Ramp up to target intensity over transition time (default 60 seconds)
-        if self.isDimmable:
-            transition_seconds = getattr(self, 'transition_seconds', 60)
-            await self._ramp_to_intensity(self.intensity_percent, transition_seconds)
-        else:
-            # Non-dimmable: just turn on
-            await self.turn_on()
+            # Ramp up to target intensity over transition time (default 60 seconds)
+            if self.isDimmable:
+                transition_seconds = self.transition_seconds
+                await self._ramp_to_intensity(self.intensity_percent, transition_seconds)
+            else:
+                # Non-dimmable: just turn on
+                await self.turn_on()
     
     async def _ramp_to_intensity(self, target_percent: int, duration_seconds: int):
         """Ramp UV light to target intensity over specified duration."""
         # UV starts at 20% (initVoltage) regardless of current voltage
-        start_voltage = getattr(self, 'initVoltage', 20)
+        start_voltage = self.initVoltage
         target_voltage = target_percent
         
         if start_voltage == target_voltage:
@@ -487,52 +596,63 @@ class LightUV(Light):
             f"over {duration_seconds}s ({steps} steps, {step_duration:.1f}s per step)"
         )
         
+        # Each step fires at t0 + i * step_duration; service calls run as tasks so a slow
+        # backend overlaps with the next wait instead of stretching the ramp
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
+        pending = []
         for i in range(1, steps + 1):
             next_voltage = round(start_voltage + (voltage_step * i), 1)
             _LOGGER.debug(f"{self.deviceName}: UV ramp step {i}/{steps}: {next_voltage}%")
-            await self.turn_on(brightness_pct=next_voltage)
-            await asyncio.sleep(step_duration)
+            pending.append(asyncio.create_task(self.turn_on(brightness_pct=next_voltage)))
+            remaining = t0 + i * step_duration - loop.time()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+        await asyncio.gather(*pending, return_exceptions=True)
         
         _LOGGER.info(f"{self.deviceName}: UV ramp complete at {target_percent}%")
     
     async def _deactivate_uv(self, reason: str = ""):
         """Deactivate UV light."""
-        if not self.is_uv_active:
-            return
+        async with self._state_lock:
+            if not self.is_uv_active:
+                return
             
-        previous_phase = self.current_phase
-        self.is_uv_active = False
-        self.current_phase = None
-        
-        _LOGGER.info(f"{self.deviceName}: Deactivating UV light ({reason})")
-        
-        # Create action log
-        message = f"UV light deactivated: {reason}" if reason else "UV light deactivated"
-        lightAction = OGBLightAction(
-            Name=self.inRoom,
-            Device=self.deviceName,
-            Type="LightUV",
-            Action="OFF",
-            Message=message,
-            Voltage=0,
-            Dimmable=False,
-            SunRise=False,
-            SunSet=False,
-        )
-        await self.event_manager.emit("LogForClient", lightAction, haEvent=True)
+            previous_phase = self.current_phase
+            self.daily_exposure_minutes = self._current_exposure_minutes()
+            self._uv_activation_time = None
+            self.is_uv_active = False
+            self.current_phase = UVPhase.NONE
+            self._rebuild_status_cache()
+        
+            _LOGGER.info(f"{self.deviceName}: Deactivating UV light ({reason})")
+        
+            # Create action log
+            message = f"UV light deactivated: {reason}" if reason else "UV light deactivated"
+            lightAction = OGBLightAction(
+                Name=self.inRoom,
+                Device=self.deviceName,
+                Type="LightUV",
+                Action="OFF",
+                Message=message,
+                Voltage=0,
+                Dimmable=False,
+                SunRise=False,
+                SunSet=False,
+            )
+            await self.event_manager.emit("LogForClient", lightAction, haEvent=True)
         
-        # Turn off the light
-        await self.turn_off()
+            # Turn off the light
+            await self.turn_off()
 
     async def _on_light_time_change(self, data):
         """Handle main light schedule changes - reload settings and restart scheduler."""
         _LOGGER.info(f"{self.deviceName}: Light schedule changed, reloading settings")
         
         # CRITICAL: Stop existing scheduler before reloading
-        if self._schedule_task and not self._schedule_task.done():
+        if self._boundary_unsub is not None:
             _LOGGER.info(f"{self.deviceName}: Stopping scheduler for time change reload")
-            self._schedule_task.cancel()
-            self._schedule_task = None
+            self._stop_scheduler()
         
         # Reload settings - this will restart scheduler if needed
         self._load_settings()
@@ -540,7 +660,7 @@ class LightUV(Light):
     async def _on_main_light_toggle(self, lightState):
         """Handle main light toggle events with intelligent filtering."""
         # CRITICAL: Check if enabled FIRST
-        if not getattr(self, 'enabled', True):
+        if not self.enabled:
             _LOGGER.debug(f"{self.deviceName}: Ignoring toggleLight (disabled)")
             return
 
@@ -557,17 +677,22 @@ class LightUV(Light):
 
         # Store the main light state for UV scheduling
         self.islightON = target_state
-
-        # If this device is not targeted, ignore the event completely
-        if not is_targeted:
-            _LOGGER.debug(f"{self.deviceName}: Not targeted by toggleLight event, ignoring")
-            return
+        self._refresh_main_light_snapshot()
 
         # CRITICAL: Only respond to ToggleLight if mode is ALWAYS_ON
         # If mode is SCHEDULE, our scheduler handles timing - ignore ToggleLight
         # If mode is ALWAYS_OFF or MANUAL, never respond to ToggleLight
         if self.mode == UVMode.SCHEDULE:
-            _LOGGER.debug(f"{self.deviceName}: Ignoring toggleLight in Schedule mode (using dedicated scheduling)")
+            # Scheduler sleeps until the next window boundary - wake it so it sees the new light state.
+            # Auch wenn nur die Hauptlichter in target_devices stehen: deren Zustand bestimmt das UV-Fenster
+            _LOGGER.debug(f"{self.deviceName}: toggleLight in Schedule mode - re-evaluating UV window")
+            if self._boundary_unsub is not None:
+                await self._restart_scheduler()
+            return
+
+        # If this device is not targeted, ignore the event completely
+        if not is_targeted:
+            _LOGGER.debug(f"{self.deviceName}: Not targeted by toggleLight event, ignoring")
             return
 
         if self.mode == UVMode.ALWAYS_OFF:
@@ -587,9 +712,9 @@ class LightUV(Light):
             else:
                 # Main lights coming on - activate UV
                 if not self.is_uv_active:
-                    await self._activate_uv('always_on')
+                    await self._activate_uv(UVPhase.ALWAYS_ON)
 
-        _LOGGER.debug(f"{self.deviceName}: Main light toggled to {target_state} (mode={self.mode})")
+        _LOGGER.debug(f"{self.deviceName}: Main light toggled to {target_state} (mode={self.mode.label})")
 
     async def _on_settings_update(self, data):
         """Handle UV settings updates from UI."""
@@ -599,10 +724,10 @@ class LightUV(Light):
             # Update mode
             if "mode" in data:
                 old_mode = self.mode
-                self.mode = data["mode"]
+                self.mode = UVMode.from_label(data["mode"], old_mode)
                 if old_mode != self.mode:
                     settings_changed = True
-                    _LOGGER.info(f"{self.deviceName}: Mode changed from '{old_mode}' to '{self.mode}'")
+                    _LOGGER.info(f"{self.deviceName}: Mode changed from '{old_mode.label}' to '{self.mode.label}'")
                     
                     # Handle mode transitions
                     if self.mode == UVMode.ALWAYS_OFF:
@@ -612,7 +737,7 @@ class LightUV(Light):
                     elif self.mode == UVMode.ALWAYS_ON and self.islightON:
                         # Switching to Always On while lights are on - activate
                         if not self.is_uv_active:
-                            await self._activate_uv('always_on')
+                            await self._activate_uv(UVPhase.ALWAYS_ON)
                     elif self.mode == UVMode.SCHEDULE:
                         # Switching to Schedule - check window immediately
                         await self._check_schedule_window()
@@ -638,33 +763,34 @@ class LightUV(Light):
             if "intensity" in data:
                 self.intensity_percent = data["intensity"]
                 settings_changed = True
-
-            # Update midday scheduling settings
-            if "middayStartTime" in data:
-                self.midday_start_time = data["middayStartTime"]
-                settings_changed = True
-            if "middayEndTime" in data:
-                self.midday_end_time = data["middayEndTime"]
-                settings_changed = True
                 
+            if settings_changed:
+                self._refresh_timing_deltas()
+                self._cached_window = None
+                self._rebuild_status_cache()
+
+            if settings_changed and self._boundary_unsub is not None:
+                # Timing may have moved the next boundary - restart the scheduler
+                await self._restart_scheduler()
+
             if settings_changed:
                 _LOGGER.info(
                     f"{self.deviceName}: Settings updated - "
-                    f"Mode: {self.mode}, "
+                    f"Mode: {self.mode.label}, "
                     f"Delay: {self.delay_after_start_minutes}min, StopBefore: {self.stop_before_end_minutes}min, "
                     f"MaxDuration: {self.max_duration_hours}h, Intensity: {self.intensity_percent}%"
                 )
 
-    def get_status(self) -> dict:
-        """Get current UV light status."""
-        return {
+    def _rebuild_status_cache(self):
+        """Rebuild the status snapshot - called whenever mode, settings or UV state change."""
+        self._status_cache = {
             "device_name": self.deviceName,
             "device_type": "LightUV",
-            "mode": self.mode,
+            "mode": self.mode.label,
             "is_active": self.is_uv_active,
-            "current_phase": self.current_phase,
+            "current_phase": self.current_phase.name.lower() if self.current_phase else None,
             "is_running": self.isRunning,
-            "daily_exposure_minutes": self.daily_exposure_minutes,
+            "daily_exposure_minutes": 0,
             "max_duration_hours": self.max_duration_hours,
             "delay_after_start_minutes": self.delay_after_start_minutes,
             "stop_before_end_minutes": self.stop_before_end_minutes,
@@ -673,11 +799,14 @@ class LightUV(Light):
             "light_off_time": str(self.lightOffTime) if self.lightOffTime else None,
         }
 
+    def get_status(self) -> dict:
+        """Get current UV light status (cached snapshot plus live fields, as a new dict per call)."""
+        return {
+            **self._status_cache,
+            "is_running": self.isRunning,
+            "daily_exposure_minutes": round(self._current_exposure_minutes(), 1),
+        }
+
     async def cleanup(self):
-        """Cleanup tasks on shutdown."""
-        if self._schedule_task and not self._schedule_task.done():
-            self._schedule_task.cancel()
-            try:
-                await self._schedule_task
-            except asyncio.CancelledError:
-                pass
+        """Cleanup timers on shutdown."""
+        self._stop_scheduler()
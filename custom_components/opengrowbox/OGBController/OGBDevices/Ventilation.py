@@ -36,7 +36,7 @@ class Ventilation(Device):
         # Initialize min/max to defaults - will be overridden by user settings in checkMinMax
         self.minDuty = 10  # Class default
         self.maxDuty = 100  # Class default
-        self.dutyCycle = self.minDuty + ((self.maxDuty - self.minDuty) // 2 // self.steps) * self.steps
+        self.dutyCycle = self._midpoint_cached
 
         self.init()
 
@@ -75,7 +75,7 @@ class Ventilation(Device):
             self.checkMinMax(False)
             
             # Check if dutyCycle needs to be clamped to new min/max range
-            if hasattr(self, 'minDuty') and hasattr(self, 'maxDuty') and self.minDuty is not None and self.maxDuty is not None:
+            if self.minDuty is not None and self.maxDuty is not None:
                 if self.dutyCycle < self.minDuty or self.dutyCycle > self.maxDuty:
                     old_duty = self.dutyCycle
                     self.dutyCycle = max(self.minDuty, min(self.maxDuty, self.dutyCycle))
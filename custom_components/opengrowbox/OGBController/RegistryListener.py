@@ -13,8 +13,8 @@ from homeassistant.helpers.label_registry import \
 
 from .data.OGBDataClasses.OGBPublications import (OGBEventPublication,
                                              OGBVPDPublication)
-from .data.OGBParams.OGBParams import (INVALID_VALUES, RELEVANT_KEYWORDS,
-                                  RELEVANT_PREFIXES, RELEVANT_TYPES)
+from .data.OGBParams.OGBParams import (INVALID_VALUES, RELEVANT_TYPES,
+                                  is_relevant_entity)
 from .utils.lightTimeHelpers import update_light_state
 
 _LOGGER = logging.getLogger(__name__)
@@ -186,10 +186,7 @@ class OGBRegistryEvenListener:
             if not is_ogb_room_entity and entity.device_id not in devices_in_room:
                 return None
 
-            if not (
-                entity.entity_id.startswith(RELEVANT_PREFIXES)
-                or any(keyword in entity.entity_id for keyword in RELEVANT_KEYWORDS)
-            ):
+            if not is_relevant_entity(entity.entity_id):
                 return None
 
             parts = entity.entity_id.split(".")
@@ -359,10 +356,7 @@ class OGBRegistryEvenListener:
                 if not has_modbus_labels:
                     return None  # Keine Modbus-Labels → weiter ignorieren
 
-            if not (
-                entity.entity_id.startswith(RELEVANT_PREFIXES)
-                or any(keyword in entity.entity_id for keyword in RELEVANT_KEYWORDS)
-            ):
+            if not is_relevant_entity(entity.entity_id):
                 return None
 
             # Extrahiere den Gerätenamen aus `entity_id`
@@ -13,6 +13,9 @@ from ..utils.calcs import calc_Dry5Days_vpd, calc_dew_vpd
 
 _LOGGER = logging.getLogger(__name__)
 
+# Reihenfolge der Trocknungsphasen unter drying.modes.<mode>.phase
+_DRY_PHASE_ORDER = ("start", "halfTime", "endTime")
+
 
 class DryingActions:
     """Handles drying mode operations and algorithms."""
@@ -393,10 +396,9 @@ class DryingActions:
             return None
 
         # New structure: phases are "start", "halfTime", "endTime" with durationHours
-        phase_order = ["start", "halfTime", "endTime"]
         accumulated_time = 0
 
-        for phase_name in phase_order:
+        for phase_name in _DRY_PHASE_ORDER:
             if phase_name not in phases_dict:
                 continue
 
@@ -405,9 +407,8 @@ class DryingActions:
             duration_seconds = duration_hours * 3600
 
             if accumulated_time <= elapsed_seconds < accumulated_time + duration_seconds:
-                # Add timing info to the phase
-                phase["phase_name"] = phase_name
-                return phase
+                # Add timing info to a copy - the mode table is shared and read-only
+                return {**phase, "phase_name": phase_name}
 
             accumulated_time += duration_seconds
 
@@ -18,6 +18,19 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Plant-stage specific (temp, hum) weight factors (matching monolithic logic)
+_STAGE_WEIGHT_FACTORS = {
+    # Early stages: Higher temperature priority for root establishment
+    "Germination": (1.3, 0.9),
+    "EarlyVeg": (1.3, 0.9),
+    # Vegetative growth: Slightly balanced with temp emphasis
+    "MidVeg": (1.1, 1.1),
+    "LateVeg": (1.1, 1.1),
+    # Flower stages: Higher humidity priority for bud development
+    "MidFlower": (1.0, 1.25),
+    "LateFlower": (1.0, 1.25),
+}
+
 
 class OGBDampeningActions:
     """
@@ -204,8 +217,9 @@ class OGBDampeningActions:
             Tuple of (temp_weight, hum_weight)
         """
         if own_weights:
-            temp_weight = self.ogb.dataStore.getDeep("controlOptionData.weights.temp")
-            hum_weight = self.ogb.dataStore.getDeep("controlOptionData.weights.hum")
+            weights = self.ogb.dataStore.getDeep("controlOptionData.weights") or {}
+            temp_weight = weights.get("temp")
+            hum_weight = weights.get("hum")
         else:
             # Use plant-stage specific weighting
             plant_stage = self.ogb.dataStore.get("plantStage") or "MidVeg"
@@ -438,27 +452,9 @@ class OGBDampeningActions:
         Returns:
             Dictionary with temp_weight and hum_weight
         """
-        weights = {"temp": base_weight, "hum": base_weight}
-
-        # Plant-stage specific adjustments (matching monolithic logic)
-        if plant_stage in ["Germination", "EarlyVeg"]:
-            # Early stages: Higher temperature priority for root establishment
-            weights["temp"] = base_weight * 1.3
-            weights["hum"] = base_weight * 0.9
-
-        elif plant_stage in ["MidFlower", "LateFlower"]:
-            # Flower stages: Higher humidity priority for bud development
-            weights["temp"] = base_weight * 1.0
-            weights["hum"] = base_weight * 1.25
-
-        elif plant_stage in ["MidVeg", "LateVeg"]:
-            # Vegetative growth: Slightly balanced with temp emphasis
-            weights["temp"] = base_weight * 1.1
-            weights["hum"] = base_weight * 1.1
-
         # Default: use base weights (balanced growth)
-
-        return weights
+        temp_factor, hum_factor = _STAGE_WEIGHT_FACTORS.get(plant_stage, (1.0, 1.0))
+        return {"temp": base_weight * temp_factor, "hum": base_weight * hum_factor}
 
     def _calculate_adaptive_cooldown(self, capability: str, deviation: float) -> float:
         """
@@ -5,7 +5,6 @@ Handles advanced control algorithms including PID, MPC, and AI-based actions
 for premium users. Provides sophisticated device control and optimization.
 """
 
-import copy
 import logging
 from typing import TYPE_CHECKING, Any, Dict, List
 
@@ -15,6 +14,15 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+def _copy_json(obj):
+    """Copy JSON-decoded data (dict/list/scalars) without copy.deepcopy's memo/reduce overhead."""
+    if isinstance(obj, dict):
+        return {key: _copy_json(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_copy_json(value) for value in obj]
+    return obj
+
+
 class OGBPremiumActions:
     """
     Premium action handling for advanced control algorithms.
@@ -64,7 +72,7 @@ class OGBPremiumActions:
             "timestamp": current_time,
             "room": self.ogb.room,
             "controllerType": "PID",
-            "pidStates": copy.deepcopy(pidStates) if pidStates else None,  # Keep pidStates as metadata
+            "pidStates": _copy_json(pidStates) if pidStates else None,  # Keep pidStates as metadata
         }
         
         for action in actionData:
@@ -1,8 +1,26 @@
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
+# CropSteering settings that carry one value per phase p0–p3
+_CS_PHASE_KEYS = (
+    "ShotIntervall",
+    "ShotDuration",
+    "ShotSum",
+    "ECTarget",
+    "ECDryBack",
+    "MoistureDryBack",
+    "MaxWeight",
+    "MinWeight",
+    "MaxEC",
+    "MinEC",
+    "VWCTarget",
+    "VWCMax",
+    "VWCMin",
+)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class LightStage:
     min: int
     max: int
@@ -12,6 +30,301 @@ class LightStage:
         return {"min": self.min, "max": self.max, "phase": self.phase}
 
 
+def _freeze(obj):
+    """Recursively turn dicts into read-only MappingProxyType views and lists into tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(value) for value in obj)
+    return obj
+
+
+# Read-only reference tables, shared by every OGBConf instead of rebuilt per room.
+# Nothing writes into them; a restored state file replaces them with plain dicts.
+_PLANT_STAGES = _freeze(
+    {
+        "Germination": {
+            "vpdRange": [0.35, 0.70],
+            "minTemp": 20,
+            "maxTemp": 24,
+            "minHumidity": 78,
+            "maxHumidity": 85,
+        },
+        "Clones": {
+            "vpdRange": [0.40, 0.85],
+            "minTemp": 20,
+            "maxTemp": 24,
+            "minHumidity": 72,
+            "maxHumidity": 80,
+        },
+        "EarlyVeg": {
+            "vpdRange": [0.60, 1.20],
+            "minTemp": 22,
+            "maxTemp": 26,
+            "minHumidity": 65,
+            "maxHumidity": 75,
+        },
+        "MidVeg": {
+            "vpdRange": [0.75, 1.45],
+            "minTemp": 23,
+            "maxTemp": 27,
+            "minHumidity": 60,
+            "maxHumidity": 72,
+        },
+        "LateVeg": {
+            "vpdRange": [0.90, 1.65],
+            "minTemp": 24,
+            "maxTemp": 27,
+            "minHumidity": 55,
+            "maxHumidity": 68,
+        },
+        "EarlyFlower": {
+            "vpdRange": [0.80, 1.55],
+            "minTemp": 22,
+            "maxTemp": 26,
+            "minHumidity": 55,
+            "maxHumidity": 68,
+        },
+        "MidFlower": {
+            "vpdRange": [0.90, 1.70],
+            "minTemp": 21,
+            "maxTemp": 25,
+            "minHumidity": 48,
+            "maxHumidity": 62,
+        },
+        "LateFlower": {
+            "vpdRange": [0.90, 1.85],
+            "minTemp": 19,
+            "maxTemp": 24,
+            "minHumidity": 42,
+            "maxHumidity": 58,
+        },
+    }
+)
+
+# LightStage is frozen, so one set of instances serves every room
+_LIGHT_PLANT_STAGES = MappingProxyType(
+    {
+        "Germination": LightStage(min=20, max=25, phase=""),
+        "Clones": LightStage(min=20, max=25, phase=""),
+        "EarlyVeg": LightStage(min=25, max=35, phase=""),
+        "MidVeg": LightStage(min=35, max=45, phase=""),
+        "LateVeg": LightStage(min=45, max=55, phase=""),
+        "EarlyFlower": LightStage(min=70, max=100, phase=""),
+        "MidFlower": LightStage(min=70, max=100, phase=""),
+        "LateFlower": LightStage(min=70, max=100, phase=""),
+    }
+)
+
+_LIGHT_PLANS = _freeze(
+    {
+        "photoperiodic": {
+            "veg": {
+                "curve": [
+                    {"week": 1, "PPFDTarget": 200, "DLITarget": 12},
+                    {"week": 2, "PPFDTarget": 300, "DLITarget": 20},
+                    {"week": 3, "PPFDTarget": 350, "DLITarget": 25},
+                    {"week": 4, "PPFDTarget": 400, "DLITarget": 30},
+                ],
+            },
+            "flower": {
+                "curve": [
+                    {"week": 1, "PPFDTarget": 450, "DLITarget": 25},
+                    {"week": 2, "PPFDTarget": 600, "DLITarget": 35},
+                    {"week": 3, "PPFDTarget": 700, "DLITarget": 40},
+                    {"week": 4, "PPFDTarget": 800, "DLITarget": 45},
+                    {"week": 5, "PPFDTarget": 850, "DLITarget": 48},
+                    {"week": 6, "PPFDTarget": 900, "DLITarget": 50},
+                    {"week": 7, "PPFDTarget": 900, "DLITarget": 50},
+                    {"week": 8, "PPFDTarget": 900, "DLITarget": 50},
+                ],
+            },
+        },
+        "auto": {
+            "Seedling": {
+                "curve": [
+                    {"week": 1, "PPFDTarget": 200, "DLITarget": 12},
+                    {"week": 2, "PPFDTarget": 250, "DLITarget": 16},
+                ],
+            },
+            "veg": {
+                "curve": [
+                    {"week": 1, "PPFDTarget": 200, "DLITarget": 20},
+                    {"week": 2, "PPFDTarget": 300, "DLITarget": 30},
+                    {"week": 3, "PPFDTarget": 700, "DLITarget": 40},
+                    {"week": 4, "PPFDTarget": 800, "DLITarget": 45},
+                ],
+            },
+            "flower": {
+                "curve": [
+                    {"week": 1, "PPFDTarget": 500, "DLITarget": 45},
+                ],
+            },
+            "maturing": {
+                "curve": [
+                    {"week": 1, "PPFDTarget": 700, "DLITarget": 40},
+                    {"week": 2, "PPFDTarget": 550, "DLITarget": 36},
+                    {"week": 3, "PPFDTarget": 400, "DLITarget": 32},
+                ],
+            },
+        },
+    }
+)
+
+_LIGHT_LED_TYPES = _freeze(
+    {
+        "fullspektrum_grow": 15,
+        "quantum_board": 16,
+        "red_blue_grow": 12,
+        "high_end_grow": 18,
+        "cob_grow": 20,
+        "hps_equivalent": 15,
+        "burple": 12,
+        "white_led": 54,
+        "manual": 0,
+    }
+)
+
+_DEVICE_PROFILES = _freeze(
+    {
+        "Exhaust": {
+            "type": "both",
+            "cap": "canExhaust",
+            "direction": "reduce",
+            "effect": 1.0,
+            "sideEffect": {},
+        },
+        "Intake": {
+            "type": "both",
+            "cap": "canIntake",
+            "direction": "reduce",
+            "effect": 1.0,
+            "sideEffect": {},
+        },
+        "Light": {
+            "type": "temperature",
+            "cap": "canLight",
+            "direction": "increase",
+            "effect": 1.0,
+            "sideEffect": {"type": "temperature", "direction": "increase"},
+        },
+        "Ventilation": {
+            "type": "both",
+            "cap": "canVentilate",
+            "direction": "increase",
+            "effect": 0.5,
+            "sideEffect": {},
+        },
+        "Heater": {
+            "type": "temperature",
+            "cap": "canHeat",
+            "direction": "increase",
+            "effect": 2.0,
+            "sideEffect": {"type": "humidity", "direction": "reduce"},
+        },
+        "Cooler": {
+            "type": "temperature",
+            "cap": "canCool",
+            "direction": "reduce",
+            "effect": 2.0,
+            "sideEffect": {"type": "humidity", "direction": "reduce"},
+        },
+        "Humidifier": {
+            "type": "humidity",
+            "cap": "canHumidify",
+            "direction": "increase",
+            "effect": 1.5,
+            "sideEffect": {},
+        },
+        "Dehumidifier": {
+            "type": "humidity",
+            "cap": "canDehumidify",
+            "direction": "increase",
+            "effect": 2.0,
+            "sideEffect": {"type": "temperature", "direction": "increase"},
+        },
+        "Climate": {
+            "type": "both",
+            "cap": "canClimate",
+            "direction": "increase",
+            "effect": 2.0,
+            "sideEffect": {},
+        },
+    }
+)
+
+_DRYING_MODES = _freeze(
+    {
+        "ElClassico": {
+            "isActive": False,
+            "phase": {
+                "start": {
+                    "targetTemp": 20,
+                    "targetHumidity": 62,
+                    "durationHours": 72,
+                },
+                "halfTime": {
+                    "targetTemp": 20,
+                    "targetHumidity": 60,
+                    "durationHours": 72,
+                },
+                "endTime": {
+                    "targetTemp": 20,
+                    "targetHumidity": 58,
+                    "durationHours": 72,
+                },
+            },
+        },
+        "5DayDry": {
+            "isActive": False,
+            "phase": {
+                "start": {
+                    "targetTemp": 22.2,
+                    "targetHumidity": 55,
+                    "targetVPD": 1.2,
+                    "durationHours": 48,
+                },
+                "halfTime": {
+                    "maxTemp": 23.3,
+                    "targetHumidity": 52,
+                    "targetVPD": 1.39,
+                    "durationHours": 24,
+                },
+                "endTime": {
+                    "maxTemp": 23.9,
+                    "targetHumidity": 50,
+                    "targetVPD": 1.5,
+                    "durationHours": 48,
+                },
+            },
+        },
+        "DewBased": {
+            "isActive": False,
+            "phase": {
+                "start": {
+                    "targetTemp": 20,
+                    "targetDewPoint": 12.25,
+                    "durationHours": 96,
+                },
+                "halfTime": {
+                    "targetTemp": 20,
+                    "targetDewPoint": 11.1,
+                    "durationHours": 96,
+                },
+                "endTime": {
+                    "targetTemp": 20,
+                    "targetDewPoint": 11.1,
+                    "durationHours": 48,
+                },
+            },
+        },
+    }
+)
+
+
+# Mutable per-room defaults are built from literals in their factories on purpose:
+# CPython evaluates nested dict/list literals roughly 10x faster than copy.deepcopy()
+# of a module-level template, so templates are only used for read-only tables.
 @dataclass
 class OGBConf:
     hass: Any
@@ -92,23 +405,15 @@ class OGBConf:
                 "p3": {"VWCMax": None, "VWCMin": None, "timestamp": None},
                 "LastRun": None,
             },
-            # Phase-spezifische Werte für p0–p3
+            # Phase-spezifische Werte für p0–p3 (inner literal, no per-key phase loop)
             **{
-                key: {phase: {"value": 0} for phase in ["p0", "p1", "p2", "p3"]}
-                for key in [
-                    "ShotIntervall",
-                    "ShotDuration",
-                    "ShotSum",
-                    "ECTarget",
-                    "ECDryBack",
-                    "MoistureDryBack",
-                    "MaxWeight",
-                    "MinWeight",
-                    "MaxEC",
-                    "MinEC",
-                    "VWCTarget", "VWCMax",
-                    "VWCMin",
-                ]
+                key: {
+                    "p0": {"value": 0},
+                    "p1": {"value": 0},
+                    "p2": {"value": 0},
+                    "p3": {"value": 0},
+                }
+                for key in _CS_PHASE_KEYS
             },
         }
     )
@@ -121,58 +426,7 @@ class OGBConf:
             "PPFDTarget": 0,
             "ledType": "fullspektrum_grow",
             "luxToPPFDFactor": 15.0,
-            "plans": {
-                "photoperiodic": {
-                    "veg": {
-                        "curve": [
-                            {"week": 1, "PPFDTarget": 200, "DLITarget": 12},
-                            {"week": 2, "PPFDTarget": 300, "DLITarget": 20},
-                            {"week": 3, "PPFDTarget": 350, "DLITarget": 25},
-                            {"week": 4, "PPFDTarget": 400, "DLITarget": 30},
-                        ],
-                    },
-                    "flower": {
-                        "curve": [
-                            {"week": 1, "PPFDTarget": 450, "DLITarget": 25},
-                            {"week": 2, "PPFDTarget": 600, "DLITarget": 35},
-                            {"week": 3, "PPFDTarget": 700, "DLITarget": 40},
-                            {"week": 4, "PPFDTarget": 800, "DLITarget": 45},
-                            {"week": 5, "PPFDTarget": 850, "DLITarget": 48},
-                            {"week": 6, "PPFDTarget": 900, "DLITarget": 50},
-                            {"week": 7, "PPFDTarget": 900, "DLITarget": 50},
-                            {"week": 8, "PPFDTarget": 900, "DLITarget": 50},
-                        ],
-                    },
-                },
-                "auto": {
-                    "Seedling": {
-                        "curve": [
-                            {"week": 1, "PPFDTarget": 200, "DLITarget": 12},
-                            {"week": 2, "PPFDTarget": 250, "DLITarget": 16},
-                        ],
-                    },
-                    "veg": {
-                        "curve": [
-                            {"week": 1, "PPFDTarget": 200, "DLITarget": 20},
-                            {"week": 2, "PPFDTarget": 300, "DLITarget": 30},
-                            {"week": 3, "PPFDTarget": 700, "DLITarget": 40},
-                            {"week": 4, "PPFDTarget": 800, "DLITarget": 45},
-                        ],
-                    },
-                    "flower": {
-                        "curve": [
-                            {"week": 1, "PPFDTarget": 500, "DLITarget": 45},
-                        ],
-                    },
-                    "maturing": {
-                        "curve": [
-                            {"week": 1, "PPFDTarget": 700, "DLITarget": 40},
-                            {"week": 2, "PPFDTarget": 550, "DLITarget": 36},
-                            {"week": 3, "PPFDTarget": 400, "DLITarget": 32},
-                        ],
-                    },
-                },
-            },
+            "plans": _LIGHT_PLANS,
         }
     )
     specialLights: Dict[str, Any] = field(
@@ -300,66 +554,7 @@ class OGBConf:
             "OutPutFormat": "",
         }
     )
-    plantStages: Dict[str, Dict[str, Any]] = field(
-        default_factory=lambda: {
-            "Germination": {
-                "vpdRange": [0.35, 0.70],
-                "minTemp": 20,
-                "maxTemp": 24,
-                "minHumidity": 78,
-                "maxHumidity": 85,
-            },
-            "Clones": {
-                "vpdRange": [0.40, 0.85],
-                "minTemp": 20,
-                "maxTemp": 24,
-                "minHumidity": 72,
-                "maxHumidity": 80,
-            },
-            "EarlyVeg": {
-                "vpdRange": [0.60, 1.20],
-                "minTemp": 22,
-                "maxTemp": 26,
-                "minHumidity": 65,
-                "maxHumidity": 75,
-            },
-            "MidVeg": {
-                "vpdRange": [0.75, 1.45],
-                "minTemp": 23,
-                "maxTemp": 27,
-                "minHumidity": 60,
-                "maxHumidity": 72,
-            },
-            "LateVeg": {
-                "vpdRange": [0.90, 1.65],
-                "minTemp": 24,
-                "maxTemp": 27,
-                "minHumidity": 55,
-                "maxHumidity": 68,
-            },
-            "EarlyFlower": {
-                "vpdRange": [0.80, 1.55],
-                "minTemp": 22,
-                "maxTemp": 26,
-                "minHumidity": 55,
-                "maxHumidity": 68,
-            },
-            "MidFlower": {
-                "vpdRange": [0.90, 1.70],
-                "minTemp": 21,
-                "maxTemp": 25,
-                "minHumidity": 48,
-                "maxHumidity": 62,
-            },
-            "LateFlower": {
-                "vpdRange": [0.90, 1.85],
-                "minTemp": 19,
-                "maxTemp": 24,
-                "minHumidity": 42,
-                "maxHumidity": 58,
-            },
-        }
-    )
+    plantStages: Mapping[str, Any] = field(default_factory=lambda: _PLANT_STAGES)
     plantDates: Dict[str, Any] = field(
         default_factory=lambda: {
             "isGrowing": False,
@@ -372,32 +567,11 @@ class OGBConf:
             "hasEndet": False,
         }
     )
-    lightPlantStages: Dict[str, LightStage] = field(
-        default_factory=lambda: {
-            "Germination": LightStage(min=20, max=25, phase=""),
-            "Clones": LightStage(min=20, max=25, phase=""),
-            "EarlyVeg": LightStage(min=25, max=35, phase=""),
-            "MidVeg": LightStage(min=35, max=45, phase=""),
-            "LateVeg": LightStage(min=45, max=55, phase=""),
-            "EarlyFlower": LightStage(min=70, max=100, phase=""),
-            "MidFlower": LightStage(min=70, max=100, phase=""),
-            "LateFlower": LightStage(min=70, max=100, phase=""),
-        }
+    lightPlantStages: Mapping[str, LightStage] = field(
+        default_factory=lambda: _LIGHT_PLANT_STAGES
     )
 
-    lightLedTyes: Dict[str, Any] = field(
-        default_factory=lambda: {
-            "fullspektrum_grow": 15,
-            "quantum_board": 16,
-            "red_blue_grow": 12,
-            "high_end_grow": 18,
-            "cob_grow": 20,
-            "hps_equivalent": 15,
-            "burple": 12,
-            "white_led": 54,
-            "manual": 0,
-        }
-    )
+    lightLedTyes: Mapping[str, Any] = field(default_factory=lambda: _LIGHT_LED_TYPES)
 
     # Premium subscription data (from API login)
     # Contains: plan_name, features, limits, usage
@@ -428,71 +602,7 @@ class OGBConf:
             "vaporPressureActual": None,
             "vaporPressureSaturation": None,
             "5DayDryVPD": None,
-            "modes": {
-                "ElClassico": {
-                    "isActive": False,
-                    "phase": {
-                        "start": {
-                            "targetTemp": 20,
-                            "targetHumidity": 62,
-                            "durationHours": 72,
-                        },
-                        "halfTime": {
-                            "targetTemp": 20,
-                            "targetHumidity": 60,
-                            "durationHours": 72,
-                        },
-                        "endTime": {
-                            "targetTemp": 20,
-                            "targetHumidity": 58,
-                            "durationHours": 72,
-                        },
-                    },
-                },
-                "5DayDry": {
-                    "isActive": False,
-                    "phase": {
-                        "start": {
-                            "targetTemp": 22.2,
-                            "targetHumidity": 55,
-                            "targetVPD": 1.2,
-                            "durationHours": 48,
-                        },
-                        "halfTime": {
-                            "maxTemp": 23.3,
-                            "targetHumidity": 52,
-                            "targetVPD": 1.39,
-                            "durationHours": 24,
-                        },
-                        "endTime": {
-                            "maxTemp": 23.9,
-                            "targetHumidity": 50,
-                            "targetVPD": 1.5,
-                            "durationHours": 48,
-                        },
-                    },
-                },
-                "DewBased": {
-                    "isActive": False,
-                    "phase": {
-                        "start": {
-                            "targetTemp": 20,
-                            "targetDewPoint": 12.25,
-                            "durationHours": 96,
-                        },
-                        "halfTime": {
-                            "targetTemp": 20,
-                            "targetDewPoint": 11.1,
-                            "durationHours": 96,
-                        },
-                        "endTime": {
-                            "targetTemp": 20,
-                            "targetDewPoint": 11.1,
-                            "durationHours": 48,
-                        },
-                    },
-                },
-            },
+            "modes": _DRYING_MODES,
         }
     )
     workData: Dict[str, List[Any]] = field(
@@ -533,73 +643,7 @@ class OGBConf:
             },
         }
     )
-    DeviceProfiles: Dict[str, Dict[str, Any]] = field(
-        default_factory=lambda: {
-            "Exhaust": {
-                "type": "both",
-                "cap": "canExhaust",
-                "direction": "reduce",
-                "effect": 1.0,
-                "sideEffect": {},
-            },
-            "Intake": {
-                "type": "both",
-                "cap": "canIntake",
-                "direction": "reduce",
-                "effect": 1.0,
-                "sideEffect": {},
-            },
-            "Light": {
-                "type": "temperature",
-                "cap": "canLight",
-                "direction": "increase",
-                "effect": 1.0,
-                "sideEffect": {"type": "temperature", "direction": "increase"},
-            },
-            "Ventilation": {
-                "type": "both",
-                "cap": "canVentilate",
-                "direction": "increase",
-                "effect": 0.5,
-                "sideEffect": {},
-            },
-            "Heater": {
-                "type": "temperature",
-                "cap": "canHeat",
-                "direction": "increase",
-                "effect": 2.0,
-                "sideEffect": {"type": "humidity", "direction": "reduce"},
-            },
-            "Cooler": {
-                "type": "temperature",
-                "cap": "canCool",
-                "direction": "reduce",
-                "effect": 2.0,
-                "sideEffect": {"type": "humidity", "direction": "reduce"},
-            },
-            "Humidifier": {
-                "type": "humidity",
-                "cap": "canHumidify",
-                "direction": "increase",
-                "effect": 1.5,
-                "sideEffect": {},
-            },
-            "Dehumidifier": {
-                "type": "humidity",
-                "cap": "canDehumidify",
-                "direction": "increase",
-                "effect": 2.0,
-                "sideEffect": {"type": "temperature", "direction": "increase"},
-            },
-            "Climate": {
-                "type": "both",
-                "cap": "canClimate",
-                "direction": "increase",
-                "effect": 2.0,
-                "sideEffect": {},
-            },
-        }
-    )
+    DeviceProfiles: Mapping[str, Any] = field(default_factory=lambda: _DEVICE_PROFILES)
 
     def __post_init__(self):
         """Wird nach der Initialisierung aufgerufen, um hass zu setzen"""
@@ -1,3 +1,7 @@
+import re
+from functools import lru_cache
+from types import MappingProxyType
+
 ## INT DATA
 RELEVANT_PREFIXES = (
     "number.",
@@ -32,19 +36,29 @@ RELEVANT_KEYWORDS = (
     "water",
     "medium,",
 )
+# Alle Keywords in einem Pattern - eine Suche statt einer `in`-Prüfung pro Keyword.
+# Für die Relevanzprüfung is_relevant_entity() verwenden statt RELEVANT_KEYWORDS zu iterieren.
+RELEVANT_KEYWORD_RE = re.compile("|".join(re.escape(keyword) for keyword in RELEVANT_KEYWORDS))
+
+
+def is_relevant_entity(entity_id):
+    """Prüft, ob eine Entity über Prefix oder Keyword für OGB relevant ist."""
+    return entity_id.startswith(RELEVANT_PREFIXES) or RELEVANT_KEYWORD_RE.search(entity_id) is not None
+
+
 RELEVANT_TYPES = {
     "temperature": "Temperature entity found",
     "humidity": "Humidity entity found",
     "dewpoint": "Dewpoint entity found",
 }
 
-INVALID_VALUES = [None, "unknown", "unavailable", "Unbekannt"]
+INVALID_VALUES = frozenset((None, "unknown", "unavailable", "Unbekannt"))
 
 # Device-Type Defintion and Mapping List
 # Note: Order matters! More specific types should come before generic ones.
 # Special lights (light_fr, light_uv, etc.) must be checked BEFORE generic "light"
 DEVICE_TYPE_MAPPING = {
-    "Sensor": [
+    "Sensor": (
         "ogb",
         "sensor",
         "temperature",
@@ -59,75 +73,129 @@ DEVICE_TYPE_MAPPING = {
         "govee",
         "ens160",
         "tasmota",
-    ],
-    "Exhaust": ["exhaust", "abluft"],
-    "Intake": ["intake", "zuluft"],
-    "Ventilation": ["vent", "vents", "venti", "ventilation", "inlet"],
-    "Dehumidifier": ["dehumidifier", "entfeuchter"],
-    "Humidifier": ["humidifier", "befeuchter"],
-    "Heater": ["heater", "heizung"],
-    "Cooler": ["cooler", "kuehler"],
-    "Climate": ["climate", "klima"],
+    ),
+    "Exhaust": ("exhaust", "abluft"),
+    "Intake": ("intake", "zuluft"),
+    "Ventilation": ("vent", "vents", "venti", "ventilation", "inlet"),
+    "Dehumidifier": ("dehumidifier", "entfeuchter"),
+    "Humidifier": ("humidifier", "befeuchter"),
+    "Heater": ("heater", "heizung"),
+    "Cooler": ("cooler", "kuehler"),
+    "Climate": ("climate", "klima"),
     # Special light types - must be checked BEFORE generic Light
-    "LightFarRed": ["light_fr", "light_farred", "farred", "far_red", "farredlight", "far-red-light", "lightfarred"],
-    "LightUV": ["light_uv", "light_uvb", "light_uva", "uvlight", "uvlight", "uv-light", "lightuv"],
-    "LightBlue": ["light_blue", "blue_led", "bluelight", "bluelight", "blue-light", "lightblue"],
-    "LightRed": ["light_red", "red_led", "redlight", "redlight", "red-light", "lightred"],
+    "LightFarRed": ("light_fr", "light_farred", "farred", "far_red", "farredlight", "far-red-light", "lightfarred"),
+    "LightUV": ("light_uv", "light_uvb", "light_uva", "uvlight", "uvlight", "uv-light", "lightuv"),
+    "LightBlue": ("light_blue", "blue_led", "bluelight", "bluelight", "blue-light", "lightblue"),
+    "LightRed": ("light_red", "red_led", "redlight", "redlight", "red-light", "lightred"),
     # Generic light - checked last
-    "Light": ["light", "lamp", "led"],
-    "CO2": ["co2", "carbon"],
-    "Camera": ["camera", "kamera", "cam", "video", "ipcam", "webcam", "surveillance"],
-    "Pump": ["pump", "dripper", "feedsystem", "tank"],
-    "Switch": ["generic", "switch"],
-    "Fridge": ["fridge", "kuehlschrank"],
+    "Light": ("light", "lamp", "led"),
+    "CO2": ("co2", "carbon"),
+    "Camera": ("camera", "kamera", "cam", "video", "ipcam", "webcam", "surveillance"),
+    "Pump": ("pump", "dripper", "feedsystem", "tank"),
+    "Switch": ("generic", "switch"),
+    "Fridge": ("fridge", "kuehlschrank"),
     # Modbus devices
-    "ModbusDevice": ["modbus", "modbus_device", "modbus_rtu", "modbus_tcp"],
-    "ModbusSensor": ["modbus_sensor", "modbus_temp", "modbus_humidity"],
+    "ModbusDevice": ("modbus", "modbus_device", "modbus_rtu", "modbus_tcp"),
+    "ModbusSensor": ("modbus_sensor", "modbus_temp", "modbus_humidity"),
     # FridgeGrow / Plantalytix devices - identified by label combination
     # Device must have "fridgegrow" or "plantalytix" label + output type label
-    "FridgeGrow": ["fridgegrow", "plantalytix"],
+    "FridgeGrow": ("fridgegrow", "plantalytix"),
 }
 
+# Spezielle Lichttypen, die bei Contains-Matches VOR allen anderen Typen geprüft werden
+PRIORITY_DEVICE_TYPES = ("LightFarRed", "LightUV", "LightBlue", "LightRed")
+
+# (keyword, device_type) in Match-Reihenfolge: erst PRIORITY_DEVICE_TYPES, dann der Rest
+# in DEVICE_TYPE_MAPPING-Reihenfolge. Der erste Treffer entspricht damit dem ersten Typ,
+# bei dem irgendein Keyword passt.
+_DEVICE_CONTAINS_KEYWORDS = tuple(
+    (keyword, device_type)
+    for device_type in (
+        *PRIORITY_DEVICE_TYPES,
+        *(t for t in DEVICE_TYPE_MAPPING if t not in PRIORITY_DEVICE_TYPES),
+    )
+    for keyword in DEVICE_TYPE_MAPPING[device_type]
+)
+
+# Exakter Keyword -> Gerätetyp Index in derselben Reihenfolge; bei doppelten Keywords gewinnt
+# der erste Eintrag (spezielle Lichter vor allen anderen)
+_TOKEN_TO_TYPE = {}
+for _keyword, _device_type in _DEVICE_CONTAINS_KEYWORDS:
+    _TOKEN_TO_TYPE.setdefault(_keyword, _device_type)
+del _keyword, _device_type
+
+
+def lookup_device_type(token):
+    """Gerätetyp für ein exakt passendes (kleingeschriebenes) Keyword, sonst None."""
+    return _TOKEN_TO_TYPE.get(token)
+
+
+def classify_device(name_lower):
+    """
+    Ermittelt den Gerätetyp über Contains-Matching gegen DEVICE_TYPE_MAPPING.
+
+    Spezielle Lichter (PRIORITY_DEVICE_TYPES) gewinnen vor allen anderen Typen,
+    danach gilt die Reihenfolge von DEVICE_TYPE_MAPPING.
+
+    Args:
+        name_lower: Bereits kleingeschriebener Geräte- oder Labelname
+
+    Returns:
+        str | None: Gerätetyp oder None wenn nichts passt
+    """
+    for keyword, device_type in _DEVICE_CONTAINS_KEYWORDS:
+        if keyword in name_lower:
+            return device_type
+    return None
+
+
 # OGB ROOM DEVICE-CAPS Defintion and Mapping List
 CAP_MAPPING = {
-    "canHeat": ["heater"],
-    "canCool": ["cooler"],
-    "canClimate": ["climate"],
-    "canHumidify": ["humidifier"],
-    "canDehumidify": ["dehumidifier"],
-    "canVentilate": ["ventilation"],
-    "canExhaust": ["exhaust"],
-    "canIntake": ["intake"],
-    "canLight": ["light"],
-    "canCO2": ["co2"],
-    "canPump": ["pump"],
+    "canHeat": ("heater",),
+    "canCool": ("cooler",),
+    "canClimate": ("climate",),
+    "canHumidify": ("humidifier",),
+    "canDehumidify": ("dehumidifier",),
+    "canVentilate": ("ventilation",),
+    "canExhaust": ("exhaust",),
+    "canIntake": ("intake",),
+    "canLight": ("light",),
+    "canCO2": ("co2",),
+    "canPump": ("pump",),
 }
 
+# Umgekehrter Index: kleingeschriebener Gerätetyp -> Capabilities (Reihenfolge wie CAP_MAPPING)
+TYPE_TO_CAPS = {}
+for _cap, _cap_types in CAP_MAPPING.items():
+    for _cap_type in _cap_types:
+        TYPE_TO_CAPS[_cap_type.lower()] = TYPE_TO_CAPS.get(_cap_type.lower(), ()) + (_cap,)
+del _cap, _cap_types, _cap_type
+
 # Sensor-Kontexte definieren
 SENSOR_CONTEXTS = {
     "air": {
         "name": "Air/Ambient",
         "description": "Luftbasierte Sensoren (Umgebung, Growbox)",
         "icon": "mdi:weather-partly-cloudy",
-        "suffixes": ["", "air", "luft", "umgebung"],
+        "suffixes": ("", "air", "luft", "umgebung"),
     },
     "leaf": {
         "name": "Leaf/Blatt",
         "description": "Blattbasierte Sensoren (Plant, Growbox)",
         "icon": "mdi:weather-partly-cloudy",
-        "suffixes": ["", "leaf", "blatt"],
+        "suffixes": ("", "leaf", "blatt"),
     },
     "water": {
         "name": "Water/Hydro",
         "description": "Wasserbasierte Sensoren (Hydroponik, Reservoir)",
         "icon": "mdi:water",
-        "suffixes": ["water", "hydro", "reservoir", "wasser", "tank"],
+        "suffixes": ("water", "hydro", "reservoir", "wasser", "tank"),
     },
     "soil": {
         "name": "Soil/Substrate",
         "description": "Bodenbasierte Sensoren (Erde, Substrat)",
         "icon": "mdi:flower",
-        "suffixes": [
+        "suffixes": (
             "soil",
             "substrate",
             "ground",
@@ -137,7 +205,7 @@ SENSOR_CONTEXTS = {
             "coco",
             "rockwoll",
             "medium",
-        ],
+        ),
     },
 }
 
@@ -359,6 +427,38 @@ SENSOR_TYPES = {
 }
 
 
+# Priorisierung: Manche Sensor-Typen haben IMMER einen festen Kontext
+FIXED_CONTEXT_SENSORS = {
+    "light": "air",
+    "co2": "air",
+    "dewpoint": "air",
+    "vpd": "air",
+    "humidity": "air",  # Luftfeuchtigkeit ist immer air
+    "moisture": "soil",  # Bodenfeuchtigkeit ist immer soil
+    "weight": "soil",
+    "tds": "water",
+    "salinity": "water",
+    "oxidation": "water",
+    # Medium-specific sensors (EC/pH typically in soil/substrate)
+    "ec": "soil",
+    "ph": "soil",
+    "conductivity": "soil",
+    "temperature": "soil",  # Substrate temperature sensors
+    "battery": "soil",  # Battery status for soil sensors
+    "illuminance": "soil",  # Light sensors at plant level
+}
+
+# (suffix, context) in Prioritätsreihenfolge von SENSOR_CONTEXTS, ohne leere Suffixe -
+# extract_context_from_entity läuft damit in einer flachen Schleife
+_CONTEXT_SUFFIXES = tuple(
+    (suffix, context)
+    for context, config in SENSOR_CONTEXTS.items()
+    for suffix in config["suffixes"]
+    if suffix
+)
+
+
+@lru_cache(maxsize=4096)
 def extract_context_from_entity(entity_id, sensor_type=None):
     """
     Extrahiert den Kontext aus einer Entity-ID.
@@ -372,27 +472,6 @@ def extract_context_from_entity(entity_id, sensor_type=None):
         sensor.growbox_soil_ec -> soil
         sensor.growbox_temperature -> air (default)
     """
-    # Priorisierung: Manche Sensor-Typen haben IMMER einen festen Kontext
-    FIXED_CONTEXT_SENSORS = {
-        "light": "air",
-        "co2": "air",
-        "dewpoint": "air",
-        "vpd": "air",
-        "humidity": "air",  # Luftfeuchtigkeit ist immer air
-        "moisture": "soil",  # Bodenfeuchtigkeit ist immer soil
-        "weight": "soil",
-        "tds": "water",
-        "salinity": "water",
-        "oxidation": "water",
-        # Medium-specific sensors (EC/pH typically in soil/substrate)
-        "ec": "soil",
-        "ph": "soil",
-        "conductivity": "soil",
-        "temperature": "soil",  # Substrate temperature sensors
-        "battery": "soil",  # Battery status for soil sensors
-        "illuminance": "soil",  # Light sensors at plant level
-    }
-
     # Falls Sensor-Typ bekannt und in Fixed-Liste: verwende den
     if sensor_type and sensor_type in FIXED_CONTEXT_SENSORS:
         return FIXED_CONTEXT_SENSORS[sensor_type]
@@ -400,15 +479,39 @@ def extract_context_from_entity(entity_id, sensor_type=None):
     entity_lower = entity_id.lower()
 
     # Prüfe alle Kontext-Suffixe
-    for context, config in SENSOR_CONTEXTS.items():
-        for suffix in config["suffixes"]:
-            if suffix and suffix in entity_lower:
-                return context
+    for suffix, context in _CONTEXT_SUFFIXES:
+        if suffix in entity_lower:
+            return context
 
     # Standard: air
     return "air"
 
 
+def _build_sensor_config_table():
+    """
+    Merged die Basis- und Kontext-Konfiguration jedes Sensor-Typs einmalig beim Import.
+
+    Schlüssel ist (sensor_type, context); (sensor_type, None) enthält den Fallback
+    auf den ersten verfügbaren Kontext.
+    """
+    table = {}
+    for sensor_type, type_config in SENSOR_TYPES.items():
+        base_config = {k: v for k, v in type_config.items() if k != "contexts"}
+        contexts = type_config.get("contexts") or {}
+
+        for context, context_config in contexts.items():
+            table[(sensor_type, context)] = MappingProxyType({**base_config, **context_config})
+
+        if contexts:
+            table[(sensor_type, None)] = table[(sensor_type, next(iter(contexts)))]
+        else:
+            table[(sensor_type, None)] = MappingProxyType(base_config)
+    return table
+
+
+_SENSOR_CONFIG_TABLE = _build_sensor_config_table()
+
+
 # Hilfsfunktion: Kontext-spezifische Konfiguration holen
 def get_sensor_config(sensor_type, context="air"):
     """
@@ -419,30 +522,12 @@ def get_sensor_config(sensor_type, context="air"):
         context: Der Kontext (z.B. "water", "soil", "air")
 
     Returns:
-        dict: Vollständige Sensor-Konfiguration
+        Mapping: Vollständige Sensor-Konfiguration (read-only) oder None
     """
-    if sensor_type not in SENSOR_TYPES:
-        return None
-
-    base_config = SENSOR_TYPES[sensor_type].copy()
-
-    # Kontext-spezifische Werte holen
-    if "contexts" in base_config and context in base_config["contexts"]:
-        context_config = base_config["contexts"][context]
-        base_config.update(context_config)
-
-    # Fallback zu "air" wenn Kontext nicht unterstützt
-    elif "contexts" in base_config and context not in base_config["contexts"]:
-        available_contexts = list(base_config["contexts"].keys())
-        if available_contexts:
-            default_context = available_contexts[0]
-            context_config = base_config["contexts"][default_context]
-            base_config.update(context_config)
-
-    # contexts-Dict entfernen (nicht mehr benötigt)
-    base_config.pop("contexts", None)
-
-    return base_config
+    # Fallback auf den ersten Kontext wenn Kontext nicht unterstützt
+    return _SENSOR_CONFIG_TABLE.get((sensor_type, context)) or _SENSOR_CONFIG_TABLE.get(
+        (sensor_type, None)
+    )
 
 
 ## VPD Intervals
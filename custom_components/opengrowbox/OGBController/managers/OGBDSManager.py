@@ -1,11 +1,35 @@
+import ast
 import asyncio
+import hashlib
+import heapq
 import json
 import logging
 import os
+import re
 from typing import Any, Dict, List
 
+import orjson
+
 _LOGGER = logging.getLogger(__name__)
 
+# SaveState-Events innerhalb dieses Fensters werden zu einem Schreibvorgang zusammengefasst
+SAVE_DEBOUNCE_SECONDS = 2.0
+
+# Bereits angelegte Speicherverzeichnisse - makedirs nur einmal pro Prozess
+_DIRS_CREATED: set = set()
+
+# orjson kommt mit Home Assistant mit; NON_STR_KEYS entspricht json.dumps' Key-Konvertierung
+_ORJSON_SAVE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def _loads_state(raw: bytes) -> Any:
+    """Parse a state file, falling back to stdlib json for legacy NaN/Infinity values."""
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # Ältere Dateien wurden mit json.dumps geschrieben und können NaN enthalten
+        return json.loads(raw)
+
 
 def _is_corrupted_tuple_string(value: Any) -> bool:
     """Detect if a value is a corrupted tuple string.
@@ -26,6 +50,71 @@ def _is_corrupted_tuple_string(value: Any) -> bool:
     return False
 
 
+# Fallback-Werte für kaputte oder ungültige Medium-Ranges
+_RANGE_DEFAULTS = {"ph_range": (5.5, 7.0), "ec_range": (1.0, 2.5)}
+
+# Schneller Pfad für "(5.5, 6.5)" - literal_eval nur wenn das Muster nicht passt
+_RANGE_RE = re.compile(r"^\(\s*([-+0-9.eE]+)\s*,\s*([-+0-9.eE]+)\s*\)$")
+
+
+def _parse_range_string(val: str) -> Any:
+    """Parse a "(min, max)" string; returns the parsed value or raises like literal_eval."""
+    match = _RANGE_RE.match(val)
+    if match:
+        try:
+            return (float(match[1]), float(match[2]))
+        except ValueError:
+            pass
+    return ast.literal_eval(val)
+
+
+def _normalize_mediums(mediums: List[Any], room: str) -> List[Dict[str, Any]]:
+    """Repair ph_range/ec_range of every medium in place and drop non-dict entries.
+
+    Shared by the load path and the save path, so both apply the same rules:
+    - tuples become lists
+    - corrupted tuple strings fall back to the defaults
+    - "(5.5, 6.5)" strings are parsed back into lists
+    - lists that are not [min, max] fall back to the defaults
+    """
+    normalized = []
+    for medium in mediums:
+        if not isinstance(medium, dict):
+            continue
+
+        props = medium.get("properties", {})
+        if isinstance(props, dict):
+            for key, default in _RANGE_DEFAULTS.items():
+                val = props.get(key)
+                if isinstance(val, list):
+                    if len(val) != 2:
+                        _LOGGER.warning(f"[{room}] Invalid {key} list length, using default")
+                        props[key] = list(default)
+                elif isinstance(val, tuple):
+                    props[key] = list(val)
+                elif isinstance(val, str):
+                    if _is_corrupted_tuple_string(val):
+                        _LOGGER.warning(f"[{room}] Fixing corrupted {key} in medium '{medium.get('name')}'")
+                        props[key] = list(default)
+                    elif val.startswith("(") and val.endswith(")"):
+                        # Try to parse "(5.5, 6.5)" format
+                        try:
+                            parsed = _parse_range_string(val)
+                        except Exception:
+                            _LOGGER.warning(f"[{room}] Could not parse {key}, using default")
+                            props[key] = list(default)
+                        else:
+                            if isinstance(parsed, tuple) and len(parsed) == 2:
+                                props[key] = list(parsed)
+                                _LOGGER.info(f"[{room}] Converted {key} from string to list: {props[key]}")
+
+            medium["properties"] = props
+
+        normalized.append(medium)
+
+    return normalized
+
+
 def _clean_corrupted_data(data: Dict[str, Any], room: str) -> Dict[str, Any]:
     """Clean corrupted data in loaded state.
     
@@ -40,44 +129,8 @@ def _clean_corrupted_data(data: Dict[str, Any], room: str) -> Dict[str, Any]:
     
     # Clean growMediums
     if "growMediums" in data and isinstance(data["growMediums"], list):
-        cleaned_mediums = []
-        for medium in data["growMediums"]:
-            if not isinstance(medium, dict):
-                continue
-            
-            # Check for corrupted properties
-            props = medium.get("properties", {})
-            if isinstance(props, dict):
-                # Fix corrupted ph_range
-                if _is_corrupted_tuple_string(props.get("ph_range")):
-                    _LOGGER.warning(f"[{room}] Fixing corrupted ph_range in medium '{medium.get('name')}'")
-                    props["ph_range"] = [5.5, 7.0]  # Default value
-                
-                # Fix corrupted ec_range
-                if _is_corrupted_tuple_string(props.get("ec_range")):
-                    _LOGGER.warning(f"[{room}] Fixing corrupted ec_range in medium '{medium.get('name')}'")
-                    props["ec_range"] = [1.0, 2.5]  # Default value
-                
-                # Convert any remaining tuple-like strings to proper lists
-                for key in ["ph_range", "ec_range"]:
-                    val = props.get(key)
-                    if isinstance(val, str) and val.startswith("(") and val.endswith(")"):
-                        try:
-                            # Try to parse "(5.5, 6.5)" format
-                            parsed = eval(val)  # Safe here since we validated format
-                            if isinstance(parsed, tuple) and len(parsed) == 2:
-                                props[key] = list(parsed)
-                                _LOGGER.info(f"[{room}] Converted {key} from string to list: {props[key]}")
-                        except:
-                            _LOGGER.warning(f"[{room}] Could not parse {key}, using default")
-                            props[key] = [5.5, 7.0] if key == "ph_range" else [1.0, 2.5]
-                
-                medium["properties"] = props
-            
-            cleaned_mediums.append(medium)
-        
-        data["growMediums"] = cleaned_mediums
-        _LOGGER.info(f"[{room}] Cleaned {len(cleaned_mediums)} mediums in loaded state")
+        data["growMediums"] = _normalize_mediums(data["growMediums"], room)
+        _LOGGER.info(f"[{room}] Cleaned {len(data['growMediums'])} mediums in loaded state")
     
     return data
 
@@ -95,9 +148,13 @@ class OGBDSManager:
 
         self.storage_filename = f"ogb_{self.room.lower()}_state.json"
         self.storage_path = self._get_secure_path(self.storage_filename)
+        # Hash des zuletzt geschriebenen Payloads - identische Saves werden übersprungen
+        self._last_state_hash = b""
+        self._save_task = None
+        self._save_lock = asyncio.Lock()
 
         # Events
-        self.event_manager.on("SaveState", self.saveState)
+        self.event_manager.on("SaveState", self._schedule_save)
         self.event_manager.on("LoadState", self.loadState)
         self.event_manager.on("RestoreState", self.loadState)
         self.event_manager.on("DeleteState", self.deleteState)
@@ -125,10 +182,6 @@ class OGBDSManager:
         
         Uses hass.async_add_executor_job to avoid blocking the event loop.
         """
-        if not os.path.exists(self.storage_path):
-            _LOGGER.warning(f"[{self.room}] No saved state file at {self.storage_path} - starting fresh")
-            return
-        
         try:
             # Run file I/O in executor to avoid blocking event loop
             data = await self.hass.async_add_executor_job(self._sync_load_state)
@@ -158,8 +211,7 @@ class OGBDSManager:
                 _LOGGER.warning(f"[{self.room}] Found plantsView in saved state: {plants_view}")
             
             # Load all data into datastore
-            for key, value in data.items():
-                self.data_store.set(key, value)
+            self.data_store.bulk_set(data)
             
             _LOGGER.warning(f"[{self.room}] ✅ State loaded ASYNCHRONOUSLY into datastore ({len(data)} keys)")
             
@@ -171,8 +223,11 @@ class OGBDSManager:
     def _sync_load_state(self):
         """Synchronous file read - called via executor job."""
         try:
-            with open(self.storage_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(self.storage_path, "rb") as f:
+                return _loads_state(f.read())
+        except FileNotFoundError:
+            _LOGGER.warning(f"[{self.room}] No saved state file at {self.storage_path} - starting fresh")
+            return None
         except Exception as e:
             _LOGGER.error(f"[{self.room}] Error reading state file: {e}")
             return None
@@ -180,12 +235,38 @@ class OGBDSManager:
     def _get_secure_path(self, filename: str) -> str:
         """Gibt einen sicheren Pfad unterhalb von /config/ogb_data zurück."""
         subdir = self.hass.config.path("ogb_data")
-        os.makedirs(subdir, exist_ok=True)
+        if subdir not in _DIRS_CREATED:
+            os.makedirs(subdir, exist_ok=True)
+            _DIRS_CREATED.add(subdir)
         return os.path.join(subdir, filename)
 
+    async def _schedule_save(self, data):
+        """Fasst SaveState-Bursts zusammen - der Save liest ohnehin den aktuellen Gesamt-State."""
+        if self._save_task and not self._save_task.done():
+            return
+        self._save_task = asyncio.create_task(self._debounced_save(data))
+
+    async def _debounced_save(self, data):
+        await asyncio.sleep(SAVE_DEBOUNCE_SECONDS)
+        # Vor dem Save freigeben, damit Änderungen während des Schreibens einen neuen Save planen
+        self._save_task = None
+        await self.saveState(data)
+
     async def saveState(self, data):
         """Speichert den vollständigen aktuellen State."""
+        # Direkter Aufruf (z.B. Shutdown) schreibt den aktuellen State - geplanten Save verwerfen
+        pending, self._save_task = self._save_task, None
+        if pending:
+            pending.cancel()
+
         _LOGGER.warning(f"[{self.room}] RECEIVED SaveState event: {data}")
+        # Ein Save zur Zeit: z.B. Shutdown-Save, während ein debouncter Save noch im Thread
+        # die Temp-Datei schreibt - der zweite Save wartet und nimmt danach den neuesten State
+        async with self._save_lock:
+            await self._write_state()
+
+    async def _write_state(self):
+        """Snapshot, Serialisierung und atomares Schreiben - nur unter _save_lock aufrufen."""
         try:
             state = self.data_store.getFullState()
             
@@ -193,33 +274,31 @@ class OGBDSManager:
             # This prevents saving corrupted tuple strings that cause file growth
             state = self._sanitize_state_for_save(state)
             
-            # Log key sizes for debugging unbounded growth
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                for key, value in state.items():
-                    try:
-                        key_size = len(json.dumps(value, default=str))
-                        if key_size > 5000:  # Log keys larger than 5KB
-                            _LOGGER.debug(f"[{self.room}] State key '{key}' size: {key_size} bytes")
-                    except:
-                        pass
-
             # Teste JSON-Serialisierung vor dem Speichern
             try:
-                json_string = json.dumps(state, indent=2, default=str)
-                json_size_kb = len(json_string) / 1024
-                
+                json_bytes = orjson.dumps(state, default=str, option=_ORJSON_SAVE_OPTIONS)
+                json_size_kb = len(json_bytes) / 1024
+
+                # Per-key sizes only when someone will read them - one walk for both logs
+                too_large = json_size_kb > 100
+                largest_keys = (
+                    self._largest_state_keys(state)
+                    if too_large or _LOGGER.isEnabledFor(logging.DEBUG)
+                    else ()
+                )
+
+                # Log key sizes for debugging unbounded growth
+                for key, key_size in largest_keys:
+                    if key_size > 5000:  # Log keys larger than 5KB
+                        _LOGGER.debug(f"[{self.room}] State key '{key}' size: {key_size} bytes")
+
                 # CRITICAL: Refuse to save if file is too large (indicates corruption)
-                if json_size_kb > 100:
+                if too_large:
                     _LOGGER.error(f"[{self.room}] ❌ State file too large ({json_size_kb:.1f}KB) - likely corrupted, NOT saving!")
                     _LOGGER.error(f"[{self.room}] Delete {self.storage_path} and restart to fix")
-                    # Find the largest keys for debugging
-                    for key, value in state.items():
-                        try:
-                            key_size = len(json.dumps(value, default=str)) / 1024
-                            if key_size > 10:
-                                _LOGGER.error(f"[{self.room}]   Large key: '{key}' = {key_size:.1f}KB")
-                        except:
-                            pass
+                    for key, key_size in largest_keys:
+                        if key_size > 10 * 1024:
+                            _LOGGER.error(f"[{self.room}]   Large key: '{key}' = {key_size / 1024:.1f}KB")
                     return  # Don't save corrupted state!
                 elif json_size_kb > 50:
                     _LOGGER.warning(f"[{self.room}] ⚠️ State file size: {json_size_kb:.1f}KB - consider cleanup")
@@ -229,10 +308,16 @@ class OGBDSManager:
             except Exception as json_error:
                 _LOGGER.error(f"❌ JSON serialization failed: {json_error}")
                 simplified_state = self._create_simplified_state(state)
-                json_string = json.dumps(simplified_state, indent=2, default=str)
+                json_bytes = json.dumps(simplified_state, indent=2, default=str).encode("utf-8")
                 _LOGGER.warning(f"⚠️ Saving simplified state instead")
 
-            await asyncio.to_thread(self._sync_save, json_string)
+            state_hash = hashlib.blake2b(json_bytes, digest_size=16).digest()
+            if state_hash == self._last_state_hash:
+                _LOGGER.debug(f"[{self.room}] State unchanged since last save - skipping write")
+                return
+
+            await asyncio.to_thread(self._sync_save, json_bytes)
+            self._last_state_hash = state_hash
             _LOGGER.warning(f"[{self.room}] ✅ DataStore saved to {self.storage_path}")
 
         except Exception as e:
@@ -253,33 +338,7 @@ class OGBDSManager:
         
         # Sanitize growMediums
         if "growMediums" in state and isinstance(state["growMediums"], list):
-            sanitized_mediums = []
-            for medium in state["growMediums"]:
-                if not isinstance(medium, dict):
-                    continue
-                
-                # Check properties for corrupted data
-                props = medium.get("properties", {})
-                if isinstance(props, dict):
-                    for key in ["ph_range", "ec_range"]:
-                        val = props.get(key)
-                        # Convert tuples to lists
-                        if isinstance(val, tuple):
-                            props[key] = list(val)
-                        # Fix corrupted strings
-                        elif _is_corrupted_tuple_string(val):
-                            _LOGGER.warning(f"[{self.room}] Sanitizing corrupted {key} before save")
-                            props[key] = [5.5, 7.0] if key == "ph_range" else [1.0, 2.5]
-                        # Validate list format
-                        elif isinstance(val, list) and len(val) != 2:
-                            _LOGGER.warning(f"[{self.room}] Invalid {key} list length, using default")
-                            props[key] = [5.5, 7.0] if key == "ph_range" else [1.0, 2.5]
-                    
-                    medium["properties"] = props
-                
-                sanitized_mediums.append(medium)
-            
-            state["growMediums"] = sanitized_mediums
+            state["growMediums"] = _normalize_mediums(state["growMediums"], self.room)
         
         # Ensure plantsView is present for Camera timelapse config
         if "plantsView" not in state:
@@ -294,9 +353,27 @@ class OGBDSManager:
         
         return state
 
-    def _sync_save(self, json_string):
-        with open(self.storage_path, "w", encoding="utf-8") as f:
-            f.write(json_string)
+    def _largest_state_keys(self, state: Dict[str, Any], limit: int = 5) -> List[tuple]:
+        """Serialisiert jeden Top-Level-Key einmal und liefert die größten (key, bytes) absteigend."""
+
+        def sizes():
+            for key, value in state.items():
+                try:
+                    yield key, len(orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS))
+                except Exception:
+                    continue
+
+        return heapq.nlargest(limit, sizes(), key=lambda item: item[1])
+
+    def _sync_save(self, json_bytes):
+        # Erst in eine Temp-Datei schreiben und dann atomar ersetzen - kein halbes File bei Abbruch
+        tmp_path = f"{self.storage_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json_bytes)
+            # Daten auf die Platte bringen bevor ersetzt wird - sonst droht bei Stromausfall ein leeres File
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.storage_path)
 
     def _create_simplified_state(self, state):
         """Erstelle eine vereinfachte Version des States für die Serialisierung."""
@@ -316,9 +393,6 @@ class OGBDSManager:
 
     async def loadState(self, data):
         """Lädt den Zustand aus der Datei und setzt ihn im DataStore."""
-        if not os.path.exists(self.storage_path):
-            _LOGGER.warning(f"⚠️ No saved state at {self.storage_path}")
-            return
         try:
             loaded_data = await asyncio.to_thread(self._sync_load)
             
@@ -327,25 +401,26 @@ class OGBDSManager:
             
             _LOGGER.warning(f"✅ State loaded from {self.storage_path}")
 
-            for key, value in loaded_data.items():
-                self.data_store.set(key, value)
+            self.data_store.bulk_set(loaded_data)
 
+        except FileNotFoundError:
+            _LOGGER.warning(f"⚠️ No saved state at {self.storage_path}")
         except Exception as e:
             _LOGGER.error(f"❌ Failed to load DataStore: {e}")
 
     def _sync_load(self):
-        with open(self.storage_path, "r") as f:
-            return json.load(f)
+        with open(self.storage_path, "rb") as f:
+            return _loads_state(f.read())
 
     async def deleteState(self, data):
         """Löscht die gespeicherte Datei."""
+        self._last_state_hash = b""
         try:
-            if os.path.exists(self.storage_path):
-                await asyncio.to_thread(os.remove, self.storage_path)
-                _LOGGER.warning(f"🗑️ Deleted saved state at {self.storage_path}")
-            else:
-                _LOGGER.warning(
-                    f"⚠️ No state file found to delete at {self.storage_path}"
-                )
+            await asyncio.to_thread(os.remove, self.storage_path)
+            _LOGGER.warning(f"🗑️ Deleted saved state at {self.storage_path}")
+        except FileNotFoundError:
+            _LOGGER.warning(
+                f"⚠️ No state file found to delete at {self.storage_path}"
+            )
         except Exception as e:
             _LOGGER.error(f"❌ Failed to delete state file: {e}")
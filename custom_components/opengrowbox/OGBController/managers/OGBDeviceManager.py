@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from functools import lru_cache
 
 from ..OGBDevices.Device import Device
 from ..OGBDevices.Climate import Climate
@@ -17,14 +18,95 @@ from ..OGBDevices.Light import Light
 from ..OGBDevices.LightFarRed import LightFarRed
 from ..OGBDevices.LightUV import LightUV
 from ..OGBDevices.LightSpectrum import LightBlue, LightRed
-from ..OGBDevices.ModbusDevice import OGBModbusDevice
+from ..OGBDevices.ModbusSensor import ModbusSensor
 from ..OGBDevices.Pump import Pump
 from ..OGBDevices.FridgeGrow.FridgeGrowDevice import FridgeGrowDevice
+from ..OGBDevices.Sensor import Sensor
 from ..OGBDevices.Ventilation import Ventilation
-from ..data.OGBParams.OGBParams import CAP_MAPPING, DEVICE_TYPE_MAPPING
+from ..data.OGBParams.OGBParams import (DEVICE_TYPE_MAPPING,
+                                        PRIORITY_DEVICE_TYPES, TYPE_TO_CAPS,
+                                        classify_device, lookup_device_type)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Geräte-Refresh: kurz nach Änderungen, bei ruhigem System schrittweise länger (Sekunden)
+DEVICE_REFRESH_INTERVAL = 175
+DEVICE_REFRESH_MIN_INTERVAL = 30
+DEVICE_REFRESH_MAX_INTERVAL = 600
+# Registry-Events kommen in Bursts - ein Refresh nach kurzer Ruhe reicht
+REGISTRY_REFRESH_DEBOUNCE_SECONDS = 2.0
+REGISTRY_EVENTS = ("device_registry_updated", "entity_registry_updated")
+
+# Abgeleitete Sensor-Devices (Add-on), die nie entfernt werden
+_DERIVED_SUFFIXES = ("_humidity", "_temperature", "_dewpoint")
+_FRIDGEGROW_KWS = frozenset(DEVICE_TYPE_MAPPING.get("FridgeGrow", ()))
+
+# Gerätetyp -> Geräteklasse (unbekannte Typen fallen auf Device zurück)
+_DEVICE_CLASSES = {
+    "Sensor": Sensor,
+    "ModbusSensor": ModbusSensor,
+    "Humidifier": Humidifier,
+    "Dehumidifier": Dehumidifier,
+    "Exhaust": Exhaust,
+    "Intake": Intake,
+    "Ventilation": Ventilation,
+    "Heater": Heater,
+    "Cooler": Cooler,
+    "LightFarRed": LightFarRed,
+    "LightUV": LightUV,
+    "LightBlue": LightBlue,
+    "LightRed": LightRed,
+    "Light": Light,
+    "Climate": Climate,
+    "Generic": GenericSwitch,
+    "CO2": CO2,
+    "Camera": Camera,
+    "Fridge": Fridge,
+    "Modbus": ModbusSensor,
+    "ModbusDevice": ModbusSensor,
+    "FridgeGrow": FridgeGrowDevice,
+    "Pump": Pump,
+}
+
+
+def _label_signature(labels) -> tuple:
+    """Kleingeschriebene Label-Namen in Originalreihenfolge (die Reihenfolge beeinflusst die Erkennung)."""
+    return tuple(lbl.get("name", "").lower() for lbl in labels or ())
+
+
+@lru_cache(maxsize=512)
+def _identify_type_cached(label_names: tuple, device_name_lower: str) -> tuple:
+    """
+    Keyword-based device type detection for identify_device.
+
+    Returns (device_type, source, matched_label); source is one of
+    "fridgegrow", "exact", "contains", "name" or None if nothing matched.
+    Label order matters: an exact match on any label wins, otherwise the
+    first label with a contains-match, otherwise the device name.
+    """
+    # FRIDGEGROW CHECK: "fridgegrow"/"plantalytix" label wins regardless of other labels
+    if not _FRIDGEGROW_KWS.isdisjoint(label_names):
+        return "FridgeGrow", "fridgegrow", None
+
+    contains_type = None
+    contains_label = None
+    for label_name in label_names:
+        device_type = lookup_device_type(label_name)
+        if device_type:
+            return device_type, "exact", label_name
+        if contains_type is None:
+            contains_type = classify_device(label_name)
+            contains_label = label_name
+
+    if contains_type:
+        return contains_type, "contains", contains_label
+
+    device_type = classify_device(device_name_lower)
+    if device_type:
+        return device_type, "name", None
+
+    return None, None, None
+
 
 class OGBDeviceManager:
     def __init__(self, hass, dataStore, event_manager, room, regListener):
@@ -37,10 +119,24 @@ class OGBDeviceManager:
         self.event_manager = event_manager  # Also provide snake_case version
         self.is_initialized = False
         self._devicerefresh_task: asyncio.Task | None = None
+        # Name -> Device Index über die "devices"-Liste im DataStore
+        self._devices_by_name: dict = {}
+        self._indexed_devices = None
+        self._indexed_count = 0
+        self._registry_refresh_task: asyncio.Task | None = None
+        self._registry_unsubs = []
+        # Verhindert überlappende Abgleiche (Poll-Worker und Registry-Events)
+        self._update_lock = asyncio.Lock()
         self.init()
 
         # EVENTS
         self.event_manager.on("capClean", self.capCleaner)
+        if self.hass is not None:
+            # Änderungen an Geräten/Entities/Labels sofort abgleichen statt auf den nächsten Poll zu warten
+            self._registry_unsubs = [
+                self.hass.bus.async_listen(event_type, self._on_registry_change)
+                for event_type in REGISTRY_EVENTS
+            ]
 
     def init(self):
         """initialized Device Manager."""
@@ -50,10 +146,23 @@ class OGBDeviceManager:
         self.is_initialized = True
         _LOGGER.debug("OGBDeviceManager initialized with event listeners.")
 
-    async def setupDevice(self, device):
+    def _device_index(self, devices):
+        """Name -> Device Index; wird neu aufgebaut wenn die Liste außerhalb des Managers geändert wurde."""
+        if devices is not self._indexed_devices or len(devices) != self._indexed_count:
+            # reversed: bei doppelten Namen gewinnt wie bei einem linearen Scan das erste Gerät
+            self._devices_by_name = {
+                device.deviceName: device
+                for device in reversed(devices)
+                if hasattr(device, "deviceName")
+            }
+            self._indexed_devices = devices
+            self._indexed_count = len(devices)
+        return self._devices_by_name
 
-        controlOption = self.data_store.get("mainControl")
+    async def setupDevice(self, device):
+        return await self._setupDevice(device, self.data_store.get("mainControl"))
 
+    async def _setupDevice(self, device, controlOption):
         if controlOption not in ["HomeAssistant", "Premium"]:
             _LOGGER.warning(f"Device setup skipped - mainControl '{controlOption}' not valid")
             return False
@@ -69,39 +178,29 @@ class OGBDeviceManager:
         deviceName = device.get("name", "unknown_device")
         deviceData = device.get("entities", [])
 
-        allLabels = []
         deviceLabels = device.get("labels", [])
 
-        # Labels direkt am Device (ohne entity_id)
-        for lbl in deviceLabels:
-            new_lbl = {
-                "id": lbl.get("id"),
-                "name": lbl.get("name"),
-                "scope": lbl.get("scope", "device"),
-                "entity": None,  # Keine direkte Entity-Zuordnung
-            }
-            allLabels.append(new_lbl)
-
-        # Labels von Entities mit Entity-Zuordnung
-        for entity in deviceData:
-            entity_id = entity.get("entity_id")
-            for lbl in entity.get("labels", []):
-                new_lbl = {
-                    "id": lbl.get("id"),
+        # Labels direkt am Device (entity=None) und von Entities mit Entity-Zuordnung;
+        # Duplikate (nach id + entity) fallen über den Dict-Key in einem Durchlauf weg
+        def iterLabels():
+            for lbl in deviceLabels:
+                yield None, lbl
+            for entity in deviceData:
+                entity_id = entity.get("entity_id")
+                for lbl in entity.get("labels", []):
+                    yield entity_id, lbl
+
+        uniqueByKey = {}
+        for entity_id, lbl in iterLabels():
+            lbl_id = lbl.get("id")
+            if lbl_id and (lbl_id, entity_id) not in uniqueByKey:
+                uniqueByKey[(lbl_id, entity_id)] = {
+                    "id": lbl_id,
                     "name": lbl.get("name"),
                     "scope": lbl.get("scope", "device"),
                     "entity": entity_id,
                 }
-                allLabels.append(new_lbl)
-
-        # Duplikate entfernen (nach id + entity)
-        uniqueLabels = []
-        seen = set()
-        for lbl in allLabels:
-            key = (lbl["id"], lbl["entity"])
-            if lbl["id"] and key not in seen:
-                seen.add(key)
-                uniqueLabels.append(lbl)
+        uniqueLabels = list(uniqueByKey.values())
 
         identified_device = await self.identify_device(
             deviceName, deviceData, uniqueLabels
@@ -112,59 +211,70 @@ class OGBDeviceManager:
 
         _LOGGER.debug(f"Device:->{identified_device} identification Success")
 
-        devices = self.data_store.get("devices")
-        devices.append(identified_device)
-        self.data_store.set("devices", devices)
+        # Label-Signatur merken, damit DeviceUpdater unveränderte Geräte nicht neu prüfen muss
+        identified_device.labelSignature = _label_signature(deviceLabels)
+
+        index = self._device_index(self.data_store.get("devices") or [])
+        devices = self.data_store.appendDeep("devices", identified_device)
+        index.setdefault(identified_device.deviceName, identified_device)
+        self._indexed_devices = devices
+        self._indexed_count = len(devices)
         _LOGGER.info(f"Added new device From List: {identified_device}")
         return identified_device
 
     async def removeDevice(self, deviceName: str):
         """Entfernt ein Gerät anhand des Gerätenamens aus der Geräteliste."""
+        return await self._removeDevice(deviceName, self.data_store.get("mainControl"))
 
-        controlOption = self.data_store.get("mainControl")
+    async def _removeDevice(self, deviceName: str, controlOption):
         devices = self.data_store.get("devices")
 
         if controlOption not in ["HomeAssistant", "Premium"]:
             return False
 
         # Add-on Sensoren sollen nicht entfernt werden
-        if any(
-            deviceName.endswith(suffix)
-            for suffix in ["_humidity", "_temperature", "_dewpoint"]
-        ):
+        if deviceName.endswith(_DERIVED_SUFFIXES):
             _LOGGER.debug(f"Skipped remove for derived sensor device: {deviceName}")
             return False
 
-        deviceToRemove = next(
-            (device for device in devices if device.deviceName == deviceName), None
-        )
+        index = self._device_index(devices)
+        deviceToRemove = index.pop(deviceName, None)
 
         if not deviceToRemove:
             _LOGGER.debug(f"Device not found for remove: {deviceName}")
             return False
 
-        devices.remove(deviceToRemove)
-        self.data_store.set("devices", devices)
+        self.data_store.removeDeep("devices", deviceToRemove)
+        self._indexed_count = len(devices)
+        # Doppelter Name in der Liste? Dann bleibt der nächste Eintrag im Index sichtbar
+        duplicate = next(
+            (d for d in devices if getattr(d, "deviceName", None) == deviceName), None
+        )
+        if duplicate is not None:
+            index[deviceName] = duplicate
 
         _LOGGER.warning(f"{self.room} - Removed device: {deviceName}")
 
         # Capability-Mapping anpassen
-        for cap, deviceTypes in CAP_MAPPING.items():
-            if deviceToRemove.deviceType.lower() in (dt.lower() for dt in deviceTypes):
-                capPath = f"capabilities.{cap}"
-                currentCap = self.data_store.getDeep(capPath)
-
-                if (
-                    currentCap
-                    and deviceToRemove.deviceName in currentCap["devEntities"]
-                ):
-                    currentCap["devEntities"].remove(deviceToRemove.deviceName)
-                    currentCap["count"] = max(0, currentCap["count"] - 1)
-                    currentCap["state"] = currentCap["count"] > 0
-                    self.data_store.setDeep(capPath, currentCap)
-                    _LOGGER.warning(
-                        f"{self.room} - Updated capability '{cap}' after removing device {deviceToRemove.deviceName}"
-                    )
+        updatedCaps = {}
+        for cap in TYPE_TO_CAPS.get(deviceToRemove.deviceType.lower(), ()):
+            capPath = f"capabilities.{cap}"
+            currentCap = self.data_store.getDeep(capPath)
+
+            if (
+                currentCap
+                and deviceToRemove.deviceName in currentCap["devEntities"]
+            ):
+                currentCap["devEntities"].remove(deviceToRemove.deviceName)
+                currentCap["count"] = max(0, currentCap["count"] - 1)
+                currentCap["state"] = currentCap["count"] > 0
+                updatedCaps[capPath] = currentCap
+                _LOGGER.warning(
+                    f"{self.room} - Updated capability '{cap}' after removing device {deviceToRemove.deviceName}"
+                )
+
+        if updatedCaps:
+            self.data_store.setDeepBatch(updatedCaps)
 
         return True
 
@@ -181,145 +291,55 @@ class OGBDeviceManager:
         detected_type = None
         detected_label = None
 
-        # Priority-ordered list for special types that need exact/priority matching
-        # More specific types MUST come before generic types
-        PRIORITY_DEVICE_TYPES = [
-            "LightFarRed",  # Must match before "Light"
-            "LightUV",      # Must match before "Light"
-            "LightBlue",    # Must match before "Light"
-            "LightRed",     # Must match before "Light"
-        ]
+        # Label-Namen einmal kleinschreiben; die Keyword-Suche selbst ist gecacht
+        label_names = tuple(
+            name for name in (lbl.get("name", "").lower() for lbl in device_labels or ()) if name
+        )
+        detected_type, source, matched_label = _identify_type_cached(
+            label_names, device_name.lower()
+        )
 
-        # FRIDGEGROW CHECK: If device has "fridgegrow" or "plantalytix" label,
-        # it's a FridgeGrow device regardless of other labels
-        if device_labels:
-            label_names = [lbl.get("name", "").lower() for lbl in device_labels]
-            fridgegrow_keywords = DEVICE_TYPE_MAPPING.get("FridgeGrow", [])
-            
-            if any(kw in label_names for kw in fridgegrow_keywords):
-                detected_type = "FridgeGrow"
-                detected_label = "FridgeGrow"
+        if source == "fridgegrow":
+            detected_label = "FridgeGrow"
+            _LOGGER.info(
+                f"Device '{device_name}' identified as FridgeGrow via label "
+                f"(labels: {list(label_names)})"
+            )
+        elif source == "exact":
+            detected_label = detected_type
+            if detected_type in PRIORITY_DEVICE_TYPES:
                 _LOGGER.info(
-                    f"Device '{device_name}' identified as FridgeGrow via label "
-                    f"(labels: {label_names})"
+                    f"Device '{device_name}' identified via EXACT label match as {detected_type} (label: {matched_label})"
                 )
-                
-                DeviceClass = self.get_device_class(detected_type)
-                return DeviceClass(
-                    device_name,
-                    device_data,
-                    self.event_manager,
-                    self.data_store,
-                    detected_type,
-                    self.room,
-                    self.hass,
-                    detected_label,
-                    device_labels,
+            else:
+                _LOGGER.info(
+                    f"Device '{device_name}' identified via label keyword '{matched_label}' as {detected_type}"
+                )
+        elif source == "contains":
+            detected_label = detected_type
+            if detected_type in PRIORITY_DEVICE_TYPES:
+                _LOGGER.info(
+                    f"Device '{device_name}' identified via label contains-match as {detected_type} (label: {matched_label})"
+                )
+            else:
+                _LOGGER.debug(
+                    f"Device '{device_name}' identified via label as {detected_type}"
+                )
+        elif source == "name":
+            # Fallback: Name-based identification with priority ordering
+            if detected_type in PRIORITY_DEVICE_TYPES:
+                detected_label = detected_type if not device_labels else device_labels[0].get("name", detected_type)
+                _LOGGER.info(
+                    f"Device '{device_name}' identified via name as {detected_type} (priority match)"
+                )
+            else:
+                if device_labels:
+                    detected_label = device_labels[0].get("name", "unknown")
+                else:
+                    detected_label = "EMPTY"
+                _LOGGER.warning(
+                    f"Device '{device_name}' identified via name as {detected_type}"
                 )
-
-        if device_labels:
-            for lbl in device_labels:
-                label_name = lbl.get("name", "").lower()
-                if not label_name:
-                    continue
-                
-                # First pass: Try EXACT match for special types (highest priority)
-                for device_type in PRIORITY_DEVICE_TYPES:
-                    keywords = DEVICE_TYPE_MAPPING.get(device_type, [])
-                    # Check for exact match first
-                    if label_name in keywords:
-                        detected_type = device_type
-                        detected_label = device_type
-                        _LOGGER.info(
-                            f"Device '{device_name}' identified via EXACT label match as {detected_type} (label: {label_name})"
-                        )
-                        break
-                
-                if detected_type:
-                    break
-                
-                # Second pass: Check contains match with priority ordering (skip generic Light if special lights exist)
-                for device_type, keywords in DEVICE_TYPE_MAPPING.items():
-                    if device_type in PRIORITY_DEVICE_TYPES:
-                        continue  # Skip special lights, will check all labels next
-                    if any(keyword == label_name for keyword in keywords):
-                        # Exact keyword match
-                        detected_type = device_type
-                        detected_label = device_type
-                        _LOGGER.info(
-                            f"Device '{device_name}' identified via label keyword '{label_name}' as {detected_type}"
-                        )
-                        break
-                
-                if detected_type:
-                    break
-
-        # Fallback: No exact label match found, try contains matching with priority
-        if not detected_type and device_labels:
-            for lbl in device_labels:
-                label_name = lbl.get("name", "").lower()
-                if not label_name:
-                    continue
-                
-                # Check priority types first (special lights before generic)
-                for device_type in PRIORITY_DEVICE_TYPES:
-                    keywords = DEVICE_TYPE_MAPPING.get(device_type, [])
-                    if any(keyword in label_name for keyword in keywords):
-                        detected_type = device_type
-                        detected_label = device_type
-                        _LOGGER.info(
-                            f"Device '{device_name}' identified via label contains-match as {detected_type} (label: {label_name})"
-                        )
-                        break
-                
-                if detected_type:
-                    break
-                
-                # Then check all other types
-                for device_type, keywords in DEVICE_TYPE_MAPPING.items():
-                    if device_type in PRIORITY_DEVICE_TYPES:
-                        continue  # Already checked
-                    if any(keyword in label_name for keyword in keywords):
-                        detected_type = device_type
-                        detected_label = device_type
-                        _LOGGER.debug(
-                            f"Device '{device_name}' identified via label as {detected_type}"
-                        )
-                        break
-                
-                if detected_type:
-                    break
-
-        # Fallback: Name-based identification with priority ordering
-        if not detected_type:
-            device_name_lower = device_name.lower()
-            
-            # Check priority types first (special lights before generic Light)
-            for device_type in PRIORITY_DEVICE_TYPES:
-                keywords = DEVICE_TYPE_MAPPING.get(device_type, [])
-                if any(keyword in device_name_lower for keyword in keywords):
-                    detected_type = device_type
-                    detected_label = device_type if not device_labels else device_labels[0].get("name", device_type)
-                    _LOGGER.info(
-                        f"Device '{device_name}' identified via name as {detected_type} (priority match)"
-                    )
-                    break
-            
-            # Then check all other types
-            if not detected_type:
-                for device_type, keywords in DEVICE_TYPE_MAPPING.items():
-                    if device_type in PRIORITY_DEVICE_TYPES:
-                        continue  # Already checked
-                    if any(keyword in device_name_lower for keyword in keywords):
-                        detected_type = device_type
-                        if device_labels:
-                            detected_label = device_labels[0].get("name", "unknown")
-                        else:
-                            detected_label = "EMPTY"
-                        _LOGGER.warning(
-                            f"Device '{device_name}' identified via name as {detected_type}"
-                        )
-                        break
 
         if not detected_type:
             _LOGGER.error(
@@ -342,40 +362,14 @@ class OGBDeviceManager:
 
     def get_device_class(self, device_type):
         """Geräteklasse erhalten."""
-        if device_type == "Sensor":
-            from ..OGBDevices.Sensor import Sensor
-            return Sensor
-        if device_type in ("ModbusSensor", "Modbus", "ModbusDevice"):
-            from ..OGBDevices.ModbusSensor import ModbusSensor
-            return ModbusSensor
-        
-        # Klassen ohne zyklische Abhängigkeiten
-        device_classes = {
-            "Humidifier": Humidifier,
-            "Dehumidifier": Dehumidifier,
-            "Exhaust": Exhaust,
-            "Intake": Intake,
-            "Ventilation": Ventilation,
-            "Heater": Heater,
-            "Cooler": Cooler,
-            "LightFarRed": LightFarRed,
-            "LightUV": LightUV,
-            "LightBlue": LightBlue,
-            "LightRed": LightRed,
-            "Light": Light,
-            "Climate": Climate,
-            "Generic": GenericSwitch,
-            "CO2": CO2,
-            "Camera": Camera,
-            "Fridge": Fridge,
-            "Modbus": OGBModbusDevice,
-            "ModbusDevice": OGBModbusDevice,
-            "FridgeGrow": FridgeGrowDevice,
-            "Pump": Pump,
-        }
-        return device_classes.get(device_type, Device)
+        return _DEVICE_CLASSES.get(device_type, Device)
 
     async def DeviceUpdater(self):
+        """Gleicht die Geräteliste mit der HA-Registry ab; True wenn sich etwas geändert hat."""
+        async with self._update_lock:
+            return await self._updateDevices()
+
+    async def _updateDevices(self):
         controlOption = self.data_store.get("mainControl")
 
         groupedRoomEntities = (
@@ -395,11 +389,8 @@ class OGBDeviceManager:
         currentDevices = self.data_store.get("devices") or []
         deviceLabelIdent = self.data_store.get("DeviceLabelIdent")
 
-        knownDeviceNames = {
-            device.deviceName
-            for device in currentDevices
-            if hasattr(device, "deviceName")
-        }
+        devicesByName = self._device_index(currentDevices)
+        knownDeviceNames = devicesByName.keys()
 
         realDeviceNames = {device["name"] for device in allDevices}
 
@@ -407,39 +398,25 @@ class OGBDeviceManager:
             device for device in allDevices if device["name"] not in knownDeviceNames
         ]
 
-        removedDevices = [
-            device
-            for device in currentDevices
-            if hasattr(device, "deviceName")
-            and device.deviceName not in realDeviceNames
-        ]
+        # Set-Differenz über den gepflegten Namensindex statt Scan über alle Device-Objekte
+        removedDevices = knownDeviceNames - realDeviceNames
 
         # Geräte mit geänderten Labels erkennen (nur wenn DeviceLabelIdent aktiv ist)
         devicesToReidentify = []
         if deviceLabelIdent:
             for realDevice in allDevices:
-                currentDevice = next(
-                    (
-                        d
-                        for d in currentDevices
-                        if hasattr(d, "deviceName")
-                        and d.deviceName == realDevice["name"]
-                    ),
-                    None,
-                )
+                currentDevice = devicesByName.get(realDevice["name"])
                 if currentDevice:
-                    # Vergleiche Labels
-                    realLabels = set(
-                        lbl.get("name", "").lower()
-                        for lbl in realDevice.get("labels", [])
-                    )
+                    # Vergleiche Labels - unveränderte Label-Signatur: nichts zu tun
+                    realLabels = realDevice.get("labels", [])
+                    labelSignature = _label_signature(realLabels)
+                    if getattr(currentDevice, "labelSignature", None) == labelSignature:
+                        continue
                     currentLabel = getattr(currentDevice, "deviceLabel", "EMPTY")
 
                     # Bestimme das Label, das bei der aktuellen Identifizierung erkannt würde
                     # Use same priority logic as identify_device()
-                    expected_label = self._determine_device_type_from_labels(
-                        realDevice.get("labels", [])
-                    )
+                    expected_label = self._determine_device_type_from_labels(realLabels)
 
                     # Nur neu identifizieren, wenn sich das erkannte Label tatsächlich geändert hat
                     if currentLabel != expected_label:
@@ -447,54 +424,135 @@ class OGBDeviceManager:
                         _LOGGER.warning(
                             f"Device '{realDevice['name']}' label changed from '{currentLabel}' to '{expected_label}', will be re-identified"
                         )
+                    else:
+                        currentDevice.labelSignature = labelSignature
 
         if removedDevices:
             _LOGGER.debug(f"Removing devices no longer found: {removedDevices}")
-            for device in removedDevices:
-                await self.removeDevice(device.deviceName)
+            self._log_gather_errors(
+                "remove",
+                await asyncio.gather(
+                    *(self._removeDevice(name, controlOption) for name in removedDevices),
+                    return_exceptions=True,
+                ),
+            )
 
         # Geräte mit geänderten Labels entfernen und neu hinzufügen
         if devicesToReidentify:
             _LOGGER.warning(
                 f"Re-identifying {len(devicesToReidentify)} devices due to label changes"
             )
-            for device in devicesToReidentify:
-                await self.removeDevice(device["name"])
-                await self.setupDevice(device)
+
+            async def reidentify(device):
+                await self._removeDevice(device["name"], controlOption)
+                await self._setupDevice(device, controlOption)
+
+            self._log_gather_errors(
+                "re-identify",
+                await asyncio.gather(
+                    *(reidentify(device) for device in devicesToReidentify),
+                    return_exceptions=True,
+                ),
+            )
 
         if newDevices:
             _LOGGER.warning(f"Found {len(newDevices)} new devices, initializing...")
             for device in newDevices:
                 _LOGGER.debug(f"Registering new device: {device}")
-                await self.setupDevice(device)
+            self._log_gather_errors(
+                "setup",
+                await asyncio.gather(
+                    *(self._setupDevice(device, controlOption) for device in newDevices),
+                    return_exceptions=True,
+                ),
+            )
         else:
             _LOGGER.warning("Device-Check: No new devices found.")
 
+        return bool(newDevices or removedDevices or devicesToReidentify)
+
+    async def _on_registry_change(self, event):
+        """Plant einen DeviceUpdater-Lauf nach Registry-Änderungen (Bursts werden zusammengefasst)."""
+        if self._registry_refresh_task and not self._registry_refresh_task.done():
+            return
+        self._registry_refresh_task = asyncio.create_task(self._debounced_registry_refresh())
+
+    async def _debounced_registry_refresh(self):
+        await asyncio.sleep(REGISTRY_REFRESH_DEBOUNCE_SECONDS)
+        # Vor dem Lauf freigeben, damit Änderungen währenddessen einen neuen Lauf planen
+        self._registry_refresh_task = None
+        try:
+            await self.DeviceUpdater()
+        except Exception as e:
+            _LOGGER.exception(f"Error during registry triggered device refresh: {e}")
+
+    def _log_gather_errors(self, action, results):
+        """Fehler aus asyncio.gather(return_exceptions=True) loggen, ohne die anderen Geräte abzubrechen."""
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    f"{self.room} - Device {action} failed: {result}", exc_info=result
+                )
+
     def device_Worker(self):
         if self._devicerefresh_task and not self._devicerefresh_task.done():
             _LOGGER.debug("Device refresh task is already running. Skipping start.")
             return
 
         async def periodicWorker():
+            # Erst zurückgeben, damit das Setup der Integration nicht auf die erste Erkennung wartet
+            await asyncio.sleep(0)
+            interval = DEVICE_REFRESH_INTERVAL
             while True:
                 try:
-                    await self.DeviceUpdater()
+                    if await self.DeviceUpdater():
+                        interval = DEVICE_REFRESH_MIN_INTERVAL
+                    else:
+                        interval = min(interval * 2, DEVICE_REFRESH_MAX_INTERVAL)
                 except Exception as e:
                     _LOGGER.exception(f"Error during device refresh: {e}")
-                await asyncio.sleep(175)
+                await asyncio.sleep(interval)
 
-        self._devicerefresh_task = asyncio.create_task(periodicWorker())
+        if self.hass is not None and hasattr(self.hass, "async_create_background_task"):
+            # Background-Task: HA wartet beim Setup/Startup nicht auf diesen Task
+            self._devicerefresh_task = self.hass.async_create_background_task(
+                periodicWorker(), f"OGB {self.room} device refresh"
+            )
+        else:
+            self._devicerefresh_task = asyncio.create_task(periodicWorker())
+
+    async def async_shutdown(self):
+        """Stoppt Refresh-Worker und Registry-Listener beim Entladen der Integration."""
+        for unsub in self._registry_unsubs:
+            unsub()
+        self._registry_unsubs = []
+
+        tasks = [
+            task
+            for task in (self._devicerefresh_task, self._registry_refresh_task)
+            if task and not task.done()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._devicerefresh_task = None
+        self._registry_refresh_task = None
+        _LOGGER.debug(f"{self.room}: Device manager stopped")
 
     def capCleaner(self, data):
         """Setzt alle Capabilities im DataStore auf den Ursprungszustand zurück."""
         capabilities = self.data_store.get("capabilities")
 
         self.data_store.set("devices", [])
-
-        for key in capabilities:
-            capabilities[key] = {"state": False, "count": 0, "devEntities": []}
-
-        self.data_store.set("capabilities", capabilities)
+        self._devices_by_name = {}
+        self._indexed_devices = None
+        _identify_type_cached.cache_clear()
+
+        # Neue Tabelle in einem Schritt zuweisen - kein halb zurückgesetzter Zustand sichtbar
+        self.data_store.set(
+            "capabilities",
+            {key: {"state": False, "count": 0, "devEntities": []} for key in capabilities},
+        )
         _LOGGER.debug(f"{self.room}: Cleared Caps and Devices")
 
     def deduplicateCapabilities(self):
@@ -534,60 +592,15 @@ class OGBDeviceManager:
 
     def _determine_device_type_from_labels(self, labels: list) -> str:
         """
-        Determine device type from labels using priority-based matching.
-        
-        Special light types (LightFarRed, LightUV, etc.) must be matched
-        before generic Light type.
+        Determine the device type identify_device() would detect from labels alone.
+
+        Uses the same matcher (FridgeGrow label, then exact keyword on any label,
+        then first contains-match with special lights before generic Light).
+        Returns "EMPTY" if no label matches.
         """
-        
-        # Priority-ordered list - special types before generic (includes LightSpectrum)
-        PRIORITY_DEVICE_TYPES = [
-            "LightFarRed",
-            "LightUV",
-            "LightBlue",
-            "LightRed",
-            "LightSpectrum",  # Handles blue/red spectrum lights
-        ]
-        
-        for lbl in labels:
-            label_name = lbl.get("name", "").lower()
-            if not label_name:
-                continue
-            
-            # First: Check exact match for priority types
-            for device_type in PRIORITY_DEVICE_TYPES:
-                keywords = DEVICE_TYPE_MAPPING.get(device_type, [])
-                if label_name in keywords:
-                    return device_type
-            
-            # Second: Check exact match for all types
-            for device_type, keywords in DEVICE_TYPE_MAPPING.items():
-                if label_name in keywords:
-                    return device_type
-
-            # Check if we have special light labels - if so, don't fall back to generic Light
-            special_light_labels = [lbl.get("name", "").lower() for lbl in labels if lbl.get("name", "").lower() in ["light_blue", "light_red", "light_uv", "light_fr", "light_farred", "light_uvb", "light_uva", "uvlight"]]
-            if any(keyword in special_light_labels for keyword in ["blue", "red", "uv", "uvb", "uva", "farred"]):
-                # Already identified as special light, don't fall back to generic Light
-                return "Light", None  # Return None for detected_label to avoid overwriting
-
-            # Third: Contains matching with priority ordering
-        for lbl in labels:
-            label_name = lbl.get("name", "").lower()
-            if not label_name:
-                continue
-            
-            # Check priority types first
-            for device_type in PRIORITY_DEVICE_TYPES:
-                keywords = DEVICE_TYPE_MAPPING.get(device_type, [])
-                if any(keyword in label_name for keyword in keywords):
-                    return device_type
-            
-            # Then check all other types
-            for device_type, keywords in DEVICE_TYPE_MAPPING.items():
-                if device_type in PRIORITY_DEVICE_TYPES:
-                    continue
-                if any(keyword in label_name for keyword in keywords):
-                    return device_type
-        
-        return "EMPTY"
+        label_names = tuple(
+            name for name in (lbl.get("name", "").lower() for lbl in labels or ()) if name
+        )
+        # Leerer Gerätename: nur Labels zählen, kein Name-Fallback
+        device_type, _source, _label = _identify_type_cached(label_names, "")
+        return device_type or "EMPTY"
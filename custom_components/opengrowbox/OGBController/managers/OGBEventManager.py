@@ -40,6 +40,14 @@ class OGBEventManager:
         if callback not in self.listeners[event_name]:
             self.listeners[event_name].append(callback)
 
+    def on_many(self, subscriptions):
+        """Registriere mehrere Listener in einem Aufruf: {event_name: callback}."""
+        listeners = self.listeners
+        for event_name, callback in subscriptions.items():
+            callbacks = listeners.setdefault(event_name, [])
+            if callback not in callbacks:
+                callbacks.append(callback)
+
     def remove(self, event_name, callback):
         """Entferne einen spezifischen Listener."""
         if event_name in self.listeners and callback in self.listeners[event_name]:
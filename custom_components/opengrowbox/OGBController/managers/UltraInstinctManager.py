@@ -11,15 +11,131 @@ Key innovation: Predictive control using Outside→Ambient→Tent gradients.
 """
 
 import asyncio
+import contextlib
 import logging
+import time
+from collections import deque, namedtuple
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from itertools import islice
+from statistics import StatisticsError, linear_regression
+from types import MappingProxyType
+from typing import (TYPE_CHECKING, Any, Awaitable, Deque, Dict, List, Mapping,
+                    Optional, Tuple)
 
 if TYPE_CHECKING:
     from ..OGB import OpenGrowBox
 
 _LOGGER = logging.getLogger(__name__)
 
+# Unterhalb dieser vorhergesagten Änderung (°C / %) gilt die Lage als stabil
+STABLE_PREDICTION_THRESHOLD = 0.2
+
+# Neue Sensordaten (VPDCreation) lösen einen Zyklus aus; Timer nur noch als Sicherheitsnetz (Sekunden).
+# MIN_CYCLE_SPACING = bisheriger 30s-Takt: Gradienten/Trends über die 20er-History sind darauf abgestimmt
+SENSOR_EVENT = "VPDCreation"
+SENSOR_EVENT_DEBOUNCE = 2.0
+MIN_CYCLE_SPACING = 30.0
+
+# Lern-History: feste Anzahl vorab angelegter Einträge, die reihum überschrieben werden
+CONTROL_HISTORY_SIZE = 100
+_CONTROL_HISTORY_FIELDS = ("timestamp", "sensors", "targets", "predictive_adjustments", "gradients")
+
+# Kompakte Messwerte für die Lern-History - Felder wie in _get_sensor_data
+SensorSnapshot = namedtuple(
+    "SensorSnapshot",
+    (
+        "temperature",
+        "humidity",
+        "vpd",
+        "co2",
+        "light_intensity",
+        "tent_temp",
+        "tent_hum",
+        "ambient_temp",
+        "ambient_hum",
+        "outside_temp",
+        "outside_hum",
+    ),
+)
+
+def _clip(value, lo, hi):
+    """Wie max(lo, min(hi, value)), ohne zwei Funktionsaufrufe."""
+    value = hi if value > hi else value
+    return lo if value < lo else value
+
+
+def _reading(sensor_data: Dict[str, Any], *keys: str, default=None):
+    """Erster vorhandene Messwert aus keys - 0.0 ist ein gültiger Wert, nur None fehlt."""
+    for key in keys:
+        value = sensor_data.get(key)
+        if value is not None:
+            return value
+    return default
+
+
+def _snapshot(current: Dict[str, Any], previous: Dict[str, Any]) -> Dict[str, Any]:
+    """Kopie von current - die vorherige wird wiederverwendet, solange sich nichts geändert hat."""
+    return previous if previous == current else current.copy()
+
+
+def _trend_per_hour(entries, key: str) -> float:
+    """Steigung (Einheit/Stunde) von key über die History-Einträge; 0.0 bei zu wenig Punkten."""
+    points = [(entry["ts"], entry[key]) for entry in entries if entry.get(key) is not None]
+    if len(points) < 2:
+        return 0.0
+    try:
+        return linear_regression(*zip(*points)).slope * 3600.0
+    except StatisticsError:
+        # Alle Punkte zum selben Zeitpunkt
+        return 0.0
+
+
+# Felder pro History-Eintrag (Outside→Ambient→Tent Gradienten und Tent-Trends)
+_HISTORY_FIELDS = (
+    "tent_temp",
+    "tent_hum",
+    "ambient_temp",
+    "ambient_hum",
+    "outside_temp",
+    "outside_hum",
+)
+
+# Gerätemethoden, die Ultra Instinct aufruft (siehe _device_caps)
+_DEVICE_METHODS = ("turn_on", "turn_off", "set_duty_cycle")
+
+# ultra_instinct_control-Aktionen: action -> (benötigte Gerätemethode oder None, Aufruf)
+_DIRECT_ACTIONS = MappingProxyType({
+    "set_intensity": ("turn_on", lambda dev, value: dev.turn_on(brightness_pct=value)),
+    "set_brightness": ("turn_on", lambda dev, value: dev.turn_on(brightness_pct=value)),
+    "set_duty_cycle": ("set_duty_cycle", lambda dev, value: dev.set_duty_cycle(value)),
+    "turn_on": (None, lambda dev, value: dev.turn_on()),
+    "turn_off": (None, lambda dev, value: dev.turn_off()),
+})
+
+# Basis-Abluft (%) je Pflanzenphase
+_STAGE_EXHAUST = MappingProxyType({
+    "Germination": 15,
+    "Clones": 20,
+    "EarlyVeg": 30,
+    "MidVeg": 45,
+    "LateVeg": 55,
+    "EarlyFlower": 60,
+    "MidFlower": 70,
+    "LateFlower": 75,
+})
+
+# Basis-Lichtintensität (%) je Pflanzenphase
+_STAGE_LIGHT = MappingProxyType({
+    "Germination": 25,
+    "Clones": 35,
+    "EarlyVeg": 50,
+    "MidVeg": 65,
+    "LateVeg": 80,
+    "EarlyFlower": 85,
+    "MidFlower": 95,
+    "LateFlower": 95,
+})
+
 
 class UltraInstinctManager:
     """
@@ -59,7 +175,7 @@ class UltraInstinctManager:
 
         # Control parameters
         self.control_active = False
-        self.update_interval = 30  # seconds - faster response than VPD modes
+        self.update_interval = 60  # seconds - safety net, sensor updates trigger cycles earlier
         self.adaptive_learning = True
         
         # Predictive control parameters
@@ -70,14 +186,39 @@ class UltraInstinctManager:
 
         # Control state
         self.last_control_time = None
+        self._last_control_time_iso: Optional[str] = None
+        self._last_control_ts: Optional[float] = None
         self.control_task: Optional[asyncio.Task] = None
-        self.learning_data: Dict[str, Any] = {}
-        
-        # Historical data for trend analysis
-        self.sensor_history: List[Dict[str, Any]] = []
+        self._cycle_requested = asyncio.Event()
+        # Ringpuffer: Slots einmal anlegen und in _learn_from_cycle in place überschreiben
+        self.learning_data: Dict[str, Any] = {
+            "control_history": [dict.fromkeys(_CONTROL_HISTORY_FIELDS) for _ in range(CONTROL_HISTORY_SIZE)]
+        }
+        self._history_head = 0  # Anzahl geschriebener Einträge; Slot = head % CONTROL_HISTORY_SIZE
+        # Exponentiell geglättete Gradienten (beta 0.9), pro Zyklus in O(Anzahl Keys) fortgeschrieben
+        self._grad_ema: Dict[str, float] = {}
+        # Unveränderliche Kopien für History-Einträge - unveränderte Zyklen teilen dieselbe
+        self._targets_snapshot: Dict[str, Any] = {}
+        self._adjustments_snapshot: Dict[str, Any] = {}
+        
+        # Eingaben der letzten Direktsteuerung (Targets, Messwerte, Gerätezustände)
+        self._last_control_key: Optional[Tuple] = None
+
+        # Normalisierter Index über plantStages (siehe _stage_index)
+        self._stage_index_cache: Dict[str, Any] = {}
+        self._stage_index_source = None
+
+        # Historical data for trend analysis (rolling window, oldest entry drops out on append)
+        self.sensor_history: Deque[Dict[str, Any]] = deque(maxlen=self.gradient_history_size)
+        # Zähler für sensor_history-Änderungen; _calculate_gradients rechnet nur bei neuem Stand
+        self._sensor_version = 0
+        self._gradients_version = -1
+        self._cached_gradients: Mapping[str, float] = MappingProxyType({})
 
         # Device references (populated on start)
         self.devices: Dict[str, Any] = {}
+        # Gerätename -> (Gerät, aufrufbare Methoden aus _DEVICE_METHODS)
+        self._caps: Dict[str, Tuple[Any, frozenset]] = {}
 
         # Control targets (calculated by Ultra Instinct logic)
         self.targets: Dict[str, Optional[float]] = {
@@ -92,9 +233,13 @@ class UltraInstinctManager:
             "temperature_target": None,
             "humidity_target": None,
         }
+        # Read-only Sicht für get_control_status - keine Kopie, Aufrufer können nichts verändern
+        self._targets_view = MappingProxyType(self.targets)
         
         # Predictive adjustments
         self.predictive_adjustments = {
+            "temp_predicted_change": 0.0,
+            "hum_predicted_change": 0.0,
             "temp_adjustment": 0.0,
             "hum_adjustment": 0.0,
             "exhaust_pre_adjust": 0.0,
@@ -115,6 +260,9 @@ class UltraInstinctManager:
             return
 
         self.control_active = True
+        # Nach stop_control wieder anmelden (on() ignoriert doppelte Listener)
+        self.event_manager.on("ultra_instinct_control", self._handle_direct_control)
+        self.event_manager.on(SENSOR_EVENT, self._on_sensor_event)
 
         self.control_task = asyncio.create_task(self._control_loop())
         _LOGGER.info(f"Ultra Instinct control started for {self.room}")
@@ -129,13 +277,16 @@ class UltraInstinctManager:
         Stop the Ultra Instinct control loop.
         """
         self.control_active = False
+        # Listener abmelden - sonst bleibt die gebundene Methode dieser Instanz im EventManager hängen
+        self.event_manager.remove("ultra_instinct_control", self._handle_direct_control)
+        self.event_manager.remove(SENSOR_EVENT, self._on_sensor_event)
 
         if self.control_task:
             self.control_task.cancel()
-            try:
-                await self.control_task
-            except asyncio.CancelledError:
-                pass
+            # Shutdown nicht unbegrenzt auf den abgebrochenen Zyklus warten lassen
+            with contextlib.suppress(asyncio.CancelledError, asyncio.TimeoutError):
+                await asyncio.wait_for(self.control_task, timeout=1.0)
+            self.control_task = None
 
         _LOGGER.info(f"Ultra Instinct control stopped for {self.room}")
 
@@ -150,17 +301,35 @@ class UltraInstinctManager:
         while self.control_active:
             try:
                 await self._execute_control_cycle()
-                await asyncio.sleep(self.update_interval)
-
             except Exception as e:
                 _LOGGER.error(f"Error in Ultra Instinct control loop for {self.room}: {e}")
-                await asyncio.sleep(30)
+
+            # Nie öfter als alle MIN_CYCLE_SPACING Sekunden; kam währenddessen ein Sensor-Event,
+            # läuft der nächste Zyklus direkt danach, sonst spätestens nach update_interval
+            self._cycle_requested.clear()
+            await asyncio.sleep(MIN_CYCLE_SPACING)
+            if self._cycle_requested.is_set():
+                continue
+            try:
+                await asyncio.wait_for(
+                    self._cycle_requested.wait(),
+                    timeout=max(0.0, self.update_interval - MIN_CYCLE_SPACING),
+                )
+                # Kurz warten, bis die VPD-Berechnung tentData aktualisiert hat, Bursts zusammenfassen
+                await asyncio.sleep(SENSOR_EVENT_DEBOUNCE)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _on_sensor_event(self, data):
+        """Neue Sensordaten - nächsten Control-Zyklus anfordern."""
+        if self.control_active:
+            self._cycle_requested.set()
 
     async def _execute_control_cycle(self):
         """
         Execute a complete Ultra Instinct control cycle with DIRECT device control.
         """
-        _LOGGER.debug(f"Ultra Instinct: Direct control cycle for {self.room}")
+        _LOGGER.debug("Ultra Instinct: Direct control cycle for %s", self.room)
 
         # Get current sensor data
         sensor_data = self._get_sensor_data()
@@ -171,39 +340,95 @@ class UltraInstinctManager:
         # Update sensor history for trend analysis
         self._update_sensor_history(sensor_data)
 
+        # Gradienten einmal pro Zyklus - Targets und Lernschritt nutzen dieselben Werte
+        gradients = self._calculate_gradients()
+
         # Calculate optimal targets using Ultra Instinct logic
-        await self._calculate_targets(sensor_data)
+        await self._calculate_targets(sensor_data, gradients)
+
+        # Execute DIRECT control actions on devices - skip if nothing the decision depends on changed
+        control_key = self._control_input_key(sensor_data)
+        if control_key == self._last_control_key and self._prediction_is_stable():
+            _LOGGER.debug("%s: Ultra Instinct - inputs unchanged, skipping device commands", self.room)
+        else:
+            succeeded = await self._execute_direct_control(sensor_data)
+            # Nach Fehlern keinen Key merken, damit der nächste Zyklus die Befehle erneut sendet
+            self._last_control_key = control_key if succeeded else None
 
-        # Execute DIRECT control actions on devices
-        await self._execute_direct_control(sensor_data)
+        # Update control timestamp - ISO-String einmal pro Zyklus für den Status,
+        # monotone Sekunden für die Lern-History (nur relative Zeit nötig)
+        self.last_control_time = datetime.now()
+        self._last_control_time_iso = self.last_control_time.isoformat()
+        self._last_control_ts = time.monotonic()
 
         # Learn from current state for future optimization
-        if self.adaptive_learning:
-            await self._learn_from_cycle(sensor_data)
+        await self._learn_from_cycle(sensor_data, gradients)
+
+    def _device_caps(self, name: str) -> frozenset:
+        """Aufrufbare Steuermethoden eines Geräts; leer wenn das Gerät fehlt. Pro Geräteobjekt gecacht."""
+        dev = self.devices.get(name)
+        if dev is None:
+            return frozenset()
+        cached = self._caps.get(name)
+        if cached is None or cached[0] is not dev:
+            cached = (
+                dev,
+                frozenset(m for m in _DEVICE_METHODS if callable(getattr(dev, m, None))),
+            )
+            self._caps[name] = cached
+        return cached[1]
+
+    def _control_input_key(self, sensor_data: Dict[str, Any]) -> Tuple:
+        """Alles, wovon _execute_direct_control abhängt - gleicher Key ergibt dieselben Befehle.
+
+        isRunning gehört dazu: wird ein Gerät extern geschaltet, sendet der nächste Zyklus wieder.
+        """
+        return (
+            tuple(self.targets.values()),
+            sensor_data.get("tent_temp"),
+            sensor_data.get("temperature"),
+            sensor_data.get("tent_hum"),
+            sensor_data.get("humidity"),
+            tuple(
+                (
+                    name,
+                    getattr(dev, "isRunning", None),
+                    getattr(dev, "voltage", None),
+                    getattr(dev, "dutyCycle", None),
+                )
+                for name, dev in self.devices.items()
+            ),
+        )
 
-        # Update control timestamp
-        self.last_control_time = datetime.now()
+    def _prediction_is_stable(self) -> bool:
+        """True wenn keine nennenswerte Temperatur-/Feuchteänderung vorhergesagt ist."""
+        return (
+            abs(self.predictive_adjustments.get("temp_predicted_change", 0.0)) < STABLE_PREDICTION_THRESHOLD
+            and abs(self.predictive_adjustments.get("hum_predicted_change", 0.0)) < STABLE_PREDICTION_THRESHOLD
+        )
 
     def _get_sensor_data(self) -> Dict[str, Any]:
         """
         Get current sensor data for control decisions.
         Includes all temperature/humidity layers for predictive analysis.
         """
+        # tentData einmal holen statt pro Wert den Pfad aufzulösen
+        tent = self.data_store.getDeep("tentData") or {}
         return {
             # Inside tent (current state)
-            "temperature": self.data_store.getDeep("tentData.temperature"),
-            "humidity": self.data_store.getDeep("tentData.humidity"),
+            "temperature": tent.get("temperature"),
+            "humidity": tent.get("humidity"),
             "vpd": self.data_store.getDeep("vpd.current"),
-            "co2": self.data_store.getDeep("tentData.co2"),
-            "light_intensity": self.data_store.getDeep("tentData.light_intensity"),
-            "tent_temp": self.data_store.getDeep("tentData.Temperature"),
-            "tent_hum": self.data_store.getDeep("tentData.Humidity"),
+            "co2": tent.get("co2"),
+            "light_intensity": tent.get("light_intensity"),
+            "tent_temp": tent.get("Temperature"),
+            "tent_hum": tent.get("Humidity"),
             # Ambient (room) conditions
-            "ambient_temp": self.data_store.getDeep("tentData.AmbientTemp"),
-            "ambient_hum": self.data_store.getDeep("tentData.AmbientHum"),
+            "ambient_temp": tent.get("AmbientTemp"),
+            "ambient_hum": tent.get("AmbientHum"),
             # Outside conditions (for prediction)
-            "outside_temp": self.data_store.getDeep("tentData.OutsiteTemp"),
-            "outside_hum": self.data_store.getDeep("tentData.OutsiteHum"),
+            "outside_temp": tent.get("OutsiteTemp"),
+            "outside_hum": tent.get("OutsiteHum"),
         }
         
     def _update_sensor_history(self, sensor_data: Dict[str, Any]):
@@ -211,18 +436,15 @@ class UltraInstinctManager:
         Store sensor data for trend analysis.
         Keeps a rolling window of historical data points.
         """
-        entry = {
-            "timestamp": datetime.now(),
-            **sensor_data
-        }
+        # Nur die Felder, die Gradienten/Trends lesen
+        entry = {key: sensor_data.get(key) for key in _HISTORY_FIELDS}
+        # Monotone Sekunden: billig zu subtrahieren und unempfindlich gegen Uhrzeit-Sprünge
+        entry["ts"] = time.monotonic()
         
         self.sensor_history.append(entry)
-        
-        # Keep only last N entries
-        if len(self.sensor_history) > self.gradient_history_size:
-            self.sensor_history.pop(0)
+        self._sensor_version += 1
             
-    def _calculate_gradients(self) -> Dict[str, float]:
+    def _calculate_gradients(self) -> Mapping[str, float]:
         """
         Calculate temperature and humidity gradients between all layers.
         
@@ -232,6 +454,16 @@ class UltraInstinctManager:
         - ambient_to_tent_temp: How fast Ambient temp affects Tent
         - ambient_to_tent_hum: How fast Ambient humidity affects Tent
         """
+        # Hängt nur von sensor_history ab - bis zum nächsten Eintrag den letzten Wert liefern.
+        # Read-only, weil Status, History und Zyklus dasselbe Objekt teilen
+        if self._gradients_version == self._sensor_version:
+            return self._cached_gradients
+        self._cached_gradients = MappingProxyType(self._compute_gradients())
+        self._gradients_version = self._sensor_version
+        return self._cached_gradients
+
+    def _compute_gradients(self) -> Dict[str, float]:
+        """Gradienten/Trends aus sensor_history berechnen (siehe _calculate_gradients)."""
         if len(self.sensor_history) < 2:
             return {
                 "outside_to_ambient_temp": 0.0,
@@ -247,7 +479,7 @@ class UltraInstinctManager:
         oldest = self.sensor_history[0]
         
         # Calculate time delta in hours
-        time_delta_hours = (latest["timestamp"] - oldest["timestamp"]).total_seconds() / 3600
+        time_delta_hours = (latest["ts"] - oldest["ts"]) / 3600.0
         if time_delta_hours == 0:
             time_delta_hours = 0.5  # Assume 30 min default
             
@@ -280,22 +512,10 @@ class UltraInstinctManager:
         
         # Calculate internal Tent trends (rate of change)
         if len(self.sensor_history) >= 3:
-            # Use last 3 points for trend
-            temp_changes = []
-            hum_changes = []
-            for i in range(len(self.sensor_history) - 1, max(0, len(self.sensor_history) - 4), -1):
-                if i > 0:
-                    curr = self.sensor_history[i]
-                    prev = self.sensor_history[i-1]
-                    dt = (curr["timestamp"] - prev["timestamp"]).total_seconds() / 3600
-                    if dt > 0:
-                        if curr.get("tent_temp") and prev.get("tent_temp"):
-                            temp_changes.append((curr["tent_temp"] - prev["tent_temp"]) / dt)
-                        if curr.get("tent_hum") and prev.get("tent_hum"):
-                            hum_changes.append((curr["tent_hum"] - prev["tent_hum"]) / dt)
-            
-            temp_trend = sum(temp_changes) / len(temp_changes) if temp_changes else 0
-            hum_trend = sum(hum_changes) / len(hum_changes) if hum_changes else 0
+            # Least-squares slope over the last 4 points (robuster gegen Sensorrauschen)
+            recent = list(islice(reversed(self.sensor_history), 4))
+            temp_trend = _trend_per_hour(recent, "tent_temp")
+            hum_trend = _trend_per_hour(recent, "tent_hum")
         else:
             temp_trend = 0.0
             hum_trend = 0.0
@@ -309,7 +529,7 @@ class UltraInstinctManager:
             "hum_trend": hum_trend,
         }
         
-    def _calculate_predictive_factors(self, sensor_data: Dict[str, Any], gradients: Dict[str, float]) -> Dict[str, float]:
+    def _calculate_predictive_factors(self, sensor_data: Dict[str, Any], gradients: Mapping[str, float]) -> Dict[str, float]:
         """
         Calculate predictive adjustment factors based on Outside→Ambient→Tent gradients.
         
@@ -323,8 +543,8 @@ class UltraInstinctManager:
         outside_hum = sensor_data.get("outside_hum")
         ambient_temp = sensor_data.get("ambient_temp")
         ambient_hum = sensor_data.get("ambient_hum")
-        tent_temp = sensor_data.get("tent_temp") or sensor_data.get("temperature")
-        tent_hum = sensor_data.get("tent_hum") or sensor_data.get("humidity")
+        tent_temp = _reading(sensor_data, "tent_temp", "temperature")
+        tent_hum = _reading(sensor_data, "tent_hum", "humidity")
         
         # Initialize factors
         temp_factor = 0.0
@@ -369,9 +589,8 @@ class UltraInstinctManager:
             hum_factor = predicted_tent_hum - tent_hum
         
         _LOGGER.debug(
-            f"{self.room}: Predictive factors - Temp: {temp_factor:+.2f}°C, "
-            f"Hum: {hum_factor:+.2f}%, Exhaust: {exhaust_factor:+.1f}% "
-            f"(in {self.prediction_window_minutes}min)"
+            "%s: Predictive factors - Temp: %+.2f°C, Hum: %+.2f%%, Exhaust: %+.1f%% (in %smin)",
+            self.room, temp_factor, hum_factor, exhaust_factor, self.prediction_window_minutes,
         )
         
         return {
@@ -380,7 +599,9 @@ class UltraInstinctManager:
             "exhaust_pre_adjust": exhaust_factor,
         }
 
-    async def _calculate_targets(self, sensor_data: Dict[str, Any]):
+    async def _calculate_targets(
+        self, sensor_data: Dict[str, Any], gradients: Optional[Mapping[str, float]] = None
+    ):
         """
         Calculate optimal control targets using PREDICTIVE Ultra Instinct logic.
         
@@ -390,10 +611,11 @@ class UltraInstinctManager:
         3. Plant stage optimization
         4. Energy-efficient ambient-aware adjustments
         """
-        _LOGGER.debug(f"Ultra Instinct: Calculating PREDICTIVE targets for {self.room}")
+        _LOGGER.debug("Ultra Instinct: Calculating PREDICTIVE targets for %s", self.room)
         
         # Get gradients and predictive factors
-        gradients = self._calculate_gradients()
+        if gradients is None:
+            gradients = self._calculate_gradients()
         predictive = self._calculate_predictive_factors(sensor_data, gradients)
 
         # Get plant stage for adaptive targets
@@ -434,14 +656,14 @@ class UltraInstinctManager:
         adjusted_target_hum = hum_optimal - predictive_hum_adjustment
         
         # Keep within safety bounds
-        adjusted_target_temp = max(temp_min, min(temp_max, adjusted_target_temp))
-        adjusted_target_hum = max(40, min(85, adjusted_target_hum))
+        adjusted_target_temp = _clip(adjusted_target_temp, temp_min, temp_max)
+        adjusted_target_hum = _clip(adjusted_target_hum, 40, 85)
         
         # Calculate exhaust speed with predictive pre-adjustment
         base_exhaust = self._calculate_base_exhaust_speed(plant_stage, sensor_data, current_vpd, target_vpd, max_vpd)
         predictive_exhaust_adjust = predictive["exhaust_pre_adjust"]
         target_exhaust = base_exhaust + predictive_exhaust_adjust
-        target_exhaust = max(10, min(100, target_exhaust))
+        target_exhaust = _clip(target_exhaust, 10, 100)
         
         # Calculate intake (typically 10-20% lower than exhaust for negative pressure)
         target_intake = target_exhaust * 0.85
@@ -452,12 +674,14 @@ class UltraInstinctManager:
             # Preemptive light reduction to prevent overheating
             light_reduction = min(20, predicted_temp_change * 8)
             target_light = base_light - light_reduction
-            _LOGGER.debug(f"{self.room}: Preemptive light reduction: -{light_reduction:.1f}% "
-                         f"due to predicted temp rise")
+            _LOGGER.debug(
+                "%s: Preemptive light reduction: -%.1f%% due to predicted temp rise",
+                self.room, light_reduction,
+            )
         else:
             target_light = base_light
             
-        target_light = max(0, min(100, target_light))
+        target_light = _clip(target_light, 0, 100)
 
         # Set targets
         self.targets["temperature_target"] = round(adjusted_target_temp, 1)
@@ -467,22 +691,24 @@ class UltraInstinctManager:
         self.targets["intake_speed"] = round(target_intake, 1)
         
         # Store predictive data for logging/debugging
-        self.predictive_adjustments = {
-            "temp_predicted_change": round(predicted_temp_change, 2),
-            "hum_predicted_change": round(predicted_hum_change, 2),
-            "temp_adjustment": round(predictive_temp_adjustment, 2),
-            "hum_adjustment": round(predictive_hum_adjustment, 2),
-            "exhaust_pre_adjust": round(predictive_exhaust_adjust, 1),
-        }
-        
-        _LOGGER.info(
-            f"{self.room}: Predictive targets - Temp: {self.targets['temperature_target']}°C "
-            f"(predicted change: {predicted_temp_change:+.2f}°C), "
-            f"Hum: {self.targets['humidity_target']}% "
-            f"(predicted change: {predicted_hum_change:+.2f}%), "
-            f"Light: {self.targets['light_intensity']}%, "
-            f"Exhaust: {self.targets['exhaust_speed']}%"
-        )
+        # Rohwerte im bestehenden Dict ablegen - gerundet wird erst in get_control_status
+        adjustments = self.predictive_adjustments
+        adjustments["temp_predicted_change"] = predicted_temp_change
+        adjustments["hum_predicted_change"] = predicted_hum_change
+        adjustments["temp_adjustment"] = predictive_temp_adjustment
+        adjustments["hum_adjustment"] = predictive_hum_adjustment
+        adjustments["exhaust_pre_adjust"] = predictive_exhaust_adjust
+        
+        # Der Zyklus-Log formatiert 6 Werte - nur bauen, wenn INFO tatsächlich ausgegeben wird
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(
+                f"{self.room}: Predictive targets - Temp: {self.targets['temperature_target']}°C "
+                f"(predicted change: {predicted_temp_change:+.2f}°C), "
+                f"Hum: {self.targets['humidity_target']}% "
+                f"(predicted change: {predicted_hum_change:+.2f}%), "
+                f"Light: {self.targets['light_intensity']}%, "
+                f"Exhaust: {self.targets['exhaust_speed']}%"
+            )
         
     def _get_plant_stage_data(self, plant_stage: str) -> Optional[Dict]:
         """Get plant stage data from datastore."""
@@ -494,11 +720,21 @@ class UltraInstinctManager:
             if plant_stage in plant_stages:
                 return plant_stages[plant_stage]
             # Try normalized match
-            normalized = plant_stage.replace(" ", "").replace("-", "")
-            for key, data in plant_stages.items():
-                if key.replace(" ", "").replace("-", "") == normalized:
-                    return data
+            return self._stage_index(plant_stages).get(
+                plant_stage.replace(" ", "").replace("-", "")
+            )
         return None
+
+    def _stage_index(self, plant_stages) -> Dict[str, Any]:
+        """Normalisierter Phasenname -> Phasendaten; neu aufgebaut nur wenn plantStages ersetzt wurde."""
+        if plant_stages is not self._stage_index_source:
+            index: Dict[str, Any] = {}
+            for key, data in plant_stages.items():
+                # Erster Treffer gewinnt wie beim linearen Scan
+                index.setdefault(key.replace(" ", "").replace("-", ""), data)
+            self._stage_index_cache = index
+            self._stage_index_source = plant_stages
+        return self._stage_index_cache
         
     def _calculate_base_exhaust_speed(
         self, 
@@ -510,18 +746,7 @@ class UltraInstinctManager:
     ) -> float:
         """Calculate base exhaust speed with VPD-aware adjustment."""
         # Base speeds by plant stage
-        stage_exhaust = {
-            "Germination": 15,
-            "Clones": 20,
-            "EarlyVeg": 30,
-            "MidVeg": 45,
-            "LateVeg": 55,
-            "EarlyFlower": 60,
-            "MidFlower": 70,
-            "LateFlower": 75,
-        }
-        
-        base = stage_exhaust.get(plant_stage, 55)
+        base = _STAGE_EXHAUST.get(plant_stage, 55)
         
         # Adjust based on VPD (like VPD Perfection)
         if current_vpd > max_vpd + 0.2:
@@ -542,33 +767,27 @@ class UltraInstinctManager:
             elif ambient_temp < 15:  # Cold ambient
                 base -= 5  # Less exhaust to retain heat
                 
-        return max(10, min(100, base))
+        return _clip(base, 10, 100)
         
     def _calculate_base_light_intensity(self, plant_stage: str) -> float:
         """Calculate base light intensity by plant stage."""
-        stage_light = {
-            "Germination": 25,
-            "Clones": 35,
-            "EarlyVeg": 50,
-            "MidVeg": 65,
-            "LateVeg": 80,
-            "EarlyFlower": 85,
-            "MidFlower": 95,
-            "LateFlower": 95,
-        }
-        return stage_light.get(plant_stage, 80)
+        return _STAGE_LIGHT.get(plant_stage, 80)
 
     async def _execute_direct_control(self, sensor_data: Dict[str, Any]):
         """
         Execute DIRECT control actions on devices with PREDICTIVE adjustments.
         """
-        _LOGGER.debug(f"Ultra Instinct: Executing direct control for {self.room}")
+        _LOGGER.debug("Ultra Instinct: Executing direct control for %s", self.room)
         
-        current_temp = sensor_data.get("tent_temp") or sensor_data.get("temperature", 22)
-        current_hum = sensor_data.get("tent_hum") or sensor_data.get("humidity", 60)
+        current_temp = _reading(sensor_data, "tent_temp", "temperature", default=22)
+        current_hum = _reading(sensor_data, "tent_hum", "humidity", default=60)
         target_temp = self.targets.get("temperature_target", 24)
         target_hum = self.targets.get("humidity_target", 60)
 
+        # Unabhängige Gerätebefehle sammeln und gemeinsam ausführen: (Fehler-Label, Awaitable)
+        # Fehler-Label None = Fehler still ignorieren (Abschalt-Befehle)
+        commands: List[Tuple[Optional[str], Awaitable]] = []
+
         # Control Light
         if "light" in self.devices and self.targets.get("light_intensity") is not None:
             light = self.devices["light"]
@@ -576,11 +795,8 @@ class UltraInstinctManager:
             current_intensity = getattr(light, 'voltage', 0)
             if abs(current_intensity - target_intensity) > 5:
                 _LOGGER.info(f"{self.room}: Ultra Instinct - Setting light to {target_intensity}%")
-                try:
-                    if hasattr(light, 'turn_on'):
-                        await light.turn_on(brightness_pct=target_intensity)
-                except Exception as e:
-                    _LOGGER.error(f"{self.room}: Error controlling light: {e}")
+                if "turn_on" in self._device_caps("light"):
+                    commands.append(("light", light.turn_on(brightness_pct=target_intensity)))
 
         # Control Exhaust
         if "exhaust" in self.devices and self.targets.get("exhaust_speed") is not None:
@@ -589,11 +805,8 @@ class UltraInstinctManager:
             current_speed = getattr(exhaust, 'dutyCycle', 0)
             if abs(current_speed - target_speed) > 5:
                 _LOGGER.info(f"{self.room}: Ultra Instinct - Setting exhaust to {target_speed}%")
-                try:
-                    if hasattr(exhaust, 'set_duty_cycle'):
-                        await exhaust.set_duty_cycle(target_speed)
-                except Exception as e:
-                    _LOGGER.error(f"{self.room}: Error controlling exhaust: {e}")
+                if "set_duty_cycle" in self._device_caps("exhaust"):
+                    commands.append(("exhaust", exhaust.set_duty_cycle(target_speed)))
 
         # Control Intake
         if "intake" in self.devices and self.targets.get("intake_speed") is not None:
@@ -602,56 +815,40 @@ class UltraInstinctManager:
             current_speed = getattr(intake, 'dutyCycle', 0)
             if abs(current_speed - target_speed) > 5:
                 _LOGGER.info(f"{self.room}: Ultra Instinct - Setting intake to {target_speed}%")
-                try:
-                    if hasattr(intake, 'set_duty_cycle'):
-                        await intake.set_duty_cycle(target_speed)
-                except Exception as e:
-                    _LOGGER.error(f"{self.room}: Error controlling intake: {e}")
+                if "set_duty_cycle" in self._device_caps("intake"):
+                    commands.append(("intake", intake.set_duty_cycle(target_speed)))
 
-        # Control Humidity (Humidifier/Dehumidifier) with predictive consideration
+        # Control Humidity (Humidifier/Dehumidifier) with predictive consideration and Heater.
+        # Hysteresis to prevent oscillation: (aktiv, einschalten, ausschalten, ist, soll, Einheit)
         hum_diff = current_hum - target_hum
-        
-        # Add hysteresis to prevent oscillation
-        if hum_diff < -5:  # Need more humidity
-            if "humidifier" in self.devices:
-                _LOGGER.info(f"{self.room}: Ultra Instinct - Turning on humidifier (current: {current_hum}%, target: {target_hum}%)")
-                try:
-                    await self.devices["humidifier"].turn_on()
-                except Exception as e:
-                    _LOGGER.error(f"{self.room}: Error controlling humidifier: {e}")
-            if "dehumidifier" in self.devices:
-                try:
-                    await self.devices["dehumidifier"].turn_off()
-                except Exception:
-                    pass
-                    
-        elif hum_diff > 5:  # Too humid
-            if "dehumidifier" in self.devices:
-                _LOGGER.info(f"{self.room}: Ultra Instinct - Turning on dehumidifier (current: {current_hum}%, target: {target_hum}%)")
-                try:
-                    await self.devices["dehumidifier"].turn_on()
-                except Exception as e:
-                    _LOGGER.error(f"{self.room}: Error controlling dehumidifier: {e}")
-            if "humidifier" in self.devices:
-                try:
-                    await self.devices["humidifier"].turn_off()
-                except Exception:
-                    pass
-        
-        # Control Heater if available
-        if "heater" in self.devices:
-            temp_diff = target_temp - current_temp
-            if temp_diff > 3:  # Need heating
-                _LOGGER.info(f"{self.room}: Ultra Instinct - Turning on heater (current: {current_temp}°C, target: {target_temp}°C)")
-                try:
-                    await self.devices["heater"].turn_on()
-                except Exception as e:
-                    _LOGGER.error(f"{self.room}: Error controlling heater: {e}")
-            elif temp_diff < -1:  # Warm enough
-                try:
-                    await self.devices["heater"].turn_off()
-                except Exception:
-                    pass
+        temp_diff = target_temp - current_temp
+        rules = (
+            (hum_diff < -5, "humidifier", "dehumidifier", current_hum, target_hum, "%"),  # Need more humidity
+            (hum_diff > 5, "dehumidifier", "humidifier", current_hum, target_hum, "%"),  # Too humid
+            (temp_diff > 3, "heater", None, current_temp, target_temp, "°C"),  # Need heating
+            (temp_diff < -1, None, "heater", current_temp, target_temp, "°C"),  # Warm enough
+        )
+        for active, on_name, off_name, current, target, unit in rules:
+            if not active:
+                continue
+            if on_name and "turn_on" in self._device_caps(on_name):
+                _LOGGER.info(f"{self.room}: Ultra Instinct - Turning on {on_name} (current: {current}{unit}, target: {target}{unit})")
+                commands.append((on_name, self.devices[on_name].turn_on()))
+            if off_name and "turn_off" in self._device_caps(off_name):
+                commands.append((None, self.devices[off_name].turn_off()))
+
+        if not commands:
+            return True
+
+        results = await asyncio.gather(
+            *(command for _, command in commands), return_exceptions=True
+        )
+        succeeded = True
+        for (name, _), result in zip(commands, results):
+            if name and isinstance(result, Exception):
+                _LOGGER.error(f"{self.room}: Error controlling {name}: {result}")
+                succeeded = False
+        return succeeded
 
     async def _handle_direct_control(self, data: Dict[str, Any]):
         """
@@ -677,61 +874,54 @@ class UltraInstinctManager:
             return
 
         try:
-            dev = self.devices[device]
-            if action == "set_intensity" or action == "set_brightness":
-                if hasattr(dev, 'turn_on'):
-                    await dev.turn_on(brightness_pct=value)
-            elif action == "set_duty_cycle":
-                if hasattr(dev, 'set_duty_cycle'):
-                    await dev.set_duty_cycle(value)
-            elif action == "turn_on":
-                await dev.turn_on()
-            elif action == "turn_off":
-                await dev.turn_off()
+            handler = _DIRECT_ACTIONS.get(action)
+            if handler:
+                required, call = handler
+                if required is None or required in self._device_caps(device):
+                    await call(self.devices[device], value)
             _LOGGER.info(f"{self.room}: Ultra Instinct direct control - {device}: {action} = {value}")
         except Exception as e:
             _LOGGER.error(f"{self.room}: Error in direct control {device}: {e}")
 
-    async def _learn_from_cycle(self, sensor_data: Dict[str, Any]):
+    async def _learn_from_cycle(
+        self, sensor_data: Dict[str, Any], gradients: Optional[Mapping[str, float]] = None
+    ):
         """
         Learn from the current control cycle for future optimization.
         Stores gradient data for adaptive prediction improvement.
         """
-        gradients = self._calculate_gradients()
-        
-        entry = {
-            "timestamp": datetime.now().isoformat(),
-            "sensors": sensor_data,
-            "targets": self.targets.copy(),
-            "predictive_adjustments": self.predictive_adjustments.copy(),
-            "gradients": gradients,
-        }
-
-        if "control_history" not in self.learning_data:
-            self.learning_data["control_history"] = []
-        self.learning_data["control_history"].append(entry)
-
-        # Keep only last 100 entries
-        if len(self.learning_data["control_history"]) > 100:
-            self.learning_data["control_history"].pop(0)
+        # Ohne adaptive_learning keine History-Pflege und keine Gradientenrechnung
+        if not self.adaptive_learning:
+            return
+        if gradients is None:
+            gradients = self._calculate_gradients()
+        
+        self._targets_snapshot = _snapshot(self.targets, self._targets_snapshot)
+        self._adjustments_snapshot = _snapshot(self.predictive_adjustments, self._adjustments_snapshot)
+
+        # Ältesten Slot überschreiben statt einen neuen Eintrag anzulegen
+        slot = self.learning_data["control_history"][self._history_head % CONTROL_HISTORY_SIZE]
+        slot["timestamp"] = self._last_control_ts
+        slot["sensors"] = SensorSnapshot._make(map(sensor_data.get, SensorSnapshot._fields))
+        slot["targets"] = self._targets_snapshot
+        slot["predictive_adjustments"] = self._adjustments_snapshot
+        slot["gradients"] = gradients
+        self._history_head += 1
+
+        ema = self._grad_ema
+        for key, value in gradients.items():
+            ema[key] = 0.9 * ema.get(key, value) + 0.1 * value
             
         # Learn gradient patterns (simplified learning)
         if len(self.sensor_history) >= 10:
-            # Calculate average gradients over recent history
-            recent_gradients = []
-            for i in range(len(self.learning_data["control_history"]) - 10, len(self.learning_data["control_history"])):
-                if i >= 0 and "gradients" in self.learning_data["control_history"][i]:
-                    recent_gradients.append(self.learning_data["control_history"][i]["gradients"])
-            
-            if recent_gradients:
-                # Update inertia factors based on observed patterns
-                avg_temp_gradient = sum(g.get("ambient_to_tent_temp", 0) for g in recent_gradients) / len(recent_gradients)
-                if avg_temp_gradient > 2:
-                    # Fast transfer - reduce prediction window
-                    self.ambient_tent_inertia = min(0.8, self.ambient_tent_inertia + 0.05)
-                elif avg_temp_gradient < 0.5:
-                    # Slow transfer - increase prediction window
-                    self.ambient_tent_inertia = max(0.3, self.ambient_tent_inertia - 0.05)
+            # Update inertia factors based on the smoothed gradient
+            avg_temp_gradient = ema.get("ambient_to_tent_temp", 0.0)
+            if avg_temp_gradient > 2:
+                # Fast transfer - reduce prediction window
+                self.ambient_tent_inertia = min(0.8, self.ambient_tent_inertia + 0.05)
+            elif avg_temp_gradient < 0.5:
+                # Slow transfer - increase prediction window
+                self.ambient_tent_inertia = max(0.3, self.ambient_tent_inertia - 0.05)
 
     def get_control_status(self) -> Dict[str, Any]:
         """
@@ -744,26 +934,26 @@ class UltraInstinctManager:
             "control_active": self.control_active,
             "update_interval": self.update_interval,
             "adaptive_learning": self.adaptive_learning,
-            "last_control_time": self.last_control_time.isoformat() if self.last_control_time else None,
-            "targets": self.targets,
-            "predictive_adjustments": self.predictive_adjustments,
+            "last_control_time": self._last_control_time_iso,
+            "targets": self._targets_view,
+            "predictive_adjustments": {
+                key: round(value, 2) for key, value in self.predictive_adjustments.items()
+            },
             "gradients": gradients,
             "sensor_history_count": len(self.sensor_history),
             "devices_controlled": len(self.devices),
-            "learning_data_entries": len(self.learning_data.get("control_history", [])),
+            "learning_data_entries": min(self._history_head, CONTROL_HISTORY_SIZE),
         }
 
     async def emergency_stop(self):
         """
         Emergency stop of all Ultra Instinct control.
         """
-        # Turn off all devices
-        for name, dev in self.devices.items():
-            try:
-                if hasattr(dev, 'turn_off'):
-                    await dev.turn_off()
-            except Exception:
-                pass
+        # Turn off all devices - parallel, Fehler einzelner Geräte blockieren die anderen nicht
+        await asyncio.gather(
+            *(dev.turn_off() for name, dev in self.devices.items() if "turn_off" in self._device_caps(name)),
+            return_exceptions=True,
+        )
 
         await self.stop_control()
         _LOGGER.warning(f"Emergency stop initiated for Ultra Instinct control in {self.room}")
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import sys
 from datetime import datetime
 
 from ...utils.calcs import calculate_perfect_vpd
@@ -354,6 +355,9 @@ class OGBConfigurationManager:
     async def _update_plant_stage(self, data):
         """Update plant stage."""
         value = data.newState[0]
+        if isinstance(value, str):
+            # Stage name is the key into plantStages/PlantStageMinMax lookups - intern it at ingress
+            value = sys.intern(value)
         current_stage = self.data_store.get("plantStage")
         if current_stage != value:
             self.data_store.set("plantStage", value)
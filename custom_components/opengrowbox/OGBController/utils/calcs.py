@@ -5,6 +5,11 @@ import math
 _LOGGER = logging.getLogger(__name__)
 
 
+# Sättigungsdampfdruck (kPa) nach Magnus - gemeinsamer Kern aller VPD-Berechnungen
+def _saturation_vp(temp):
+    return 0.6108 * math.exp((17.27 * temp) / (temp + 237.3))
+
+
 # Berechne Durchschnittswert aus einer Liste (asynchron)
 def calculate_avg_value(data=[]):
     total = 0
@@ -48,16 +53,14 @@ def calculate_current_vpd(temp, humidity, leaf_offset):
     except (ValueError, TypeError):
         return None
 
-    if temp is None or humidity is None or leaf_temp is None:
-        return None
-
-    sdp_luft = 0.6108 * math.exp((17.27 * temp) / (temp + 237.3))
-    sdp_blatt = 0.6108 * math.exp((17.27 * leaf_temp) / (leaf_temp + 237.3))
+    sdp_luft = _saturation_vp(temp)
+    # Ohne Blatt-Offset ist der Blatt-Sättigungsdruck identisch - ein exp() sparen
+    sdp_blatt = sdp_luft if leaf_temp == temp else _saturation_vp(leaf_temp)
     adp = (humidity / 100) * sdp_luft
-    vpd = sdp_blatt - adp
+    vpd = round(sdp_blatt - adp, 2)
 
-    _LOGGER.debug(f"VPD-Calculation got {round(vpd, 2)}")
-    return round(vpd, 2)
+    _LOGGER.debug("VPD-Calculation got %s", vpd)
+    return vpd
 
 
 # Berechne perfekten VPD (asynchron)
@@ -100,32 +103,6 @@ def calculate_dew_point(temp, humidity):
     return round(dew_point, 2)
 
 
-# Berechne DewPointVPD (asynchron)
-async def calc_dew_vpd(air_temp, dew_point):
-    try:
-        air_temp = float(air_temp)
-        dew_point = float(dew_point)
-    except (ValueError, TypeError):
-        return {
-            "dewpoint_vpd": None,
-            "vapor_pressure_actual": None,
-            "vapor_pressure_saturation": None,
-        }
-
-    sdp_luft = 0.6108 * math.exp((17.27 * air_temp) / (air_temp + 237.3))
-    adp = 0.6108 * math.exp((17.27 * dew_point) / (dew_point + 237.3))
-    dew_vpd = sdp_luft - adp
-
-    vapor_pressure_actual = 6.11 * (10 ** ((7.5 * dew_point) / (237.3 + dew_point)))
-    vapor_pressure_saturation = 6.11 * (10 ** ((7.5 * air_temp) / (237.3 + air_temp)))
-
-    return {
-        "dewpoint_vpd": round(dew_vpd, 3),
-        "vapor_pressure_actual": round(vapor_pressure_actual, 2),
-        "vapor_pressure_saturation": round(vapor_pressure_saturation, 2),
-    }
-
-
 # Berechne DewPointVPD (Based on Dewpoint/TEMP)
 def calc_dew_vpd(air_temp, dew_point):
     try:
@@ -138,8 +115,8 @@ def calc_dew_vpd(air_temp, dew_point):
             "vapor_pressure_saturation": None,
         }
 
-    sdp_luft = 0.6108 * math.exp((17.27 * air_temp) / (air_temp + 237.3))
-    adp = 0.6108 * math.exp((17.27 * dew_point) / (dew_point + 237.3))
+    sdp_luft = _saturation_vp(air_temp)
+    adp = _saturation_vp(dew_point)
     dew_vpd = sdp_luft - adp
 
     vapor_pressure_actual = 6.11 * (10 ** ((7.5 * dew_point) / (237.3 + dew_point)))
@@ -161,8 +138,8 @@ def calc_Dry5Days_vpd(temp, humidity, leaf_offset=0):
     except (ValueError, TypeError):
         return None
 
-    sdp_luft = 0.6108 * math.exp((17.27 * temp) / (temp + 237.3))
-    sdp_blatt = 0.6108 * math.exp((17.27 * leaf_temp) / (leaf_temp + 237.3))
+    sdp_luft = _saturation_vp(temp)
+    sdp_blatt = sdp_luft if leaf_temp == temp else _saturation_vp(leaf_temp)
     adp = (humidity / 100) * sdp_luft
     vpd = sdp_blatt - adp
 